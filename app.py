@@ -6,6 +6,8 @@
 # omitted here — keep this app focused on running races and sharing stats.
 
 import io
+import os
+import time
 from datetime import datetime
 
 import pandas as pd
@@ -19,7 +21,10 @@ from config import (
     character_abilities,
     get_characters_by_edition,
 )
-from game_simulation import run_simulations
+from game_simulation import races_for_win_rate_ci
+from matchups import MatchupMatrix, stored_matrices
+from results_cache import cache_lookup, cache_store
+from sim_jobs import SimulationJob
 
 
 # ---------------------------------------------------------------------------
@@ -32,7 +37,233 @@ st.set_page_config(
 )
 st.title("Magical Athlete Simulator")
 
-tab_race, tab_about = st.tabs(["Race Simulation", "About"])
+tab_race, tab_matchups, tab_about = st.tabs(["Race Simulation", "Matchups", "About"])
+
+
+# How often the page re-polls a running SimulationJob.
+POLL_SECONDS = 0.5
+
+# Race cap when stopping early: tight targets over the full pool need
+# hundreds of thousands of races.
+MAX_STOP_EARLY_SIMULATIONS = 500000
+
+
+def _render_results(results, view, status):
+    """Metrics, watchdog summary and character table for a results tuple
+    from run_simulations / iter_simulations. `status` is the job status:
+    'running' and 'cancelled' results are partial."""
+    (
+        average_turns,
+        average_finish_positions,
+        _all_play_by_play,
+        average_ability_activations,
+        appearance_count,
+        average_chip_stats,
+        board_type_counts,
+        win_counts,
+        average_turns_by_board,
+        average_bronze_earned,
+        max_bronze_earned,
+        watchdog_tally,
+        standard_errors,
+        _placement_counts,
+        races_run,
+    ) = results
+    num_simulations = view["num_simulations"]
+    stop_early = view["stop_early"]
+    target_ci_pp = view["target_ci_pp"]
+    edition = view["edition"]
+    effective_racer_count = view["effective_racer_count"]
+    board_type = view["board_type"]
+    from_cache = view.get("from_cache", False)
+
+    if status == "running":
+        st.info(f"Partial results from the first {races_run} races — the table updates as more finish.")
+    elif status == "cancelled":
+        st.warning(f"Cancelled after {races_run} of {num_simulations} races — showing the races that finished.")
+    elif stop_early and races_run < num_simulations:
+        st.success(
+            f"Completed {races_run} simulations — every win rate reached "
+            f"±{target_ci_pp:g}pp (95% CI) before the {num_simulations}-race cap."
+        )
+    elif stop_early:
+        st.success(
+            f"Completed {races_run} simulations (the cap) — some win rates "
+            f"are still wider than ±{target_ci_pp:g}pp."
+        )
+    else:
+        st.success(f"Completed {races_run} simulations.")
+    if from_cache:
+        st.caption("⚡ Served from the results cache — this seed and configuration were run before.")
+
+    # ---- Top-line metrics --------------------------------------------
+    mild_avg = average_turns_by_board.get("Mild")
+    wild_avg = average_turns_by_board.get("Wild")
+    sportals_avg = average_turns_by_board.get("Sportals")
+    twists_avg = average_turns_by_board.get("Twists")
+    m1, m2, m3, m4, m5, m6, m7, m8, m9 = st.columns(9)
+    turns_se = standard_errors["turns"]
+    m1.metric(
+        "Avg turns / race",
+        f"{average_turns:.2f}",
+        help=f"± {turns_se:.3f} standard error" if turns_se is not None else None,
+    )
+    m2.metric("Mild avg turns", f"{mild_avg:.2f}" if mild_avg is not None else "—")
+    m3.metric("Wild avg turns", f"{wild_avg:.2f}" if wild_avg is not None else "—")
+    m4.metric("Sportals avg turns", f"{sportals_avg:.2f}" if sportals_avg is not None else "—")
+    m5.metric("Twists avg turns", f"{twists_avg:.2f}" if twists_avg is not None else "—")
+    m6.metric("Mild races", board_type_counts.get("Mild", 0))
+    m7.metric("Wild races", board_type_counts.get("Wild", 0))
+    m8.metric("Sportals races", board_type_counts.get("Sportals", 0))
+    m9.metric("Twists races", board_type_counts.get("Twists", 0))
+
+    # Race-economy stat: avg & max bronze chips entering the chip economy
+    # per race (ability awards + board-space chips; excludes starting chips,
+    # transfers between racers net to zero — see
+    # Game.bronze_chips_earned_this_race).
+    bz1, bz2 = st.columns(2)
+    bz1.metric(
+        "# of bronze chips used (avg/race)",
+        f"{average_bronze_earned:.2f}",
+        help="Average bronze chips earned by all racers combined per race. "
+             "Excludes chips seeded at race start (random starting bronze, "
+             "SpeedDemon's starting points). Hotel-style chip transfers between "
+             "racers net to zero. Counts things like Streaker's pass-bonus, "
+             "Hare's alone-in-lead chip, board-space bronze chips, and Pinata "
+             "twist chips.",
+    )
+    bz2.metric(
+        "# of bronze chips used (max in a race)",
+        f"{max_bronze_earned}",
+        help="The most bronze chips earned by all racers combined in any "
+             "single race of this batch. Same inclusion/exclusion rules as "
+             "the average to the left.",
+    )
+
+    # ---- Watchdog / safety-net events --------------------------------
+    wd = watchdog_tally
+    if wd['races_with_turn_abort'] or wd['races_abilities_off'] or wd['races_max_turns_hit']:
+        with st.expander(
+            f"⚠️ Watchdog events fired in this batch "
+            f"({wd['races_abilities_off']} abilities-off, "
+            f"{wd['races_with_turn_abort']} turn-abort, "
+            f"{wd['races_max_turns_hit']} max-turns)",
+            expanded=False,
+        ):
+            w1, w2, w3 = st.columns(3)
+            w1.metric(
+                "Races: abilities-off endgame",
+                wd['races_abilities_off'],
+                help="Races that ran long enough to hit ABILITIES_OFF_TURN — "
+                     "all powers were switched off so plain d6 rolls could "
+                     "finish the race. Search the play-by-play for "
+                     "'[WATCHDOG] abilities-off'.",
+            )
+            w2.metric(
+                "Races: turn aborted",
+                wd['races_with_turn_abort'],
+                help=f"Races where at least one turn hit the per-turn event "
+                     f"cap and was aborted ({wd['turn_abort_events']} aborted "
+                     f"turns total). Search for '[WATCHDOG] turn-abort'.",
+            )
+            w3.metric(
+                "Races: hit hard turn cap",
+                wd['races_max_turns_hit'],
+                help="Races that reached the MAX_TURNS hard cap without "
+                     "finishing (resolved by board position). Should be ~0. "
+                     "Search for '[WATCHDOG] max-turns'.",
+            )
+            flagged = wd.get('flagged_race_seeds', [])
+            if flagged:
+                shown = ", ".join(str(seed) for seed in flagged[:10])
+                more = f" (+{len(flagged) - 10} more)" if len(flagged) > 10 else ""
+                st.caption(
+                    f"Race seeds for game_simulation.replay_race: {shown}{more}"
+                )
+    else:
+        st.caption("✅ No watchdog events fired — every race finished normally.")
+
+    # ---- Character performance table ---------------------------------
+    st.subheader("Character Performance")
+    rows = []
+    for char, appearances in appearance_count.items():
+        if appearances <= 0:
+            continue
+        avg_pos = average_finish_positions.get(char)
+        if avg_pos is None:
+            continue
+        wins = win_counts.get(char, 0)
+        chips = average_chip_stats.get(char) or {}
+        win_rate_se = standard_errors["win_rates"].get(char)
+        pos_se = standard_errors["finish_positions"].get(char)
+        points_se = (standard_errors["chip_stats"].get(char) or {}).get("points_se")
+        rows.append({
+            "Character": char,
+            "Races": appearances,
+            "Wins": wins,
+            "Win Rate (%)": round((wins / appearances) * 100, 2) if appearances else 0.0,
+            "Win Rate SE (%)": round(win_rate_se * 100, 2) if win_rate_se is not None else None,
+            "Avg Position": round(avg_pos, 3),
+            "Avg Position SE": round(pos_se, 3) if pos_se is not None else None,
+            "Avg Points": round(chips.get("points_avg", 0.0), 3),
+            "Avg Points SE": round(points_se, 3) if points_se is not None else None,
+            "Avg Gold": round(chips.get("gold_avg", 0.0), 3),
+            "Avg Silver": round(chips.get("silver_avg", 0.0), 3),
+            "Avg Bronze": round(chips.get("bronze_avg", 0.0), 3),
+            "Avg Ability Triggers": round(average_ability_activations.get(char, 0.0), 3),
+        })
+
+    if not rows:
+        st.info("No characters appeared in any race. Check your filters.")
+    else:
+        df = pd.DataFrame(rows).sort_values(
+            ["Win Rate (%)", "Avg Position"],
+            ascending=[False, True],
+        )
+
+        # Streamlit's dataframe is already sortable by clicking column
+        # headers — that's the in-browser sortable view. The download
+        # button below gives a CSV teammates can sort in Slack/Sheets/Excel.
+        st.dataframe(
+            df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Win Rate (%)": st.column_config.NumberColumn(format="%.2f"),
+                "Win Rate SE (%)": st.column_config.NumberColumn(
+                    format="%.2f", help="Standard error of the win rate"),
+                "Avg Position": st.column_config.NumberColumn(format="%.2f"),
+                "Avg Position SE": st.column_config.NumberColumn(
+                    format="%.3f", help="Standard error of the average position"),
+                "Avg Points": st.column_config.NumberColumn(format="%.2f"),
+                "Avg Points SE": st.column_config.NumberColumn(
+                    format="%.3f", help="Standard error of the average points"),
+                "Avg Gold": st.column_config.NumberColumn(format="%.2f"),
+                "Avg Silver": st.column_config.NumberColumn(format="%.2f"),
+                "Avg Bronze": st.column_config.NumberColumn(format="%.2f"),
+                "Avg Ability Triggers": st.column_config.NumberColumn(format="%.2f"),
+            },
+        )
+
+        # CSV download — raw numeric values, ready for Slack / Sheets.
+        # Offered once the batch has stopped (finished or cancelled).
+        if status != "running":
+            csv_buf = io.StringIO()
+            # Lead with a context comment row (most spreadsheets treat it as
+            # a regular row — easy to delete if it gets in the way of sort).
+            context = (
+                f"# {edition} edition · {races_run} sims · "
+                f"{effective_racer_count} racers · board={board_type} · "
+                f"exported {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            )
+            csv_buf.write(context + "\n")
+            df.to_csv(csv_buf, index=False)
+            st.download_button(
+                "Download CSV",
+                data=csv_buf.getvalue(),
+                file_name=f"character_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv",
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -49,12 +280,42 @@ with tab_race:
             help="V1 = original characters; V2 = expansion; All = both pools.",
         )
     with col_sims:
-        num_simulations = st.slider("Number of Simulations", 1, 10000, 10000)
+        stop_early = st.checkbox(
+            "Stop once win rates are precise",
+            value=False,
+            help="Run in chunks of races and stop as soon as every "
+                 "character's win rate is known to within the target below "
+                 "(95% confidence). The slider becomes the maximum, and "
+                 "goes up to 500,000 races.",
+        )
+        num_simulations = st.slider(
+            "Number of Simulations", 1, MAX_STOP_EARLY_SIMULATIONS if stop_early else 10000, 10000
+        )
+        target_ci_pp = st.number_input(
+            "Target win-rate CI (± percentage points)",
+            min_value=0.1,
+            max_value=10.0,
+            value=2.0,
+            step=0.1,
+            disabled=not stop_early,
+            help="Races needed grow with the square of the precision: with "
+                 "5 racers, ±2pp takes about 20,000 races drawn from the full "
+                 "pool (1,500 for a fixed lineup), ±0.5pp about 330,000 "
+                 "(25,000 fixed).",
+        )
     with col_racers:
         num_racers = st.slider("Number of Racers", 2, 10, 5)
 
     # The set of characters allowed for this edition
     edition_chars = list(get_characters_by_edition(edition).keys())
+    if stop_early:
+        with col_sims:
+            st.caption(
+                f"About {races_for_win_rate_ci(target_ci_pp / 100, num_racers, len(edition_chars)):,} "
+                f"races with random {edition} lineups "
+                f"({races_for_win_rate_ci(target_ci_pp / 100, num_racers, num_racers):,} "
+                f"for a fixed lineup)."
+            )
 
     # ---- Board type checkboxes -------------------------------------------
     st.write("**Board Types**")
@@ -246,6 +507,29 @@ with tab_race:
                      "isolated first-race comparison.",
             )
 
+            st.divider()
+            st.markdown("**Performance**")
+            workers = st.number_input(
+                "Worker processes",
+                min_value=1,
+                max_value=os.cpu_count() or 1,
+                value=1,
+                step=1,
+                help="Spread the races over this many processes. Results "
+                     "are identical for any worker count — races are seeded "
+                     "individually and merged in a fixed order. Streamlit "
+                     "Community Cloud only has a couple of cores, so keep "
+                     "this low there.",
+            )
+            seed_text = st.text_input(
+                "Seed",
+                value="",
+                help="Every race is drawn from this seed, so the same seed and "
+                     "settings give the same results — and a repeat run is "
+                     "served instantly from the on-disk results cache. Leave "
+                     "blank for a fresh random batch (never cached).",
+            )
+
     # ---- Run button -------------------------------------------------------
     run_clicked = st.button("Run Simulations", type="primary")
 
@@ -292,186 +576,168 @@ with tab_race:
             board_type = "Random"
             random_board_pool = selected_boards
 
-        with st.spinner(f"Running {num_simulations} simulations…"):
-            (
-                average_turns,
-                average_finish_positions,
-                _all_play_by_play,
-                average_ability_activations,
-                appearance_count,
-                average_chip_stats,
-                board_type_counts,
-                win_counts,
-                average_turns_by_board,
-                average_bronze_earned,
-                max_bronze_earned,
-                watchdog_tally,
-            ) = run_simulations(
-                num_simulations,
-                effective_racer_count,
-                board_type=board_type,
-                fixed_characters=selected_chars,
-                random_turn_order=True,
-                # Detailed logs are memory-heavy on Streamlit Cloud; skip them.
-                collect_detailed_logs=False,
-                allowed_characters=edition_chars,
-                speeddemon_threshold=int(speeddemon_threshold),
-                speeddemon_starting_points=int(speeddemon_starting_points),
-                speeddemon_check_timing=speeddemon_check_timing,
-                showoff_threshold=int(showoff_threshold),
-                random_starting_bronze=random_starting_bronze,
-                null_main_move_penalty=int(null_main_move_penalty),
-                spoilsport_threshold=int(spoilsport_threshold),
-                nemesis_warp_range=int(nemesis_warp_range),
-                random_board_pool=random_board_pool,
-                cheatah_alt_mode=cheatah_alt_mode,
-                forced_twist=forced_twist_choice,
-            )
+        try:
+            seed = int(seed_text) if seed_text.strip() else None
+        except ValueError:
+            st.error("Seed must be a whole number (or blank for a random batch).")
+            st.stop()
 
-        st.success(f"Completed {num_simulations} simulations.")
-
-        # ---- Top-line metrics --------------------------------------------
-        mild_avg = average_turns_by_board.get("Mild")
-        wild_avg = average_turns_by_board.get("Wild")
-        sportals_avg = average_turns_by_board.get("Sportals")
-        twists_avg = average_turns_by_board.get("Twists")
-        m1, m2, m3, m4, m5, m6, m7, m8, m9 = st.columns(9)
-        m1.metric("Avg turns / race", f"{average_turns:.2f}")
-        m2.metric("Mild avg turns", f"{mild_avg:.2f}" if mild_avg is not None else "—")
-        m3.metric("Wild avg turns", f"{wild_avg:.2f}" if wild_avg is not None else "—")
-        m4.metric("Sportals avg turns", f"{sportals_avg:.2f}" if sportals_avg is not None else "—")
-        m5.metric("Twists avg turns", f"{twists_avg:.2f}" if twists_avg is not None else "—")
-        m6.metric("Mild races", board_type_counts.get("Mild", 0))
-        m7.metric("Wild races", board_type_counts.get("Wild", 0))
-        m8.metric("Sportals races", board_type_counts.get("Sportals", 0))
-        m9.metric("Twists races", board_type_counts.get("Twists", 0))
-
-        # Race-economy stat: avg & max bronze chips entering the chip economy
-        # per race (ability awards + board-space chips; excludes starting chips,
-        # transfers between racers net to zero — see
-        # Game.bronze_chips_earned_this_race).
-        bz1, bz2 = st.columns(2)
-        bz1.metric(
-            "# of bronze chips used (avg/race)",
-            f"{average_bronze_earned:.2f}",
-            help="Average bronze chips earned by all racers combined per race. "
-                 "Excludes chips seeded at race start (random starting bronze, "
-                 "SpeedDemon's starting points). Hotel-style chip transfers between "
-                 "racers net to zero. Counts things like Streaker's pass-bonus, "
-                 "Hare's alone-in-lead chip, board-space bronze chips, and Pinata "
-                 "twist chips.",
+        run_kwargs = dict(
+            num_simulations=num_simulations,
+            num_players=effective_racer_count,
+            board_type=board_type,
+            fixed_characters=selected_chars,
+            random_turn_order=True,
+            # Detailed logs are memory-heavy on Streamlit Cloud; skip them.
+            collect_detailed_logs=False,
+            allowed_characters=edition_chars,
+            speeddemon_threshold=int(speeddemon_threshold),
+            speeddemon_starting_points=int(speeddemon_starting_points),
+            speeddemon_check_timing=speeddemon_check_timing,
+            showoff_threshold=int(showoff_threshold),
+            random_starting_bronze=random_starting_bronze,
+            null_main_move_penalty=int(null_main_move_penalty),
+            spoilsport_threshold=int(spoilsport_threshold),
+            nemesis_warp_range=int(nemesis_warp_range),
+            random_board_pool=random_board_pool,
+            cheatah_alt_mode=cheatah_alt_mode,
+            forced_twist=forced_twist_choice,
+            workers=int(workers),
+            target_win_rate_ci=(target_ci_pp / 100) if stop_early else None,
+            seed=seed,
         )
-        bz2.metric(
-            "# of bronze chips used (max in a race)",
-            f"{max_bronze_earned}",
-            help="The most bronze chips earned by all racers combined in any "
-                 "single race of this batch. Same inclusion/exclusion rules as "
-                 "the average to the left.",
-        )
-
-        # ---- Watchdog / safety-net events --------------------------------
-        wd = watchdog_tally
-        if wd['races_with_turn_abort'] or wd['races_abilities_off'] or wd['races_max_turns_hit']:
-            with st.expander(
-                f"⚠️ Watchdog events fired in this batch "
-                f"({wd['races_abilities_off']} abilities-off, "
-                f"{wd['races_with_turn_abort']} turn-abort, "
-                f"{wd['races_max_turns_hit']} max-turns)",
-                expanded=False,
-            ):
-                w1, w2, w3 = st.columns(3)
-                w1.metric(
-                    "Races: abilities-off endgame",
-                    wd['races_abilities_off'],
-                    help="Races that ran long enough to hit ABILITIES_OFF_TURN — "
-                         "all powers were switched off so plain d6 rolls could "
-                         "finish the race. Search the play-by-play for "
-                         "'[WATCHDOG] abilities-off'.",
-                )
-                w2.metric(
-                    "Races: turn aborted",
-                    wd['races_with_turn_abort'],
-                    help=f"Races where at least one turn hit the per-turn event "
-                         f"cap and was aborted ({wd['turn_abort_events']} aborted "
-                         f"turns total). Search for '[WATCHDOG] turn-abort'.",
-                )
-                w3.metric(
-                    "Races: hit hard turn cap",
-                    wd['races_max_turns_hit'],
-                    help="Races that reached the MAX_TURNS hard cap without "
-                         "finishing (resolved by board position). Should be ~0. "
-                         "Search for '[WATCHDOG] max-turns'.",
-                )
+        view = {
+            "num_simulations": num_simulations,
+            "stop_early": stop_early,
+            "target_ci_pp": target_ci_pp,
+            "edition": edition,
+            "effective_racer_count": effective_racer_count,
+            "board_type": board_type,
+        }
+
+        # A new run replaces (and stops) whatever job this session had.
+        previous_job = st.session_state.get("sim_job")
+        if previous_job is not None:
+            previous_job.cancel()
+        cache_key, cached = cache_lookup(run_kwargs)
+        if cached is not None:
+            st.session_state["sim_job"] = None
+            st.session_state["sim_view"] = dict(view, results=cached, from_cache=True)
         else:
-            st.caption("✅ No watchdog events fired — every race finished normally.")
-
-        # ---- Character performance table ---------------------------------
-        st.subheader("Character Performance")
-        rows = []
-        for char, appearances in appearance_count.items():
-            if appearances <= 0:
-                continue
-            avg_pos = average_finish_positions.get(char)
-            if avg_pos is None:
-                continue
-            wins = win_counts.get(char, 0)
-            chips = average_chip_stats.get(char) or {}
-            rows.append({
-                "Character": char,
-                "Races": appearances,
-                "Wins": wins,
-                "Win Rate (%)": round((wins / appearances) * 100, 2) if appearances else 0.0,
-                "Avg Position": round(avg_pos, 3),
-                "Avg Points": round(chips.get("points_avg", 0.0), 3),
-                "Avg Gold": round(chips.get("gold_avg", 0.0), 3),
-                "Avg Silver": round(chips.get("silver_avg", 0.0), 3),
-                "Avg Bronze": round(chips.get("bronze_avg", 0.0), 3),
-                "Avg Ability Triggers": round(average_ability_activations.get(char, 0.0), 3),
-            })
-
-        if not rows:
-            st.info("No characters appeared in any race. Check your filters.")
+            st.session_state["sim_job"] = SimulationJob(
+                run_kwargs,
+                on_finish=lambda results, key=cache_key: cache_store(key, results),
+            ).start()
+            st.session_state["sim_view"] = dict(view, results=None, from_cache=False)
+
+    # ---- Results (live while the background job runs) ---------------------
+    # The job lives in session_state, so reruns — including the ones this
+    # block triggers to poll it — keep its progress.
+    sim_view = st.session_state.get("sim_view")
+    if sim_view is not None:
+        job = st.session_state.get("sim_job")
+        if job is None:
+            status, results = "done", sim_view["results"]
         else:
-            df = pd.DataFrame(rows).sort_values(
-                ["Win Rate (%)", "Avg Position"],
-                ascending=[False, True],
+            status, races_done, results = job.snapshot()
+        if status == "running":
+            st.progress(
+                min(job.progress, 1.0),
+                text=f"{races_done} / {sim_view['num_simulations']} races merged…",
             )
+            if st.button("Cancel", help="Stop after the current chunk of races and keep the results so far."):
+                job.cancel()
+        elif status == "error":
+            st.error(f"The simulation failed: {job.error}")
+        if results is not None:
+            _render_results(results, sim_view, status)
+        if status == "running":
+            time.sleep(POLL_SECONDS)
+            st.rerun()
 
-            # Streamlit's dataframe is already sortable by clicking column
-            # headers — that's the in-browser sortable view. The download
-            # button below gives a CSV teammates can sort in Slack/Sheets/Excel.
-            st.dataframe(
-                df,
-                use_container_width=True,
-                hide_index=True,
-                column_config={
-                    "Win Rate (%)": st.column_config.NumberColumn(format="%.2f"),
-                    "Avg Position": st.column_config.NumberColumn(format="%.2f"),
-                    "Avg Points": st.column_config.NumberColumn(format="%.2f"),
-                    "Avg Gold": st.column_config.NumberColumn(format="%.2f"),
-                    "Avg Silver": st.column_config.NumberColumn(format="%.2f"),
-                    "Avg Bronze": st.column_config.NumberColumn(format="%.2f"),
-                    "Avg Ability Triggers": st.column_config.NumberColumn(format="%.2f"),
-                },
-            )
 
-            # CSV download — raw numeric values, ready for Slack / Sheets.
-            csv_buf = io.StringIO()
-            # Lead with a context comment row (most spreadsheets treat it as
-            # a regular row — easy to delete if it gets in the way of sort).
-            context = (
-                f"# {edition} edition · {num_simulations} sims · "
-                f"{effective_racer_count} racers · board={board_type} · "
-                f"exported {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+# ---------------------------------------------------------------------------
+# Matchups tab
+# ---------------------------------------------------------------------------
+@st.cache_data(show_spinner=False)
+def _load_matchup_rows(path, mtime):
+    """Rows of a stored matchup matrix (`mtime` keys the cache, so an
+    updated file is reloaded)."""
+    matrix = MatchupMatrix.load(path)
+    if matrix is None:
+        return None, []
+    summary = {
+        "board_type": matrix.board_type,
+        "lineup_size": matrix.lineup_size,
+        "races_per_pair": matrix.races_per_pair,
+        "seed": matrix.seed,
+        "pairs": len(matrix.cells),
+    }
+    return summary, list(matrix.rows())
+
+
+with tab_matchups:
+    st.header("Head-to-head matchups")
+    st.caption(
+        "Each cell is how often the row character finished ahead of the "
+        "column character in races they shared (ties count half). Matrices "
+        "are computed offline and only recompute the characters whose code "
+        "changed: `python matchups.py --board Mild --workers 4`."
+    )
+    matrix_paths = stored_matrices()
+    if not matrix_paths:
+        st.info("No matchup matrices yet. Run `python matchups.py --board Mild` to compute one.")
+    else:
+        matrix_path = st.selectbox(
+            "Matrix",
+            matrix_paths,
+            format_func=lambda path: os.path.basename(path)[:-len(".json")],
+        )
+        summary, matchup_rows = _load_matchup_rows(matrix_path, os.path.getmtime(matrix_path))
+        if not matchup_rows:
+            st.warning("This matrix file is empty or unreadable.")
+        else:
+            import altair as alt
+
+            st.caption(
+                f"{summary['board_type']} board · {summary['lineup_size']} racers per race · "
+                f"{summary['races_per_pair']} races per pair · seed {summary['seed']} · "
+                f"{summary['pairs']} pairs"
             )
-            csv_buf.write(context + "\n")
-            df.to_csv(csv_buf, index=False)
-            st.download_button(
-                "Download CSV",
-                data=csv_buf.getvalue(),
-                file_name=f"character_stats_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
+            matchup_df = pd.DataFrame(matchup_rows)
+            # Strongest overall first, on both axes.
+            order = (
+                matchup_df.groupby("character")["win_rate"].mean()
+                .sort_values(ascending=False).index.tolist()
+            )
+            shown = st.multiselect(
+                "Characters (blank = all)", order, default=[],
+                help="Limit the heatmap to these characters.",
+            )
+            if shown:
+                order = [name for name in order if name in shown]
+                matchup_df = matchup_df[matchup_df["character"].isin(shown) & matchup_df["opponent"].isin(shown)]
+            heatmap = (
+                alt.Chart(matchup_df)
+                .mark_rect()
+                .encode(
+                    x=alt.X("opponent:N", sort=order, title="Opponent"),
+                    y=alt.Y("character:N", sort=order, title="Character"),
+                    color=alt.Color(
+                        "win_rate:Q",
+                        title="Win rate",
+                        scale=alt.Scale(scheme="redblue", domain=[0, 1], domainMid=0.5),
+                    ),
+                    tooltip=[
+                        alt.Tooltip("character:N", title="Character"),
+                        alt.Tooltip("opponent:N", title="Opponent"),
+                        alt.Tooltip("win_rate:Q", title="Win rate", format=".1%"),
+                        alt.Tooltip("races:Q", title="Races"),
+                    ],
+                )
+                .properties(height=max(300, 14 * len(order)))
             )
+            st.altair_chart(heatmap, use_container_width=True)
 
 
 # ---------------------------------------------------------------------------
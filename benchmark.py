@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the race engine.
+Runs the same seeded races on each board type twice — once narrating into a
+capped play-by-play list (what batch runs used to do) and once into a NullLog
+— and reports races/sec for both, plus the speed-up and the reaction-hook
+dispatch counters (hook calls made vs. base no-op calls skipped).
+
+Usage: python benchmark.py [num_races] [num_racers]
+"""
+
+import io
+import sys
+import time
+from datetime import datetime
+from config import BOARD_TYPES, character_abilities
+from characters.base_character import REACTION_HOOKS
+from game_simulation import NullLog, _CappedLogList, _play_race, derive_race_seed
+
+BENCH_BOARDS = [bt for bt in BOARD_TYPES if bt != "Random"]
+BENCH_SEED = 20240601
+
+
+def time_races(board_type, num_races, num_racers, make_sink, seed=BENCH_SEED, hook_stats=None):
+    """Run `num_races` seeded races on `board_type`, writing to sinks from
+    `make_sink()`. Returns (elapsed_seconds, turns_per_race). If `hook_stats`
+    is a dict, each race's Game.hook_stats counters are summed into it."""
+    sampling_pool = list(character_abilities.keys())
+    game_kwargs = {'board_type': board_type, 'random_turn_order': True}
+    turns = []
+    original_stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        start = time.perf_counter()
+        for i in range(num_races):
+            _, game, race_turns, _ = _play_race(
+                derive_race_seed(seed, i), num_racers, sampling_pool, None, game_kwargs, make_sink()
+            )
+            turns.append(race_turns)
+            if hook_stats is not None:
+                for key, count in game.hook_stats.items():
+                    hook_stats[key] = hook_stats.get(key, 0) + count
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdout = original_stdout
+    return elapsed, turns
+
+
+def run_benchmark(num_races=1000, num_racers=5):
+    print("="*70)
+    print("MAGICAL ATHLETE - ENGINE THROUGHPUT BENCHMARK")
+    print("="*70)
+    print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{num_races} races x {num_racers} racers per board, seed {BENCH_SEED}")
+    print()
+    print(f"{'Board':<10} {'logged r/s':>12} {'null r/s':>12} {'speed-up':>10}")
+    print("-"*48)
+
+    all_identical = True
+    hook_stats = {}
+    for board_type in BENCH_BOARDS:
+        logged_time, logged_turns = time_races(board_type, num_races, num_racers, lambda: _CappedLogList(cap=500))
+        null_time, null_turns = time_races(board_type, num_races, num_racers, NullLog, hook_stats=hook_stats)
+        # Narration must never influence the simulation itself.
+        if logged_turns != null_turns:
+            all_identical = False
+        logged_rate = num_races / logged_time
+        null_rate = num_races / null_time
+        print(f"{board_type:<10} {logged_rate:>12.1f} {null_rate:>12.1f} {null_rate / logged_rate:>9.2f}x")
+
+    print()
+    print("Reaction-hook dispatch (null runs, all boards):")
+    for hook in REACTION_HOOKS:
+        called = hook_stats.get(f"{hook}_called", 0)
+        skipped = hook_stats.get(f"{hook}_skipped", 0)
+        print(f"  {hook:<24} {called:>9} called  {skipped:>9} no-op calls skipped")
+
+    print()
+    if all_identical:
+        print("✓ Logged and null runs produced identical races")
+    else:
+        print("✗ Logged and null runs diverged — logging is affecting game state!")
+    return all_identical
+
+
+if __name__ == '__main__':
+    races = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    racers = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    sys.exit(0 if run_benchmark(races, racers) else 1)
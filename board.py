@@ -1,5 +1,10 @@
 # board.py
 
+# Nested moves a board chain may trigger. Game._max_recursion_depth starts
+# here and markov_solver models the same cap.
+MAX_MOVE_DEPTH = 3
+
+
 class Board:
     # Sportals portal pairs. Each space appears in exactly one pair so portal
     # ping-pong only needs a one-step recursion guard (the _via_portal flag).
@@ -18,6 +23,7 @@ class Board:
         self.spaces = [Space("normal") for _ in range(length)]
         self.spaces[corner_position] = Space("corner")
         self.corner_position = corner_position # Stored for Blimp
+        self._landings = {}  # (start, spaces, depth) -> compiled landing; see landing()
 
         # Configure board-type-specific special spaces.
         if self.board_type == "Wild":
@@ -53,6 +59,54 @@ class Board:
             self.spaces[a] = PortalSpace(b)
             self.spaces[b] = PortalSpace(a)
 
+    def set_space(self, position, space):
+        """Replace the space at `position` (twists, consumed chips). Use this
+        rather than assigning into `spaces` so compiled landings are
+        recompiled."""
+        self.spaces[position] = space
+        self._landings = {}
+
+    def landing(self, start, spaces, depth=0):
+        """Compiled result of a move of `spaces` from `start`, following the
+        board's move spaces and portals the way nested Character.move/jump
+        calls would (move recursion capped at MAX_MOVE_DEPTH, counting from
+        `depth`; a portal doesn't warp back). Memoized per board layout.
+
+        Returns a tuple of (kind, destination) steps — the move itself
+        first, then each "move"/"jump" a space triggers. A final step with
+        destination None is a nested call cut off by the recursion cap (it
+        still counts for loop detection, but nobody moves). Otherwise, if
+        the last destination is on the board, that space's own effect
+        (chip, trip) still has to be applied by its on_enter."""
+        key = (start, spaces, depth)
+        steps = self._landings.get(key)
+        if steps is None:
+            steps = self._landings[key] = self._compile_landing(start, spaces, depth)
+        return steps
+
+    def _compile_landing(self, start, spaces, depth):
+        steps = []
+        kind = "move"
+        destination = max(0, min(start + spaces, self.length))
+        warped = False  # PortalSpace's _via_portal guard holds for the rest of the chain
+        while True:
+            if depth >= MAX_MOVE_DEPTH:
+                steps.append((kind, None))
+                break
+            steps.append((kind, destination))
+            depth += 1
+            if destination >= self.length:
+                break
+            space = self.spaces[destination]
+            if space.space_type == "move" and space.value != 0:
+                kind, destination = "move", max(0, min(destination + space.value, self.length))
+            elif space.space_type == "portal" and not warped:
+                kind, destination = "jump", min(space.partner, self.length)
+                warped = True
+            else:
+                break
+        return tuple(steps)
+
     def get_space_type(self, position):
         if position >= self.length:
             return "finish"
@@ -91,19 +145,22 @@ class Space:
                 pass  # Placeholder for future corner actions
             elif self.space_type == "bronze_chip":
                 player.bronze_chips += 1
-                play_by_play_lines.append(f"{player.name} ({player.piece}) landed on a bronze chip space and received 1 bronze chip!")
+                if game.log_enabled:
+                    play_by_play_lines.append(f"{player.name} ({player.piece}) landed on a bronze chip space and received 1 bronze chip!")
                 # Consumable chips (Pinata twist) are taken — the space empties
                 # so later racers stopping here get nothing. Replace this space
                 # object with a plain "normal" one in the board's space list.
                 if self.consumable:
-                    game.board.spaces[player.position] = Space("normal")
+                    game.board.set_space(player.position, Space("normal"))
             elif self.space_type == "trip":
                 player.tripped = True
-                play_by_play_lines.append(f"{player.name} ({player.piece}) landed on a trip space and will skip their next main move!")
+                if game.log_enabled:
+                    play_by_play_lines.append(f"{player.name} ({player.piece}) landed on a trip space and will skip their next main move!")
             elif self.space_type == "move":
                 if self.value != 0:
-                    move_text = f"{abs(self.value)} space{'s' if abs(self.value) > 1 else ''} {'forward' if self.value > 0 else 'backward'}"
-                    play_by_play_lines.append(f"{player.name} ({player.piece}) landed on a movement space and will move {move_text}!")
+                    if game.log_enabled:
+                        move_text = f"{abs(self.value)} space{'s' if abs(self.value) > 1 else ''} {'forward' if self.value > 0 else 'backward'}"
+                        play_by_play_lines.append(f"{player.name} ({player.piece}) landed on a movement space and will move {move_text}!")
                     # HugeBaby's look-ahead in _check_shared_space prevents the
                     # classic Wild-board-position-11 + HugeBaby-at-12 loop.
                     player.move(game, play_by_play_lines, self.value)
@@ -144,10 +201,11 @@ class PortalSpace(Space):
 
         game._recursion_depths["space_check"] += 1
         try:
-            play_by_play_lines.append(
-                f"{player.name} ({player.piece}) hits a Sportal at "
-                f"{player.position} — warps to {self.partner}!"
-            )
+            if game.log_enabled:
+                play_by_play_lines.append(
+                    f"{player.name} ({player.piece}) hits a Sportal at "
+                    f"{player.position} — warps to {self.partner}!"
+                )
             player._via_portal = True
             try:
                 player.jump(game, self.partner, play_by_play_lines)
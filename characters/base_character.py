@@ -1,6 +1,19 @@
 # characters/base_character.py
 import random
 from power_system import PowerPhase
+from events import EventKind
+from position_index import TrackedPosition
+from state_hash import TrackedFlag
+
+# Reaction hooks fired at every other racer on each move/jump/pass. Most
+# classes inherit the base no-op, so Game keeps per-race lists of the racers
+# whose class really overrides each one (see Character._reacts_to).
+REACTION_HOOKS = ('on_another_player_move', 'on_another_player_jump', 'on_being_passed')
+
+# Turn methods a class must leave alone (or declare PLAIN_WHEN_DISABLED) for
+# its turns in the abilities-off endgame to be fast-forwarded by
+# Game._take_plain_turn.
+ENDGAME_TURN_METHODS = ('take_turn', 'main_roll', 'move', 'jump')
 
 class Character:
     """Base character class for Magical Athlete racers.
@@ -24,6 +37,42 @@ class Character:
     # in the frontend; see config.get_characters_by_edition().
     EDITION = "v1"
 
+    # Set True on a class whose take_turn/main_roll/move/jump overrides all
+    # defer to the base methods once abilities are off (Legs's main_roll,
+    # Penguin's take_turn, ...), so the endgame fast path may skip them.
+    PLAIN_WHEN_DISABLED = False
+
+    # Writes to `position` also update the race's PositionIndex (see
+    # position_index.py). The link is set by Game when the race is built and
+    # lives outside __init__ so Doppelgangster's re-init keeps it.
+    position = TrackedPosition()
+    _position_index = None
+    # Loop-detection state (see state_hash.py).
+    finished = TrackedFlag()
+    tripped = TrackedFlag()
+    skip_main_move = TrackedFlag()
+    _state_hash = None
+
+    # Names from REACTION_HOOKS this class overrides, whether its turns are
+    # plain d6 turns once abilities are off, and whether it keeps the base
+    # move/jump (so Game can apply its moves from compiled board landings);
+    # computed once per class in __init_subclass__.
+    _reacts_to = frozenset()
+    _plain_when_disabled = True
+    _base_movement = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._reacts_to = frozenset(
+            hook for hook in REACTION_HOOKS
+            if getattr(cls, hook) is not getattr(Character, hook)
+        )
+        cls._plain_when_disabled = cls.PLAIN_WHEN_DISABLED or all(
+            getattr(cls, method) is getattr(Character, method)
+            for method in ENDGAME_TURN_METHODS
+        )
+        cls._base_movement = cls.move is Character.move and cls.jump is Character.jump
+
     def __init__(self, name, piece):
         self.name = name
         self.piece = piece
@@ -63,7 +112,8 @@ class Character:
         if self.tripped:
             self.tripped = False
             self.skip_main_move = True
-            play_by_play_lines.append(f"{self.name} ({self.piece}) is tripped and skips their main move.")
+            if game.log_enabled:
+                play_by_play_lines.append(f"{self.name} ({self.piece}) is tripped and skips their main move.")
 
         # PHASE 1: PRE_ROLL - Abilities before rolling
         game.resolve_phase(PowerPhase.PRE_ROLL, self, play_by_play_lines)
@@ -76,13 +126,25 @@ class Character:
             # Handle rerolls (Magician, Dicemonger)
             # Note: Rerolls happen before triggers, so we handle them specially.
             # Null suppresses the rerollr's power if they're ahead.
-            for player_index in game.turn_order:
-                other_player = game.players[player_index]
-                if hasattr(other_player, "reroll_main_roll"):
-                    if game.is_power_suppressed_for(other_player):
-                        continue
-                    roll = other_player.reroll_main_roll(self, game, play_by_play_lines, roll)
-                    self.last_roll = roll
+            # Game.reroll_participants: racers with reroll_main_roll, in turn
+            # order. If a reroll changes turn order or someone's class
+            # (Dicemonger's move can finish into a Doppelgangster steal),
+            # the rest of the turn order is walked live.
+            rerollers = game.reroll_participants
+            for slot, other_player in rerollers:
+                if game.is_power_suppressed_for(other_player):
+                    continue
+                roll = other_player.reroll_main_roll(self, game, play_by_play_lines, roll)
+                self.last_roll = roll
+                if game.reroll_participants is not rerollers:
+                    i = slot + 1
+                    while i < len(game.turn_order):
+                        other_player = game.players[game.turn_order[i]]
+                        i += 1
+                        if hasattr(other_player, "reroll_main_roll") and not game.is_power_suppressed_for(other_player):
+                            roll = other_player.reroll_main_roll(self, game, play_by_play_lines, roll)
+                            self.last_roll = roll
+                    break
 
             # PHASE 2: DIE_ROLL_TRIGGER - Powers triggered by the roll value (before mods)
             context = game.resolve_phase(PowerPhase.DIE_ROLL_TRIGGER, self, play_by_play_lines,
@@ -99,9 +161,10 @@ class Character:
                 # (LeSaboteur -1, Blunderdog -1 or 3, etc.). Effects compound multiplicatively.
                 if self.main_move_multiplier != 1:
                     new_roll = roll * self.main_move_multiplier
-                    play_by_play_lines.append(
-                        f"  {self.name} ({self.piece})'s main move x{self.main_move_multiplier}: {roll} -> {new_roll}"
-                    )
+                    if game.log_enabled:
+                        play_by_play_lines.append(
+                            f"  {self.name} ({self.piece})'s main move x{self.main_move_multiplier}: {roll} -> {new_roll}"
+                        )
                     roll = new_roll
 
                 # Null buff toggle: racers strictly ahead of an
@@ -112,7 +175,7 @@ class Character:
                 null_penalty = game.get_null_main_move_penalty(self)
                 if null_penalty > 0:
                     new_roll = max(0, roll - null_penalty)
-                    if new_roll != roll:
+                    if new_roll != roll and game.log_enabled:
                         play_by_play_lines.append(
                             f"  {self.name} ({self.piece}) is ahead of Null: -{null_penalty} main move ({roll} -> {new_roll})"
                         )
@@ -125,9 +188,10 @@ class Character:
                 conveyor_bonus = 0 if getattr(game, 'abilities_disabled', False) else getattr(game, 'twist_state', {}).get('conveyor_bonus', 0)
                 if conveyor_bonus:
                     new_roll = roll + conveyor_bonus
-                    play_by_play_lines.append(
-                        f"  {self.name} ({self.piece}) rides the conveyor: +{conveyor_bonus} ({roll} -> {new_roll})"
-                    )
+                    if game.log_enabled:
+                        play_by_play_lines.append(
+                            f"  {self.name} ({self.piece}) rides the conveyor: +{conveyor_bonus} ({roll} -> {new_roll})"
+                        )
                     roll = new_roll
 
                 # Twists: No Running by the scrying pool — final main-move
@@ -181,10 +245,16 @@ class Character:
 
     def main_roll(self, game, play_by_play_lines):
         roll = game.roll_die(self, play_by_play_lines)
-        play_by_play_lines.append(f"{self.name} ({self.piece}) rolled a {roll}")
+        if game.event_log is not None:
+            game.event_log.record(game._current_turn, EventKind.ROLL, self.player_number, value=roll)
+        elif game.log_enabled:
+            play_by_play_lines.append(f"{self.name} ({self.piece}) rolled a {roll}")
         while roll == 6 and self._trigger_party_pooper(game, play_by_play_lines):
             roll = game.roll_die(self, play_by_play_lines)
-            play_by_play_lines.append(f"  {self.name} ({self.piece}) rerolled and got a {roll}")
+            if game.event_log is not None:
+                game.event_log.record(game._current_turn, EventKind.REROLL, self.player_number, value=roll)
+            elif game.log_enabled:
+                play_by_play_lines.append(f"  {self.name} ({self.piece}) rerolled and got a {roll}")
         self.last_roll = roll
         return roll
 
@@ -201,7 +271,7 @@ class Character:
         pp = next((p for p in game.players
                    if p.piece == "PartyPooper"
                    and not p.finished
-                   and p not in game.eliminated_players), None)
+                   and not p.eliminated), None)
         if pp is None:
             return False
         play_by_play_lines.append(
@@ -209,7 +279,7 @@ class Character:
         )
         pp.move(game, play_by_play_lines, 1)
         pp.register_ability_use(game, play_by_play_lines, description="PartyPooper")
-        if pp.finished or pp in game.eliminated_players:
+        if pp.finished or pp.eliminated:
             return False
         return True
     
@@ -227,6 +297,12 @@ class Character:
         if spaces == 0:
             return
 
+        # Nobody can react to this move or to the board moves it sets off:
+        # apply the board's compiled landing instead (see Game.compiled_moves).
+        if game.compiled_moves and game._takes_compiled_move(self):
+            game._apply_compiled_move(self, spaces, play_by_play_lines)
+            return
+
         # Check for infinite loop (repeating game state)
         # This also adds current state to history for tracking across ability chains
         if game.check_for_state_loop(f"{self.name} ({self.piece})", play_by_play_lines):
@@ -286,9 +362,17 @@ class Character:
             if self.position >= game.board.length:
                 self.position = game.board.length
                 game.finish_player(self, play_by_play_lines)
-                play_by_play_lines.append(f"{self.name} ({self.piece}) moved from {self.previous_position} to {self.position} and finished!")
+                if game.event_log is not None:
+                    game.event_log.record(game._current_turn, EventKind.MOVE, self.player_number,
+                                          self.previous_position, self.position, 1)
+                elif game.log_enabled:
+                    play_by_play_lines.append(f"{self.name} ({self.piece}) moved from {self.previous_position} to {self.position} and finished!")
             else:
-                play_by_play_lines.append(f"{self.name} ({self.piece}) moved from {self.previous_position} to {self.position}")
+                if game.event_log is not None:
+                    game.event_log.record(game._current_turn, EventKind.MOVE, self.player_number,
+                                          self.previous_position, self.position)
+                elif game.log_enabled:
+                    play_by_play_lines.append(f"{self.name} ({self.piece}) moved from {self.previous_position} to {self.position}")
 
                 # Trigger board space effects
                 current_space = game.board.spaces[self.position]
@@ -297,15 +381,20 @@ class Character:
             # Detect and notify passed racers (Null: passed
             # racers ahead of Null have no powers, so on_being_passed skips)
             passed_racers = self.detect_passes(game, move_start, move_end)
+            hook_stats = game.hook_stats
             for passed_racer in passed_racers:
+                if 'on_being_passed' not in passed_racer._reacts_to:
+                    hook_stats['on_being_passed_skipped'] += 1
+                    continue
                 if not game.is_power_suppressed_for(passed_racer):
+                    hook_stats['on_being_passed_called'] += 1
                     passed_racer.on_being_passed(self, game, play_by_play_lines)
 
             # Move Suckerfish before checking for on another_player_move to avoid conflicts.
             # Finished/eliminated racers are off the board — they don't react.
             for p in game.players:
                 if (p.piece == "Suckerfish" and p != self
-                        and not p.finished and p not in game.eliminated_players):
+                        and not p.finished and not p.eliminated):
                     if not game.is_power_suppressed_for(p):
                         p.move_with_another(self, spaces, game, play_by_play_lines)
 
@@ -315,12 +404,8 @@ class Character:
             # state-loop history and causes false "infinite loop" detections.
             # (Stepdad's finish-line win bonus is the one effect that must still
             # fire when finished — it's handled via Stepdad.on_race_end.)
-            for other_player in game.players:
-                if (other_player != self
-                        and not other_player.finished
-                        and other_player not in game.eliminated_players):
-                    if not game.is_power_suppressed_for(other_player):
-                        other_player.on_another_player_move(self, game, play_by_play_lines)
+            # Only racers whose class overrides the hook are visited.
+            game.notify_reaction('on_another_player_move', self, play_by_play_lines)
 
             # Twists board: check if this move just pushed someone past
             # space 13 (triggers a one-time random twist for the race).
@@ -361,18 +446,11 @@ class Character:
 
         Returns: List of Character objects that were passed
         """
-        passed_racers = []
-
-        for other in game.players:
-            if other != self and not other.finished and other not in game.eliminated_players:
-                # Check if we started behind and ended ahead
-                started_behind = start_position < other.position
-                ended_ahead = end_position > other.position
-
-                if started_behind and ended_ahead:
-                    passed_racers.append(other)
-
-        return passed_racers
+        # Started behind and ended ahead == strictly between the endpoints.
+        return [
+            other for other in game.position_index.racers_between(start_position, end_position)
+            if other is not self and not other.finished and not other.eliminated
+        ]
 
     def trip(self, game, play_by_play_lines):
         self.tripped = True
@@ -404,9 +482,17 @@ class Character:
             if self.position >= game.board.length:
                 self.position = game.board.length
                 game.finish_player(self, play_by_play_lines)
-                play_by_play_lines.append(f"{self.name} ({self.piece}) jumped from {self.previous_position} to {self.position} and finished!")
+                if game.event_log is not None:
+                    game.event_log.record(game._current_turn, EventKind.JUMP, self.player_number,
+                                          self.previous_position, self.position, 1)
+                elif game.log_enabled:
+                    play_by_play_lines.append(f"{self.name} ({self.piece}) jumped from {self.previous_position} to {self.position} and finished!")
             else:
-                play_by_play_lines.append(f"{self.name} ({self.piece}) jumped from {self.previous_position} to {self.position}")
+                if game.event_log is not None:
+                    game.event_log.record(game._current_turn, EventKind.JUMP, self.player_number,
+                                          self.previous_position, self.position)
+                elif game.log_enabled:
+                    play_by_play_lines.append(f"{self.name} ({self.piece}) jumped from {self.previous_position} to {self.position}")
 
                 # Trigger board space effects
                 current_space = game.board.spaces[self.position]
@@ -415,12 +501,7 @@ class Character:
             # Notify other players about the jump (Null suppresses). Skip
             # finished/eliminated racers — see the on_another_player_move loop
             # in move() for the rationale (phantom reactions + false loops).
-            for other_player in game.players:
-                if (other_player != self
-                        and not other_player.finished
-                        and other_player not in game.eliminated_players):
-                    if not game.is_power_suppressed_for(other_player):
-                        other_player.on_another_player_jump(self, game, play_by_play_lines)
+            game.notify_reaction('on_another_player_jump', self, play_by_play_lines)
 
             # Twists board: a warp can also push someone past space 13.
             game.maybe_trigger_twist(self, play_by_play_lines)
@@ -454,11 +535,10 @@ class Character:
         other_player.jump(game, temp_position, play_by_play_lines)
 
     def check_for_share_space(self, game):
-        space_mates = []
-        for other_player in game.players:
-            if other_player != self and other_player.position == self.position and not other_player.finished:
-                space_mates.append(other_player)
-        return space_mates
+        return [
+            other_player for other_player in game.position_index.racers_at(self.position)
+            if other_player is not self and not other_player.finished
+        ]
     
     def post_turn_actions(self, game, other_player, play_by_play_lines):
         pass
@@ -497,7 +577,11 @@ class Character:
             
             # Add detailed tracking message to play-by-play
             if description:
-                play_by_play_lines.append(f"{self.name} ({self.piece}) used ability: {description}")
+                if game.event_log is not None:
+                    game.event_log.record(game._current_turn, EventKind.ABILITY, self.player_number,
+                                          value=game.event_log.intern(description))
+                elif game.log_enabled:
+                    play_by_play_lines.append(f"{self.name} ({self.piece}) used ability: {description}")
             
             # Trigger Scoocher movement (avoid recursion with Scoocher's own ability)
             if self.piece != "Scoocher":
@@ -12,14 +12,14 @@ class Blunderdog(Character):
     EDITION = "v2"
 
     def pre_move_action(self, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
         if self.skip_main_move:
             return  # tripped, etc.
 
         others = [
             p for p in game.players
-            if p is not self and p not in game.eliminated_players
+            if p is not self and not p.eliminated
         ]
         if not others:
             return
@@ -1,6 +1,5 @@
 # cheatah.py
 
-import random
 from .base_character import Character
 from power_system import PowerPhase
 
@@ -21,7 +20,7 @@ class Cheatah(Character):
     EDITION = "v2"
 
     def pre_move_action(self, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
         # If Cheatah was tripped coming into this turn, base.take_turn
         # already cleared self.tripped and set skip_main_move=True before
@@ -36,7 +35,7 @@ class Cheatah(Character):
         alt_mode = getattr(game, "cheatah_alt_mode", True)
         low, high = (4, 6) if alt_mode else (1, 6)
 
-        chosen = random.randint(low, high)
+        chosen = game.rng.randint(low, high)
         guesser = self._find_right_neighbor(game)
 
         # Suppress the normal roll pipeline (rerolls, triggers, modifications, MOVEMENT)
@@ -54,7 +53,7 @@ class Cheatah(Character):
             self.move(game, play_by_play_lines, chosen)
             return
 
-        guess = random.randint(low, high)
+        guess = game.rng.randint(low, high)
         play_by_play_lines.append(
             f"{self.name} ({self.piece}) sets the die to {chosen}{range_tag}; "
             f"{guesser.name} ({guesser.piece}) guesses {guess}."
@@ -88,6 +87,6 @@ class Cheatah(Character):
             candidate = game.players[game.turn_order[idx]]
             if (candidate is not self
                     and not candidate.finished
-                    and candidate not in game.eliminated_players):
+                    and not candidate.eliminated):
                 return candidate
         return None
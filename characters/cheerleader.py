@@ -14,7 +14,7 @@ class Cheerleader(Character):
     def pre_move_action(self, game, play_by_play_lines):
         """Cheerleader moves last place player(s) forward 2, and self 1."""
 
-        min_position = min([p.position for p in game.players if not p.finished and p not in game.eliminated_players], default=float('inf'))
+        min_position = min([p.position for p in game.active_players], default=float('inf'))
 
         last_place_players = [
             player for player in game.players
@@ -23,7 +23,7 @@ class Critic(Character):
     def reroll_main_roll(self, roller, game, play_by_play_lines, roll):
         if roller is self:
             return roll
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return roll
         if roll < self.REROLL_THRESHOLD:
             return roll
@@ -1,6 +1,5 @@
 # diva.py
 
-import random
 from .base_character import Character
 from power_system import PowerPhase
 
@@ -33,7 +32,7 @@ class Diva(Character):
         else:
             return
 
-        target = random.choice(target_pool)
+        target = game.rng.choice(target_pool)
         play_by_play_lines.append(
             f"{self.name} ({self.piece}) swaps with {role} racer {target.name} ({target.piece})."
         )
@@ -2,7 +2,6 @@
 
 from .base_character import Character
 from power_system import PowerPhase
-import random
 
 class Genius(Character):
     """I can predict what number I'll roll for my main move. If I'm right, I take another turn after this one."""
@@ -11,8 +10,9 @@ class Genius(Character):
 
     def __init__(self, name, piece):
         super().__init__(name, piece)
-        # For AI, randomly pick a number to predict each turn
-        self.lucky_number = random.randint(1, 6)
+        # For AI, randomly pick a number to predict each turn (drawn from
+        # game.rng right before each main-move roll)
+        self.lucky_number = None
         self.guessed_right = False
         self.my_turn_order = -1
 
@@ -20,7 +20,7 @@ class Genius(Character):
         """Check if Genius predicted their roll correctly."""
         if roller == self:
             # Make a new prediction for this roll
-            self.lucky_number = random.randint(1, 6)
+            self.lucky_number = game.rng.randint(1, 6)
             play_by_play_lines.append(
                 f"{self.name} ({self.piece}) predicts they will roll a {self.lucky_number}..."
             )
@@ -14,7 +14,7 @@ class Gloth(Character):
     def modify_other_roll(self, other_player, game, play_by_play_lines, roll):
         if (other_player is not self
                 or self.finished
-                or self in game.eliminated_players):
+                or self.eliminated):
             return roll
         new_roll = roll - 1
         play_by_play_lines.append(
@@ -27,7 +27,7 @@ class HogKnight(Character):
 
     def _deactivate_if_rider_out(self, game, state, play_by_play_lines):
         rider = state['rider']
-        if rider.finished or rider in game.eliminated_players:
+        if rider.finished or rider.eliminated:
             state['active'] = False
             play_by_play_lines.append(
                 f"  The hog is left behind (rider {rider.name} ({rider.piece}) is out)."
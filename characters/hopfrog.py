@@ -15,7 +15,7 @@ class Hopfrog(Character):
     EDITION = "v2"
 
     def post_move_ability(self, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
         # Require actual movement this turn — no new "stop" event without it.
         if self.position == self.turn_start_position:
@@ -28,7 +28,7 @@ class Hopfrog(Character):
             p.position == target
             and p is not self
             and not p.finished
-            and p not in game.eliminated_players
+            and not p.eliminated
             for p in game.players
         )
         if not has_racer_one_ahead:
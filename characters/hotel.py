@@ -21,9 +21,9 @@ class Hotel(Character):
         self._maybe_charge(jumped_player, game, play_by_play_lines)
 
     def _maybe_charge(self, player, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
-        if player is self or player.finished or player in game.eliminated_players:
+        if player is self or player.finished or player.eliminated:
             return
         # No-op moves (clamped, Stickler-blocked) don't count as a "stop"
         if player.position == getattr(player, 'previous_position', player.position):
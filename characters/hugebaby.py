@@ -27,6 +27,10 @@ class HugeBaby(Character):
         Wild board's "move +1" at position 11 with HugeBaby at 12)."""
         if self.position <= 0:
             return
+        # Fast exit: nobody else on HugeBaby's space. Otherwise fall through
+        # to the full scan, which re-reads positions as pushes cascade.
+        if len(game.position_index.racers_at(self.position)) < 2:
+            return
 
         for other_player in game.players:
             if other_player == self or other_player.position != self.position:
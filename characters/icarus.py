@@ -23,7 +23,7 @@ class Icarus(Character):
     def trigger_on_main_move_roll(self, roller, game, roll, play_by_play_lines):
         if roller is not self:
             return
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
         if game.is_power_suppressed_for(self):
             return
@@ -42,7 +42,7 @@ class Icarus(Character):
     def modify_other_roll(self, other_player, game, play_by_play_lines, roll):
         if other_player is not self:
             return roll
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return roll
         new_roll = roll + self.BONUS
         play_by_play_lines.append(
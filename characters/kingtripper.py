@@ -1,6 +1,5 @@
 # kingtripper.py
 
-import random
 from .base_character import Character
 from power_system import PowerPhase
 
@@ -25,7 +24,7 @@ class Kingtripper(Character):
         if not leaders:
             return
 
-        target = random.choice(leaders)
+        target = game.rng.choice(leaders)
         target.trip(game, play_by_play_lines)
         play_by_play_lines.append(
             f"{self.name} ({self.piece}) tripped lead racer {target.name} ({target.piece}) at position {target.position}."
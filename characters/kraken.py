@@ -34,7 +34,7 @@ class Kraken(Character):
     def pre_move_action(self, game, play_by_play_lines):
         if self._used:
             return
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
 
         threshold = game.board.length - self.LATE_GAME_THRESHOLD
@@ -42,7 +42,7 @@ class Kraken(Character):
             p for p in game.players
             if p is not self
             and not p.finished
-            and p not in game.eliminated_players
+            and not p.eliminated
         ]
         if not any(p.position >= threshold for p in active_others):
             return
@@ -58,7 +58,7 @@ class Kraken(Character):
             # Trip after warping. The trip flag affects the racer's NEXT main
             # move (per base.take_turn). Skip racers who got finished or
             # eliminated by the jump itself (e.g., landing on an elim space).
-            if p.finished or p in game.eliminated_players:
+            if p.finished or p.eliminated:
                 continue
             if not p.tripped:
                 p.trip(game, play_by_play_lines)
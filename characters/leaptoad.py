@@ -55,14 +55,9 @@ class Leaptoad(Character):
                 next_pos = new_position + direction
 
                 # Check if the next space is occupied (excluding Leaptoad itself)
+                racers_at = game.position_index.racers_at
                 while next_pos < game.board.length:
-                    occupied = False
-                    for other_player in game.players:
-                        if other_player != self and other_player.position == next_pos:
-                            occupied = True
-                            break
-
-                    if occupied:
+                    if any(other_player is not self for other_player in racers_at(next_pos)):
                         play_by_play_lines.append(
                             f"{self.name} ({self.piece}) skipped a space at {next_pos}."
                         )
@@ -106,10 +101,10 @@ class Leaptoad(Character):
                 if p.piece == "Suckerfish" and p != self:
                     p.move_with_another(self, spaces, game, play_by_play_lines)
 
-            # Notify other players about the movement
-            for other_player in game.players:
-                if other_player != self:
-                    other_player.on_another_player_move(self, game, play_by_play_lines)
+            # Notify other players about the movement (only racers whose
+            # class overrides the hook; see Character._reacts_to)
+            game.notify_reaction('on_another_player_move', self, play_by_play_lines,
+                                 active_only=False)
             
             # Register ability use if spaces were skipped
             if skipped_spaces:
@@ -5,6 +5,7 @@ from .base_character import Character
 class Legs(Character):
 
     POWER_PHASES = set()
+    PLAIN_WHEN_DISABLED = True  # main_roll falls back to the base d6 once abilities are off.
     def __init__(self, name, piece):
         super().__init__(name, piece)
 
@@ -13,7 +13,7 @@ class LeSaboteur(Character):
     def trigger_on_main_move_roll(self, roller, game, roll, play_by_play_lines):
         if (roller is not self and roll == 3
                 and not self.finished and not roller.finished
-                and roller not in game.eliminated_players):
+                and not roller.eliminated):
             play_by_play_lines.append(
                 f"{self.name} ({self.piece}) sabotages {roller.name} ({roller.piece}) for "
                 f"rolling a 3 — their move will be reversed!"
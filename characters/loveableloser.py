@@ -23,6 +23,6 @@ class LoveableLoser(Character):
     def is_last_place(self, game):
         """Checks if the Loveable Loser is in last place (strictly behind all other racers)."""
         for player in game.players:
-            if player != self and not player.finished and player not in game.eliminated_players and player.position <= self.position:
+            if player != self and not player.finished and not player.eliminated and player.position <= self.position:
                 return False
         return True
\ No newline at end of file
@@ -1,6 +1,5 @@
 # magicalathlete.py
 
-import random
 
 from .base_character import Character
 from power_system import PowerPhase
@@ -51,6 +50,7 @@ class MagicalAthlete(Character):
 
     POWER_PHASES = set()
     EDITION = "v2"
+    PLAIN_WHEN_DISABLED = True  # take_turn defers to the base turn while suppressed.
 
     def take_turn(self, game, play_by_play_lines):
         if self.tripped or game.is_power_suppressed_for(self):
@@ -122,13 +122,11 @@ class MagicalAthlete(Character):
         """Spell 2: warp the last-place racer to MA's space. MA doesn't
         move; only the warped racer relocates. Ties for last broken by
         random pick."""
-        candidates = self._other_active_racers(game)
-        if not candidates:
+        last_pool = game.position_index.trailers(self._is_other_active_racer(game))
+        if not last_pool:
             lines.append("  Spell 2: no other racers — spell fizzles.")
             return
-        min_pos = min(p.position for p in candidates)
-        last_pool = [p for p in candidates if p.position == min_pos]
-        last = random.choice(last_pool)
+        last = game.rng.choice(last_pool)
         lines.append(
             f"  Spell 2: warping last-place {last.name} ({last.piece}) "
             f"to space {self.position}."
@@ -139,24 +137,22 @@ class MagicalAthlete(Character):
         """Spell 3: warp to the lead racer's space AND trip them (they skip
         their next main move). Fizzles if MA is in the lead — no racer
         strictly ahead to target. Ties for lead broken randomly."""
-        candidates = self._other_active_racers(game)
-        if not candidates:
+        leaders = game.position_index.leaders(self._is_other_active_racer(game))
+        if not leaders:
             lines.append("  Spell 3: no other racers — spell fizzles.")
             return
-        max_pos = max(p.position for p in candidates)
-        if max_pos <= self.position:
+        if leaders[0].position <= self.position:
             lines.append(
                 f"  Spell 3: no racer ahead of {self.name} — spell fizzles."
             )
             return
-        leaders = [p for p in candidates if p.position == max_pos]
-        target = random.choice(leaders)
+        target = game.rng.choice(leaders)
         lines.append(
             f"  Spell 3: warping to lead racer {target.name} ({target.piece}) at "
             f"space {target.position} and tripping them."
         )
         self.jump(game, target.position, lines)
-        if not target.finished and target not in game.eliminated_players:
+        if not target.finished and not target.eliminated:
             target.trip(game, lines)
             lines.append(
                 f"    {target.name} ({target.piece}) is tripped."
@@ -180,18 +176,16 @@ class MagicalAthlete(Character):
         """Spell 5: the (single) lead racer moves backwards 5. Ties broken
         randomly. Fizzles if MA is at or above the highest other-racer
         position (no racer strictly ahead to push back)."""
-        candidates = self._other_active_racers(game)
-        if not candidates:
+        leaders = game.position_index.leaders(self._is_other_active_racer(game))
+        if not leaders:
             lines.append("  Spell 5: no other racers — spell fizzles.")
             return
-        max_pos = max(p.position for p in candidates)
-        if max_pos <= self.position:
+        if leaders[0].position <= self.position:
             lines.append(
                 f"  Spell 5: no racers ahead of {self.name} — spell fizzles."
             )
             return
-        leaders = [p for p in candidates if p.position == max_pos]
-        leader = random.choice(leaders)
+        leader = game.rng.choice(leaders)
         lines.append(
             f"  Spell 5: pushing lead racer {leader.name} ({leader.piece}) back 5."
         )
@@ -213,7 +207,7 @@ class MagicalAthlete(Character):
             return  # blocked (Stickler) — nothing passed
         passed = self.detect_passes(game, start, intended_end)
         for racer in passed:
-            if racer.finished or racer in game.eliminated_players:
+            if racer.finished or racer.eliminated:
                 continue
             if racer.tripped:
                 continue
@@ -224,10 +218,9 @@ class MagicalAthlete(Character):
 
     # ------------------------------------------------------------------
 
-    def _other_active_racers(self, game):
-        return [
-            p for p in game.players
-            if p is not self
+    def _is_other_active_racer(self, game):
+        return lambda p: (
+            p is not self
             and not p.finished
-            and p not in game.eliminated_players
-        ]
+            and not p.eliminated
+        )
@@ -31,6 +31,7 @@ class Mole(Character):
 
     POWER_PHASES = set()
     EDITION = "v2"
+    PLAIN_WHEN_DISABLED = True  # main_roll falls back to the base d6 while suppressed.
 
     def main_roll(self, game, play_by_play_lines):
         # Null: Mole's override is a power. Fall back to base d6 if suppressed.
@@ -49,11 +50,10 @@ class Mole(Character):
         return 6
 
     def _has_neighbor_within_one(self, game):
-        for p in game.players:
+        for p in game.position_index.racers_within(self.position, 1):
             if p is self:
                 continue
-            if p.finished or p in game.eliminated_players:
+            if p.finished or p.eliminated:
                 continue
-            if abs(p.position - self.position) <= 1:
-                return True
+            return True
         return False
@@ -14,6 +14,7 @@ class MrDiceGuy(Character):
 
     POWER_PHASES = set()
     EDITION = "v2"
+    PLAIN_WHEN_DISABLED = True  # main_roll falls back to the base d6 once abilities are off.
 
     def main_roll(self, game, play_by_play_lines):
         # Abilities-off endgame: roll a plain d6 like everyone else.
@@ -1,6 +1,5 @@
 # nemesis.py
 
-import random
 
 from .base_character import Character
 from power_system import PowerPhase
@@ -102,7 +101,7 @@ class Nemesis(Character):
         else:
             # No ranked racer in the race (e.g., a V1-only lineup) — random
             # fallback so Nemesis still picks someone.
-            self.nemesis = random.choice(candidates)
+            self.nemesis = game.rng.choice(candidates)
         self.has_picked_nemesis = True
         play_by_play_lines.append(
             f"{self.name} ({self.piece}) picks {self.nemesis.name} ({self.nemesis.piece}) as their nemesis."
@@ -115,7 +114,7 @@ class Nemesis(Character):
         warp_range = getattr(game, "nemesis_warp_range", self.DEFAULT_WARP_RANGE)
         if warp_range <= 0:
             return  # Toggle off — race-start pick still happens, but warp never fires.
-        if self.nemesis.finished or self.nemesis in game.eliminated_players:
+        if self.nemesis.finished or self.nemesis.eliminated:
             return
         if self.nemesis.position == self.position:
             return
@@ -44,7 +44,7 @@ class NormalHarry(Character):
         candidates = [
             (p, p.position) for p in game.players
             if p is not self and not p.finished
-            and p not in game.eliminated_players
+            and not p.eliminated
             and p.position > start_pos
         ]
 
@@ -60,7 +60,7 @@ class NormalHarry(Character):
                 break
             if (start_pos < original_pos < intended_end
                     and not player.finished
-                    and player not in game.eliminated_players):
+                    and not player.eliminated):
                 game.eliminate_player(player, play_by_play_lines)
                 self.register_ability_use(
                     game, play_by_play_lines,
@@ -1,7 +1,57 @@
 # null.py
 
+from position_index import TrackedPosition
+from state_hash import TrackedFlag
 from .base_character import Character
 
+
+class NullFloor:
+    """Lowest position of a race's active (not finished, not eliminated)
+    Nulls, or infinity when none is active. Racers strictly above it are
+    ahead of some active Null. Refreshed by the Null descriptors below
+    whenever one of its Nulls moves, finishes or is eliminated, so
+    Game.is_power_suppressed_for is a single comparison."""
+
+    def __init__(self, nulls):
+        self.nulls = nulls
+        for racer in nulls:
+            racer._null_floor = self
+        self.refresh()
+
+    def refresh(self):
+        self.value = min(
+            (racer.position for racer in self.nulls if not racer.finished and not racer.eliminated),
+            default=float('inf'),
+        )
+
+
+class _FloorPosition(TrackedPosition):
+    def __set__(self, racer, value):
+        TrackedPosition.__set__(self, racer, value)
+        if racer._null_floor is not None:
+            racer._null_floor.refresh()
+
+
+class _FloorFlag(TrackedFlag):
+    def __set__(self, racer, value):
+        TrackedFlag.__set__(self, racer, value)
+        if racer._null_floor is not None:
+            racer._null_floor.refresh()
+
+
+class _FloorField:
+    """Write-only descriptor (reads stay instance-dict lookups) for
+    `eliminated`, which is otherwise untracked."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __set__(self, racer, value):
+        racer.__dict__[self.name] = value
+        if racer._null_floor is not None:
+            racer._null_floor.refresh()
+
+
 class Null(Character):
     """Racers ahead of me have no powers AND -1 to their main move.
 
@@ -35,3 +85,11 @@ class Null(Character):
 
     POWER_PHASES = set()
     EDITION = "v2"
+
+    # Keep the race's NullFloor current (see Game.null_floor). The link is
+    # only set on racers whose piece is Null, so a Doppelgangster that
+    # steals this class doesn't move the floor.
+    position = _FloorPosition()
+    finished = _FloorFlag()
+    eliminated = _FloorField()
+    _null_floor = None
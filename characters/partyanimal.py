@@ -21,7 +21,7 @@ class PartyAnimal(Character):
         self.number_of_sharers = 0
         self.used_ability = False
         for player in game.players:
-            if player != self and not player.finished and player not in game.eliminated_players:
+            if player != self and not player.finished and not player.eliminated:
                 if player.position < self.position:
                     player.move(game, play_by_play_lines, 1) #Move one towards partyanimal, forward.
                     self.used_ability = True
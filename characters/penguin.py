@@ -27,6 +27,7 @@ class Penguin(Character):
 
     POWER_PHASES = {PowerPhase.PRE_ROLL}
     EDITION = "v2"
+    PLAIN_WHEN_DISABLED = True  # take_turn only adds the trip recovery when not suppressed.
 
     def __init__(self, name, piece):
         super().__init__(name, piece)
@@ -37,7 +38,7 @@ class Penguin(Character):
         self._double_next_main_move = False
 
     def on_being_passed(self, passing_player, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
         if self.tripped:
             return
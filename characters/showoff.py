@@ -15,6 +15,7 @@ class ShowOff(Character):
 
     POWER_PHASES = set()
     EDITION = "v2"
+    PLAIN_WHEN_DISABLED = True  # main_roll falls back to the base d6 while suppressed.
 
     def main_roll(self, game, play_by_play_lines):
         # Null: ShowOff's override is a power. Fall back to base d6 if suppressed.
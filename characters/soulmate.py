@@ -20,7 +20,7 @@ class Soulmate(Character):
     def trigger_on_main_move_roll(self, roller, game, roll, play_by_play_lines):
         if roller is self:
             return
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
 
         my_roll = game.roll_die(self, play_by_play_lines)
@@ -28,12 +28,12 @@ class SpeedDemon(Character):
         self._maybe_self_eliminate(game, play_by_play_lines)
 
     def _maybe_self_eliminate(self, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
 
         others = [
             p for p in game.players
-            if p is not self and p not in game.eliminated_players
+            if p is not self and not p.eliminated
         ]
         if not others:
             return  # alone — nothing to be ahead of
@@ -55,7 +55,7 @@ class SpeedDemon(Character):
     def modify_other_roll(self, other_player, game, play_by_play_lines, roll):
         if (other_player is not self
                 or self.finished
-                or self in game.eliminated_players):
+                or self.eliminated):
             return roll
         points = self.gold_chips * 5 + self.silver_chips * 3 + self.bronze_chips
         if points == 0:
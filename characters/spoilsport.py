@@ -14,12 +14,12 @@ class Spoilsport(Character):
     EDITION = "v2"
 
     def pre_move_action(self, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
 
         contenders = [
             p for p in game.players
-            if p is not self and p not in game.eliminated_players
+            if p is not self and not p.eliminated
         ]
         if not contenders:
             return  # alone — nothing to cancel
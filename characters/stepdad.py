@@ -20,7 +20,7 @@ class Stepdad(Character):
         self._stepchild_win_awarded = False
 
     def modify_other_roll(self, other_player, game, play_by_play_lines, roll):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return roll
         if not self._is_racer_to_my_left(game, other_player):
             return roll
@@ -50,7 +50,7 @@ class Stepdad(Character):
         if self._stepchild_win_awarded:
             return
         # Eliminated Stepdad's power is fully off — no win bonus either.
-        if self in game.eliminated_players:
+        if self.eliminated:
             return
         left = self._racer_to_my_left(game)
         if left is None:
@@ -84,7 +84,7 @@ class Stepdad(Character):
             candidate = game.players[game.turn_order[prev_idx]]
             if candidate is self:
                 continue
-            if candidate in game.eliminated_players:
+            if candidate.eliminated:
                 continue
             return candidate
         return None
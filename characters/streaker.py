@@ -64,7 +64,7 @@ class Streaker(Character):
         return passed
 
     def post_move_ability(self, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
         if self._passed_this_turn:
             self.bronze_chips += 1
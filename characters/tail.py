@@ -12,14 +12,14 @@ class Tail(Character):
     EDITION = "v2"
 
     def pre_move_action(self, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
 
         ahead = [
             p for p in game.players
             if p is not self
             and not p.finished
-            and p not in game.eliminated_players
+            and not p.eliminated
             and p.position > self.position
         ]
         if not ahead:
@@ -22,7 +22,7 @@ class TheHose(Character):
     EDITION = "v2"
 
     def post_move_ability(self, game, play_by_play_lines):
-        if self.finished or self in game.eliminated_players:
+        if self.finished or self.eliminated:
             return
 
         roll = game.roll_die(self, play_by_play_lines)
@@ -40,7 +40,7 @@ class TheHose(Character):
             p for p in game.players
             if p is not self
             and not p.finished
-            and p not in game.eliminated_players
+            and not p.eliminated
             and self.position < p.position <= self.position + roll
         ]
 
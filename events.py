@@ -0,0 +1,200 @@
+# events.py
+#
+# Structured play-by-play. Instead of English sentences, the engine's core
+# narration sites (turn starts, rolls, moves, jumps, ability uses, finishes,
+# eliminations, and the Twists board's draws, warps and rolls) write a
+# fixed-width record into column arrays:
+#
+#     race id | turn | actor | kind | from | to | value
+#
+# `actor` is the racer's player_number (1-based; 0 = no actor) and the
+# meaning of from/to/value depends on the kind (see the table below).
+# Analytics read the columns directly; render_race() turns a race's events
+# back into the exact text Game.run would have written, only when someone
+# actually wants to look at it.
+#
+# Pass an EventLog to Game.run in place of the play-by-play list. With
+# narrate=False (default) the character-specific flavour lines are dropped
+# just like NullLog, so a batch run pays one array write per core event and
+# nothing else. With narrate=True those lines are kept as TEXT events so the
+# rendered race is the complete play-by-play.
+
+from array import array
+from enum import IntEnum
+
+
+class EventKind(IntEnum):
+    """Event kinds and how their columns are used."""
+    TEXT = 0       # value = index into EventLog.strings (free-text line)
+    TURN = 1       # value = turn number
+    ROLL = 2       # value = main-move roll
+    REROLL = 3     # value = PartyPooper-forced reroll result
+    MOVE = 4       # from/to = positions, value = 1 if the move finished the race
+    JUMP = 5       # from/to = positions, value = 1 if the jump finished the race
+    ABILITY = 6    # value = index into EventLog.strings (description)
+    FINISH = 7     # value = placement (1 = gold, 2 = silver, 3+ = no chip)
+    ELIMINATE = 8
+    TWIST_TRIGGER = 9   # actor passed space 13 on a Twists board
+    TWIST = 10          # value = index into EventLog.strings (twist name), src = 1 if forced
+    TWIST_WARP = 11     # from/to = positions a twist moved the actor between,
+                        # value = 1 for Season Finale's "warped from" wording
+    TWIST_ROLL = 12     # value = roll Randomness Ceased locked in for the actor
+    CURSE_WAND = 13     # value = actor's Curse Wands roll (racers skipped)
+    GHOST_MOVE = 14     # from/to = ghost W.E.R.E.M.O.U.T.H. positions, value = its roll
+    GHOST_DEVOUR = 15   # the ghost passed the actor (an ELIMINATE follows)
+
+
+# Column names, in record order.
+COLUMNS = ('race', 'turn', 'actor', 'kind', 'src', 'dst', 'value')
+
+
+class EventLog:
+    """Columnar event store, usable as a Game.run play-by-play sink.
+
+    Columns are array('i') buffers preallocated to `capacity` and doubled
+    when full, so recording an event is seven indexed stores. One EventLog
+    can hold many races: Game.run calls begin_race() and every event is
+    tagged with that race's id.
+    """
+
+    def __init__(self, capacity=4096, narrate=False):
+        self.enabled = narrate  # Game.log_enabled: keep free-text lines as TEXT events?
+        self.size = 0
+        self._capacity = max(1, capacity)
+        for name in COLUMNS:
+            setattr(self, name, array('i', bytes(4 * self._capacity)))
+        self.strings = []
+        self._string_ids = {}
+        self.rosters = []  # race id -> [(name, piece), ...] indexed by player_number - 1
+        self.current_race = -1
+        self.current_turn = 0  # tags TEXT events; follows the last TURN event
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self):
+        extra = bytes(4 * self._capacity)
+        for name in COLUMNS:
+            getattr(self, name).frombytes(extra)
+        self._capacity *= 2
+
+    def intern(self, text):
+        """Return the string-table index for `text`, adding it if new."""
+        index = self._string_ids.get(text)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(text)
+            self._string_ids[text] = index
+        return index
+
+    def begin_race(self, game):
+        """Start a new race and remember its roster. Returns the race id."""
+        self.rosters.append([(p.name, p.piece) for p in game.players])
+        self.current_race = len(self.rosters) - 1
+        self.current_turn = 0
+        return self.current_race
+
+    def record(self, turn, kind, actor=0, src=0, dst=0, value=0):
+        i = self.size
+        if i == self._capacity:
+            self._grow()
+        self.race[i] = self.current_race
+        self.turn[i] = turn
+        self.actor[i] = actor
+        self.kind[i] = kind
+        self.src[i] = src
+        self.dst[i] = dst
+        self.value[i] = value
+        self.size = i + 1
+        if kind == EventKind.TURN:
+            self.current_turn = turn
+
+    # -- list-sink interface (free-text lines) ------------------------------
+    def append(self, line):
+        if self.enabled:
+            self.record(self.current_turn, EventKind.TEXT, value=self.intern(line))
+
+    def extend(self, lines):
+        for line in lines:
+            self.append(line)
+
+    def insert(self, index, line):
+        # Only used to prepend the "Board: ..." header after a race has run,
+        # which is outside what Game.run narrates — dropped.
+        pass
+
+    # -- reading -------------------------------------------------------------
+    def events(self, race=None, kind=None):
+        """Yield (race, turn, actor, kind, src, dst, value) tuples, optionally
+        filtered by race id and/or kind."""
+        columns = [getattr(self, name) for name in COLUMNS]
+        for i in range(self.size):
+            if race is not None and columns[0][i] != race:
+                continue
+            if kind is not None and columns[3][i] != kind:
+                continue
+            yield tuple(column[i] for column in columns)
+
+    def count_by_actor(self, kind, race=None):
+        """{(race, actor): count} of events of `kind`."""
+        counts = {}
+        for ev_race, _, actor, _, _, _, _ in self.events(race=race, kind=kind):
+            counts[(ev_race, actor)] = counts.get((ev_race, actor), 0) + 1
+        return counts
+
+
+def render_race(event_log, race=0):
+    """Render one race's events back into play-by-play lines, matching the
+    text Game.run writes for the same events."""
+    roster = event_log.rosters[race]
+    strings = event_log.strings
+    lines = []
+
+    def who(actor):
+        name, piece = roster[actor - 1]
+        return f"{name} ({piece})"
+
+    for _, _, actor, kind, src, dst, value in event_log.events(race=race):
+        if kind == EventKind.TEXT:
+            lines.append(strings[value])
+        elif kind == EventKind.TURN:
+            lines.append(f"\nTurn {value}:")
+        elif kind == EventKind.ROLL:
+            lines.append(f"{who(actor)} rolled a {value}")
+        elif kind == EventKind.REROLL:
+            lines.append(f"  {who(actor)} rerolled and got a {value}")
+        elif kind == EventKind.MOVE:
+            suffix = " and finished!" if value else ""
+            lines.append(f"{who(actor)} moved from {src} to {dst}{suffix}")
+        elif kind == EventKind.JUMP:
+            suffix = " and finished!" if value else ""
+            lines.append(f"{who(actor)} jumped from {src} to {dst}{suffix}")
+        elif kind == EventKind.ABILITY:
+            lines.append(f"{who(actor)} used ability: {strings[value]}")
+        elif kind == EventKind.FINISH:
+            if value == 1:
+                lines.append(f"{who(actor)} finished the race in 1st place and received a gold chip!")
+            elif value == 2:
+                lines.append(f"{who(actor)} finished the race in 2nd place and received a silver chip!")
+            else:
+                lines.append(f"{who(actor)} finished the race!")
+        elif kind == EventKind.ELIMINATE:
+            lines.append(f"{who(actor)} was eliminated!")
+        elif kind == EventKind.TWIST_TRIGGER:
+            lines.append(f"\n>>> {who(actor)} passed space 13 — a twist is drawn!")
+        elif kind == EventKind.TWIST:
+            lines.append(f"!! TWIST (forced): {strings[value]} !!" if src else f"!! TWIST DRAWN: {strings[value]} !!")
+        elif kind == EventKind.TWIST_WARP:
+            if value:
+                lines.append(f"    {who(actor)}: warped from {src} to {dst}.")
+            else:
+                lines.append(f"    {who(actor)}: {src} -> {dst}")
+        elif kind == EventKind.TWIST_ROLL:
+            lines.append(f"    {who(actor)}: locked at {value}")
+        elif kind == EventKind.CURSE_WAND:
+            lines.append(f"  Curse Wands: {who(actor)} rolls {value} — skipping {value} racer(s) in turn order.")
+        elif kind == EventKind.GHOST_MOVE:
+            lines.append(f"  Ghost W.E.R.E.M.O.U.T.H. rolls {value} and moves from {src} to {dst}.")
+        elif kind == EventKind.GHOST_DEVOUR:
+            lines.append(f"    Ghost W.E.R.E.M.O.U.T.H. devours {who(actor)}!")
+    return lines
@@ -2,21 +2,35 @@
 import csv
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-import threading
+import os
+import queue
 import time
+import traceback
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from tournament import Tournament, run_tournament_simulation
 from config import character_abilities, BOARD_TYPES, DEFAULT_BOARD_TYPE, EDITIONS, DEFAULT_EDITION, get_characters_by_edition
-from game_simulation import Game, run_simulations
+from game_simulation import Game
+from results_cache import cache_lookup, cache_store
+from sim_jobs import ProcessTask, SimulationJob
 from character_analysis import CharacterAnalyzer
 from debug_utils import log_exception, get_full_error_message
 
+# How often (ms) the Tk main loop drains a running job's event queue.
+POLL_MS = 100
+
 class MagicalAthleteApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Magical Athlete Simulator")
         self.root.geometry("1000x700")
+
+        # Background work: simulations run on worker processes and report
+        # through these queues, drained from root.after on the Tk thread.
+        self.race_job = None
+        self.race_events = queue.Queue()
+        self.tournament_task = None
+        self.tournament_events = queue.Queue()
         
         # Initialize character analyzer
         self.character_analyzer = CharacterAnalyzer()
@@ -72,7 +86,16 @@ class MagicalAthleteApp:
             ttk.Radiobutton(edition_frame, text=ed, variable=self.tournament_edition_var, value=ed).pack(anchor="w")
 
         # Run tournament button
-        ttk.Button(left_frame, text="Run Tournament", command=self._run_tournament).grid(row=9, column=0, columnspan=2, padx=5, pady=10)
+        self.tournament_run_button = ttk.Button(left_frame, text="Run Tournament", command=self._run_tournament)
+        self.tournament_run_button.grid(row=9, column=0, columnspan=2, padx=5, pady=10)
+
+        # Progress while the tournament runs on its worker process
+        tournament_progress_frame = ttk.Frame(left_frame)
+        tournament_progress_frame.grid(row=10, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        self.tournament_progress = ttk.Progressbar(tournament_progress_frame, mode="indeterminate", length=160)
+        self.tournament_progress.pack(side="left")
+        self.tournament_cancel_button = ttk.Button(tournament_progress_frame, text="Cancel", command=self._cancel_tournament, state=tk.DISABLED)
+        self.tournament_cancel_button.pack(side="left", padx=5)
         
         # Right panel - Results
         right_frame = ttk.LabelFrame(self.tournament_tab, text="Tournament Results")
@@ -263,8 +286,42 @@ class MagicalAthleteApp:
         self.cheatah_alt_mode_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(left_frame, text="Cheatah alt mode (4-6 only — both choose & guess in 4-6)", variable=self.cheatah_alt_mode_var).grid(row=14, column=0, columnspan=2, padx=5, pady=5, sticky="w")
 
+        # Sequential sampling: stop once every win rate's 95% CI is within
+        # ± the target; Number of Simulations becomes the cap.
+        self.stop_early_var = tk.BooleanVar(value=False)
+        self.target_ci_pp_var = tk.DoubleVar(value=2.0)
+        stop_frame = ttk.Frame(left_frame)
+        stop_frame.grid(row=15, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+        ttk.Checkbutton(stop_frame, text="Stop when win-rate 95% CI is within ±", variable=self.stop_early_var).pack(side="left")
+        ttk.Spinbox(stop_frame, from_=0.1, to=10.0, increment=0.1, textvariable=self.target_ci_pp_var, width=5).pack(side="left")
+        ttk.Label(stop_frame, text="pp").pack(side="left", padx=(2, 0))
+
+        # Seed: same seed + settings = same results, served from the on-disk
+        # results cache on repeat runs. Blank = a fresh random batch.
+        ttk.Label(left_frame, text="Seed (blank = random):").grid(row=16, column=0, padx=5, pady=5, sticky="w")
+        self.seed_var = tk.StringVar(value="")
+        ttk.Entry(left_frame, textvariable=self.seed_var, width=12).grid(row=16, column=1, padx=5, pady=5, sticky="w")
+
+        # Worker processes: races always run off the Tk process, so the
+        # window stays responsive; results are identical for any count.
+        max_workers = max(2, os.cpu_count() or 1)
+        ttk.Label(left_frame, text="Worker processes:").grid(row=17, column=0, padx=5, pady=5, sticky="w")
+        self.workers_var = tk.IntVar(value=max_workers)
+        ttk.Spinbox(left_frame, from_=2, to=max_workers, textvariable=self.workers_var, width=5).grid(row=17, column=1, padx=5, pady=5, sticky="w")
+
         # Run button
-        ttk.Button(left_frame, text="Run Race Simulations", command=self._run_race_simulations).grid(row=17, column=0, columnspan=2, padx=5, pady=10)
+        self.race_run_button = ttk.Button(left_frame, text="Run Race Simulations", command=self._run_race_simulations)
+        self.race_run_button.grid(row=18, column=0, columnspan=2, padx=5, pady=10)
+
+        # Progress of the running batch; Cancel keeps the races finished so far
+        race_progress_frame = ttk.Frame(left_frame)
+        race_progress_frame.grid(row=19, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
+        self.race_progress = ttk.Progressbar(race_progress_frame, mode="determinate", length=160, maximum=1.0)
+        self.race_progress.pack(side="left")
+        self.race_cancel_button = ttk.Button(race_progress_frame, text="Cancel", command=self._cancel_race_simulations, state=tk.DISABLED)
+        self.race_cancel_button.pack(side="left", padx=5)
+        self.race_progress_label = ttk.Label(left_frame, text="")
+        self.race_progress_label.grid(row=20, column=0, columnspan=2, padx=5, pady=(0, 5), sticky="w")
         
         # Right panel - Results
         right_frame = ttk.LabelFrame(self.single_race_tab, text="Race Results")
@@ -425,26 +482,42 @@ class MagicalAthleteApp:
         # Clear results
         self.tournament_results_text.delete(1.0, tk.END)
         self.tournament_results_text.insert(tk.END, f"Running tournament simulation with {board_type} board ({edition} edition)...\n\n")
-        self.root.update()
 
-        # Run tournament in a separate thread
-        def run_tournament_thread():
-            try:
-                results = run_tournament_simulation(player_names, board_type=board_type, allowed_characters=allowed)
-                
-                # Display results
-                self.root.after(0, lambda: self._display_tournament_results(results, edition))
-            except Exception as error:
-                # Log the full exception
-                error_details = log_exception(error, "tournament simulation")
-                error_msg = str(error)
-                
-                # Show detailed error message - FIXED LAMBDA
-                # Pass both variables as default arguments to the lambda function
-                self.root.after(0, lambda error_msg=error_msg, details=error_details: 
-                            self._show_detailed_error(error_msg, "tournament simulation", details))
-        
-        threading.Thread(target=run_tournament_thread).start()
+        # Run the tournament on a worker process; _poll_tournament picks up
+        # the result on the Tk thread.
+        self.tournament_task = ProcessTask(
+            run_tournament_simulation, player_names, board_type=board_type,
+            allowed_characters=allowed, events=self.tournament_events,
+        ).start()
+        self.tournament_edition = edition
+        self.tournament_run_button.config(state=tk.DISABLED)
+        self.tournament_cancel_button.config(state=tk.NORMAL)
+        self.tournament_progress.start(10)
+        self.root.after(POLL_MS, self._poll_tournament)
+
+    def _cancel_tournament(self):
+        if self.tournament_task is not None:
+            self.tournament_task.cancel()
+
+    def _poll_tournament(self):
+        """Show the tournament's outcome once its task reports back."""
+        task = self.tournament_task
+        try:
+            self.tournament_events.get_nowait()
+        except queue.Empty:
+            self.root.after(POLL_MS, self._poll_tournament)
+            return
+        self.tournament_task = None
+        self.tournament_progress.stop()
+        self.tournament_run_button.config(state=tk.NORMAL)
+        self.tournament_cancel_button.config(state=tk.DISABLED)
+        if task.status == "done":
+            self._display_tournament_results(task.result, self.tournament_edition)
+        elif task.status == "cancelled":
+            self.tournament_results_text.insert(tk.END, "Tournament cancelled.\n")
+        else:
+            error_details = "".join(traceback.format_exception(type(task.error), task.error, task.error.__traceback__))
+            self._show_detailed_error(str(task.error), "tournament simulation", error_details)
     
     def _display_tournament_results(self, results, edition=None):
         self.tournament_results_text.delete(1.0, tk.END)
@@ -608,6 +681,13 @@ class MagicalAthleteApp:
         nemesis_warp_range = self.nemesis_warp_range_var.get()
         cheatah_alt_mode = self.cheatah_alt_mode_var.get()
         forced_twist = self.forced_twist_var.get()
+        target_win_rate_ci = self.target_ci_pp_var.get() / 100 if self.stop_early_var.get() else None
+        seed_text = self.seed_var.get().strip()
+        try:
+            seed = int(seed_text) if seed_text else None
+        except ValueError:
+            messagebox.showerror("Error", "Seed must be a whole number (or blank for a random batch).")
+            return
         if len(allowed) < num_racers:
             messagebox.showerror(
                 "Not enough racers",
@@ -623,41 +703,92 @@ class MagicalAthleteApp:
                 messagebox.showerror("Error", f"Please select at least {num_racers} characters.")
                 return
 
+        # collect_detailed_logs=True because frontend has an export logs feature
+        run_kwargs = dict(
+            num_simulations=num_simulations, num_players=num_racers, board_type=board_type, fixed_characters=fixed_characters, random_turn_order=True, collect_detailed_logs=True, allowed_characters=allowed, speeddemon_threshold=speeddemon_threshold, speeddemon_starting_points=speeddemon_starting_points, speeddemon_check_timing=speeddemon_check_timing, showoff_threshold=showoff_threshold, random_starting_bronze=random_starting_bronze, null_main_move_penalty=null_main_move_penalty, spoilsport_threshold=spoilsport_threshold, nemesis_warp_range=nemesis_warp_range, random_board_pool=random_board_pool, cheatah_alt_mode=cheatah_alt_mode, forced_twist=forced_twist,
+            target_win_rate_ci=target_win_rate_ci, seed=seed, workers=self.workers_var.get(),
+        )
+        self.race_edition = edition
+        cache_key, cached = cache_lookup(run_kwargs)
+        if cached is not None:
+            self._show_race_results(cached, from_cache=True)
+            return
+
         # Clear results
         self.race_results_text.delete(1.0, tk.END)
         self.race_results_text.insert(tk.END, f"Running race simulations with {board_desc} ({edition} edition)...\n\n")
-        self.root.update()
-        
-        # Run simulations in a separate thread
-        # Fix for the lambda function error in run_simulations_thread method
 
-        def run_simulations_thread():
+        # Run the batch on a background job (its races on worker processes);
+        # _poll_race_simulations follows its progress on the Tk thread.
+        self.race_job = SimulationJob(
+            run_kwargs, events=self.race_events,
+            on_finish=lambda results: cache_store(cache_key, results),
+        ).start()
+        self.race_run_button.config(state=tk.DISABLED)
+        self.race_cancel_button.config(state=tk.NORMAL)
+        self.race_progress["value"] = 0
+        self.race_progress_label.config(text=f"0 / {num_simulations} races")
+        self.root.after(POLL_MS, self._poll_race_simulations)
+
+    def _cancel_race_simulations(self):
+        if self.race_job is not None:
+            self.race_job.cancel()
+            self.race_cancel_button.config(state=tk.DISABLED)
+            self.race_progress_label.config(text="Cancelling...")
+
+    def _poll_race_simulations(self):
+        """Drain the running job's events: advance the progress bar, and
+        show the results once it finishes or is cancelled."""
+        job = self.race_job
+        status = None
+        while True:
             try:
-                # Updated to handle the additional returns including chip statistics and board type counts
-                # collect_detailed_logs=True because frontend has an export logs feature
-                average_turns, average_finish_positions, all_play_by_play, ability_activations, appearance_count, chip_stats, board_type_counts, win_counts, turns_by_board, avg_bronze_earned, max_bronze_earned, watchdog_tally = run_simulations(
-                    num_simulations, num_racers, board_type=board_type, fixed_characters=fixed_characters, random_turn_order=True, collect_detailed_logs=True, allowed_characters=allowed, speeddemon_threshold=speeddemon_threshold, speeddemon_starting_points=speeddemon_starting_points, speeddemon_check_timing=speeddemon_check_timing, showoff_threshold=showoff_threshold, random_starting_bronze=random_starting_bronze, null_main_move_penalty=null_main_move_penalty, spoilsport_threshold=spoilsport_threshold, nemesis_warp_range=nemesis_warp_range, random_board_pool=random_board_pool, cheatah_alt_mode=cheatah_alt_mode, forced_twist=forced_twist
-                )
+                event = self.race_events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "progress":
+                _, races_done, total = event
+                self.race_progress["value"] = races_done / total if total else 1.0
+                if not job.cancel_requested:
+                    self.race_progress_label.config(text=f"{races_done} / {total} races")
+            else:
+                status = event[1]
+        if status is None:
+            self.root.after(POLL_MS, self._poll_race_simulations)
+            return
 
-                # Display results with ability data included
-                self.root.after(0, lambda: self._display_race_results(
-                    average_turns, average_finish_positions, all_play_by_play,
-                    ability_activations, appearance_count, chip_stats,
-                    win_counts, edition, num_simulations, turns_by_board,
-                    avg_bronze_earned, max_bronze_earned, watchdog_tally,
-                ))
-            except Exception as e:
-                # Fix: Capture the exception message before using it in the lambda
-                error_msg = str(e)
-                self.root.after(0, lambda error_msg=error_msg: messagebox.showerror("Error", f"An error occurred: {error_msg}"))
-
-        threading.Thread(target=run_simulations_thread).start()
+        self.race_job = None
+        self.race_run_button.config(state=tk.NORMAL)
+        self.race_cancel_button.config(state=tk.DISABLED)
+        _, races_done, results = job.snapshot()
+        self.race_progress_label.config(text={
+            "done": f"Done: {races_done} races",
+            "cancelled": f"Cancelled after {races_done} / {job.total} races",
+        }.get(status, "Failed"))
+        if status == "error":
+            messagebox.showerror("Error", f"An error occurred: {job.error}")
+        elif results is not None:
+            self._show_race_results(results, cancelled=status == "cancelled")
+        elif status == "cancelled":
+            self.race_results_text.insert(tk.END, "Cancelled before any races finished.\n")
+
+    def _show_race_results(self, results, from_cache=False, cancelled=False):
+        """Display a run_simulations results tuple (possibly partial)."""
+        (average_turns, average_finish_positions, all_play_by_play, ability_activations, appearance_count, chip_stats, board_type_counts, win_counts, turns_by_board, avg_bronze_earned, max_bronze_earned, watchdog_tally, standard_errors, _placement_counts, races_run) = results
+        self._display_race_results(
+            average_turns, average_finish_positions, all_play_by_play,
+            ability_activations, appearance_count, chip_stats,
+            win_counts, self.race_edition, races_run, turns_by_board,
+            avg_bronze_earned, max_bronze_earned, watchdog_tally,
+            standard_errors, from_cache, cancelled,
+        )
     
     def _display_race_results(self, average_turns, average_finish_positions, all_play_by_play,
                           ability_activations=None, appearance_count=None, chip_stats=None,
                           win_counts=None, edition=None, num_simulations=None,
                           turns_by_board=None, avg_bronze_earned=None,
-                          max_bronze_earned=None, watchdog_tally=None):
+                          max_bronze_earned=None, watchdog_tally=None,
+                          standard_errors=None, from_cache=False, cancelled=False):
         """Display race simulation results with enhanced ability statistics display."""
         # Store the complete logs for later export
         self.complete_simulation_logs = all_play_by_play.copy() if all_play_by_play else []
@@ -675,8 +806,24 @@ class MagicalAthleteApp:
         self.race_results_text.delete(1.0, tk.END)
         
         # Display summary - Simplified version
-        self.race_results_text.insert(tk.END, f"Completed {self.num_simulations_var.get()} simulations with {self.num_racers_var.get()} racers each.\n\n")
-        self.race_results_text.insert(tk.END, f"Average number of turns per race: {average_turns:.2f}\n")
+        sims_run = num_simulations if num_simulations is not None else self.num_simulations_var.get()
+        self.race_results_text.insert(tk.END, f"Completed {sims_run} simulations with {self.num_racers_var.get()} racers each.\n")
+        if from_cache:
+            self.race_results_text.insert(tk.END, "Served from the results cache (this seed and configuration were run before).\n")
+        if cancelled:
+            self.race_results_text.insert(tk.END, f"Cancelled: partial results from the first {sims_run} of {self.num_simulations_var.get()} races.\n")
+        elif self.stop_early_var.get():
+            if sims_run < self.num_simulations_var.get():
+                self.race_results_text.insert(tk.END, f"Stopped early: every win rate reached ±{self.target_ci_pp_var.get():g}pp (95% CI).\n")
+            else:
+                self.race_results_text.insert(tk.END, f"Reached the {sims_run}-race cap before every win rate reached ±{self.target_ci_pp_var.get():g}pp.\n")
+        self.race_results_text.insert(tk.END, "\n")
+        turns_se = standard_errors.get('turns') if standard_errors else None
+        self.race_results_text.insert(
+            tk.END,
+            f"Average number of turns per race: {average_turns:.2f}"
+            + (f" ± {turns_se:.2f} (standard error)" if turns_se is not None else "") + "\n"
+        )
         if turns_by_board:
             for label in ("Mild", "Wild", "Sportals", "Twists"):
                 avg = turns_by_board.get(label)
@@ -707,6 +854,14 @@ class MagicalAthleteApp:
                     f"  hit MAX_TURNS hard cap: {wd.get('races_max_turns_hit', 0)} race(s)  "
                     f"[tag: [WATCHDOG] max-turns]\n"
                 )
+                flagged = wd.get('flagged_race_seeds', [])
+                if flagged:
+                    more = f" (+{len(flagged) - 10} more)" if len(flagged) > 10 else ""
+                    self.race_results_text.insert(
+                        tk.END,
+                        f"  race seeds (game_simulation.replay_race): "
+                        f"{', '.join(str(seed) for seed in flagged[:10])}{more}\n"
+                    )
             else:
                 self.race_results_text.insert(
                     tk.END, "Watchdog events: none — every race finished normally.\n"
@@ -720,7 +875,6 @@ class MagicalAthleteApp:
         # from both character abilities (Hare, LovableLoser) and Wild board spaces.
         total_ability_triggers_per_race = 0
         total_points_per_race = 0
-        sims_run = self.num_simulations_var.get()
         if chip_stats and appearance_count and sims_run:
             total_points_per_race = sum(
                 stats.get('points_avg', 0) * appearance_count.get(char, 0)
@@ -730,7 +884,6 @@ class MagicalAthleteApp:
         # For ability triggers: Calculate correctly based on appearances in races
         if ability_activations and appearance_count:
             total_activations = 0
-            num_simulations = self.num_simulations_var.get()
             
             # For each character, calculate their total ability triggers across all races
             for char, avg_activations in ability_activations.items():
@@ -741,7 +894,7 @@ class MagicalAthleteApp:
                         total_activations += avg_activations * appearances
             
             # Divide by total number of simulations to get per-race average
-            total_ability_triggers_per_race = total_activations / num_simulations
+            total_ability_triggers_per_race = total_activations / sims_run
         
         self.race_results_text.insert(tk.END, f"Average points awarded per race: {total_points_per_race:.2f}\n")
         self.race_results_text.insert(tk.END, f"Average ability triggers per race: {total_ability_triggers_per_race:.2f}\n\n")
@@ -756,7 +909,7 @@ class MagicalAthleteApp:
         ranking = self._build_ranking_from_race_results(
             average_finish_positions, ability_activations, appearance_count, win_counts, chip_stats
         )
-        sims_label = num_simulations if num_simulations is not None else self.num_simulations_var.get()
+        sims_label = sims_run
         ed_label = edition or "?"
         status = (f"Showing {sims_label} single-race simulations "
                   f"({ed_label} edition). Click headers to sort.")
@@ -1,13 +1,40 @@
 # game_simulation.py
+import copy
+import io
 import random
+import sys
+from contextlib import contextmanager
 from config import character_abilities, BOARD_LENGTH, MAX_TURNS, ABILITIES_OFF_TURN, CORNER_POSITION, BOARD_TYPES, DEFAULT_BOARD_TYPE
-from characters.base_character import Character
-from board import Board
+from characters.base_character import Character, REACTION_HOOKS
+from board import Board, MAX_MOVE_DEPTH
 from power_system import PowerPhase
 from debug_utils import TurnEventCapExceeded
+from events import EventKind, EventLog
+from position_index import PositionIndex
+from state_hash import StateHash
+from characters.null import NullFloor
+from online_stats import RunningStat, proportion_std_error
+
+# Phases whose action (see _execute_phase_action) only ever runs for the
+# current player, and phases with no action for anyone. resolve_phase uses
+# these to skip walking the other racers.
+_CURRENT_PLAYER_ONLY_PHASES = frozenset({PowerPhase.PRE_ROLL, PowerPhase.MOVEMENT})
+_NO_OP_PHASES = frozenset({PowerPhase.POST_MOVEMENT, PowerPhase.OTHER_REACTIONS})
+
 
 class Game:
-    def __init__(self, character_names, board_type=DEFAULT_BOARD_TYPE, board=None, random_turn_order=False, speeddemon_threshold=4, speeddemon_starting_points=3, speeddemon_check_timing="start", showoff_threshold=5, random_starting_bronze=True, null_main_move_penalty=1, spoilsport_threshold=5, nemesis_warp_range=5, random_board_pool=None, cheatah_alt_mode=True, forced_twist=None):
+    def __init__(self, character_names, board_type=DEFAULT_BOARD_TYPE, board=None, random_turn_order=False, speeddemon_threshold=4, speeddemon_starting_points=3, speeddemon_check_timing="start", showoff_threshold=5, random_starting_bronze=True, null_main_move_penalty=1, spoilsport_threshold=5, nemesis_warp_range=5, random_board_pool=None, cheatah_alt_mode=True, forced_twist=None, seed=None, rng=None, fast_endgame=True, compiled_moves=True):
+        # Per-race RNG. Every die, board draw, turn-order shuffle, character
+        # pick and twist draw in this race comes from self.rng, so a race is
+        # reproduced exactly from its seed and concurrent races never share
+        # random state. With no seed, one is drawn from the global random
+        # module (so an upstream random.seed() still makes runs repeatable).
+        # `rng` lets run_simulations hand over the generator it already drew
+        # the lineup from; `seed` must then be the seed it was built with.
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
         self.players = []
         self.speeddemon_threshold = speeddemon_threshold  # Lead size that triggers SpeedDemon self-elimination (strict > comparison)
         self.speeddemon_check_timing = speeddemon_check_timing  # "start" or "end" — when the elimination check fires
@@ -29,12 +56,14 @@ class Game:
             actual_board_type = board_type
             if board_type == "Random":
                 pool = random_board_pool or ["Mild", "Wild"]
-                actual_board_type = random.choice(list(pool))
+                actual_board_type = self.rng.choice(list(pool))
 
             self.board = Board(board_type=actual_board_type, corner_position=CORNER_POSITION)
         
         self.finished_players = []
         self.eliminated_players = []
+        self._active_players = []
+        self._active_counts = None  # (finished, eliminated) counts _active_players was built at
         self.turn_order = []
         self.current_player_index = 0
         self.race_cancelled = False  # Set by Spoilsport (or similar) to end the race
@@ -45,6 +74,24 @@ class Game:
         # ongoing twist effects no-op — so every racer is a plain d6 roller
         # and the race is guaranteed to finish.
         self.abilities_disabled = False
+        # Once abilities are off, turns that are guaranteed to be plain d6
+        # turns skip the phase machinery (see _take_plain_turn). False plays
+        # every endgame turn through take_turn — the verification mode; both
+        # give identical races.
+        self.fast_endgame = fast_endgame
+        # Moves nobody can react to take the board's compiled landing (see
+        # _takes_compiled_move); False always runs the recursive move/jump
+        # path. Both give identical races.
+        self.compiled_moves = compiled_moves
+        # Narration switch. run() sets this from its sink's `enabled` flag
+        # (NullLog is False; plain lists count as enabled), and hot paths
+        # check it before formatting a play-by-play line so batch stats runs
+        # don't pay for text nobody reads.
+        self.log_enabled = True
+        # Structured event sink (events.EventLog) when run() was handed one,
+        # else None. Core narration sites record a typed event there instead
+        # of formatting a line.
+        self.event_log = None
         # Watchdog: counts move/jump/ability events per turn. Reset in _take_turn_or_stun.
         # Exceeding the cap raises TurnEventCapExceeded to abort the runaway cascade.
         # Cap is 50: measured legit turns peak at ~36 events (p99=16), while a
@@ -52,7 +99,8 @@ class Game:
         # and bounds the cost of a pathological turn (was 5000, ~100x slower).
         self._turn_event_count = 0
         self._turn_event_cap = 50
-        self._current_turn = 0  # Tracked for diagnostic logging
+        self._current_turn = 0  # Turns played so far; run() resumes from here
+        self._race_started = False  # run() has done the pre-race setup (Mastermind, Nemesis)
         self._watchdog_diagnostics = []  # Diagnostic strings for any aborted turns this race
         # Per-race watchdog event tallies (surfaced in the sim summary).
         self._turn_abort_count = 0   # turns aborted by the per-turn event cap
@@ -66,10 +114,13 @@ class Game:
             'ability': 0,
             'space_check': 0
         }
-        self._max_recursion_depth = 3  # Original conservative cap. Fan-out via on_another_player_move means each level multiplies events; deeper caps blow memory on V1+V2 Wild races. State-loop detection in move/jump is the primary cycle protection.
+        self._max_recursion_depth = MAX_MOVE_DEPTH  # Original conservative cap. Fan-out via on_another_player_move means each level multiplies events; deeper caps blow memory on V1+V2 Wild races. State-loop detection in move/jump is the primary cycle protection.
 
-        # State history for detecting true infinite loops (repeating game states)
+        # State history for detecting true infinite loops (repeating game
+        # states): the stack of state hashes seen this turn, plus how many
+        # times each occurs in it, so membership is a dict lookup.
         self._state_history = []
+        self._state_counts = {}
 
         # Twists board state. `twist_triggered` flips True the first time a
         # racer crosses past space 13 on a Twists board, at which point a
@@ -87,6 +138,29 @@ class Game:
         self.forced_twist = forced_twist if forced_twist and forced_twist != "All" else None
         
         self._create_players(character_names, random_turn_order)
+        # Standings order + position -> racers map, kept current by the
+        # Character.position descriptor (see position_index.py).
+        self.position_index = PositionIndex(self.players)
+        # Running Zobrist hash of positions and finished/tripped/skip flags,
+        # kept current by the Character descriptors (see state_hash.py).
+        self.state_hash = StateHash(self.players)
+        # The Null and Stunner racers, in player order. Pieces never change
+        # (a Doppelgangster keeps its piece after stealing a class), so these
+        # are fixed for the race; roll_die only looks at the Stunners and
+        # skips straight through when there are none. null_floor tracks the
+        # lowest active Null as they move, finish or are eliminated, for
+        # is_power_suppressed_for.
+        self._nulls = [p for p in self.players if p.piece == "Null"]
+        self._stunners = [p for p in self.players if p.piece == "Stunner"]
+        self.null_floor = NullFloor(self._nulls)
+        # Racers whose presence rules out compiled moves (_takes_compiled_move).
+        self._move_followers = [p for p in self.players if p.piece in ("Suckerfish", "Stickler")]
+        # Reaction-hook dispatch: hook name -> racers (player order) whose
+        # class overrides it. Rebuilt when Doppelgangster changes class.
+        # hook_stats counts hook calls made vs. base no-op calls skipped.
+        self._build_hook_subscribers()
+        self._build_phase_participants()
+        self.hook_stats = {f"{hook}_{outcome}": 0 for hook in REACTION_HOOKS for outcome in ("called", "skipped")}
 
         # Snapshot baseline as ALL ZEROS for character-spec chips (e.g.,
         # Sisyphus starts with 4 bronze in __init__ — those are part of the
@@ -100,7 +174,7 @@ class Game:
         # the baseline (settings-based chips don't count as earned points).
         if self._random_starting_bronze:
             for player in self.players:
-                bonus = random.randint(0, 5)
+                bonus = self.rng.randint(0, 5)
                 player.bronze_chips += bonus
                 g, s, b = self._chip_baseline[id(player)]
                 self._chip_baseline[id(player)] = (g, s, b + bonus)
@@ -123,15 +197,39 @@ class Game:
             self.players.append(player)
             self.turn_order.append(i)
         if random_turn_order:
-            random.shuffle(self.turn_order)
+            self.rng.shuffle(self.turn_order)
         for i, player in enumerate(self.players):
             player.player_number = i + 1
 
+    def _build_hook_subscribers(self):
+        self.hook_subscribers = {
+            hook: [p for p in self.players if hook in p._reacts_to]
+            for hook in REACTION_HOOKS
+        }
+
+    def _build_phase_participants(self):
+        """Per-phase dispatch table: PowerPhase -> racers in turn order that
+        declare it in POWER_PHASES, for resolve_phase's "other players" step.
+        Also the turn-order list of racers with a reroll_main_roll power.
+        Depends on turn order and on each racer's class, so it is rebuilt by
+        change_turn_order and _doppelgangster_steal_power.
+
+        Entries are (index in turn_order, racer) so a walk interrupted by a
+        rebuild can carry on from the same turn-order slot."""
+        in_turn_order = [(slot, self.players[i]) for slot, i in enumerate(self.turn_order)]
+        self.phase_participants = {
+            phase: [(slot, p) for slot, p in in_turn_order if phase in p.POWER_PHASES]
+            for phase in PowerPhase
+            if phase not in _CURRENT_PLAYER_ONLY_PHASES and phase not in _NO_OP_PHASES
+        }
+        self.reroll_participants = [(slot, p) for slot, p in in_turn_order if hasattr(p, "reroll_main_roll")]
+
     def get_game_state_snapshot(self):
         """Get a hashable snapshot of current game state for loop detection.
 
         Returns a tuple representing the complete game state. If this state
-        repeats, we have a true infinite loop.
+        repeats, we have a true infinite loop. Loop detection itself uses
+        state_hash.value, the running hash of the same fields.
         """
         return (
             tuple(p.position for p in self.players),
@@ -149,45 +247,71 @@ class Game:
         NOTE: This also adds the current state to history, so states persist
         across ability-triggered moves within a turn.
         """
-        current_state = self.get_game_state_snapshot()
+        current_state = self.state_hash.value
 
-        if current_state in self._state_history:
+        if current_state in self._state_counts:
             # We've returned to a previous state - this is a true infinite loop!
-            play_by_play_lines.append(
-                f"Infinite loop detected: Game returned to identical state. Breaking loop for {character_name}."
-            )
+            if self.log_enabled:
+                play_by_play_lines.append(
+                    f"Infinite loop detected: Game returned to identical state. Breaking loop for {character_name}."
+                )
             return True
 
         # Add current state to history for future loop detection
-        self._state_history.append(current_state)
+        self._push_state(current_state)
         return False
 
     def clear_state_history(self):
         """Clear state history at the end of a turn."""
         self._state_history = []
+        self._state_counts = {}
 
     def push_game_state(self):
         """Push current game state onto history stack."""
-        self._state_history.append(self.get_game_state_snapshot())
+        self._push_state(self.state_hash.value)
 
     def pop_game_state(self):
         """Pop most recent game state from history stack."""
         if self._state_history:
-            self._state_history.pop()
+            state = self._state_history.pop()
+            if self._state_counts[state] == 1:
+                del self._state_counts[state]
+            else:
+                self._state_counts[state] -= 1
+
+    def _push_state(self, state):
+        self._state_history.append(state)
+        self._state_counts[state] = self._state_counts.get(state, 0) + 1
+
+    def run(self, play_by_play_lines, stop_after_turn=None):
+        """Play the race and return (turns, final_placements).
+
+        With `stop_after_turn`, play stops once that many turns are complete
+        and returns None instead, unless the race ended on that turn. The
+        race can then be resumed with another run() call (on this game or on
+        a fork() of it), and plays out exactly as if it had never stopped."""
+        self.log_enabled = getattr(play_by_play_lines, 'enabled', True)
+        if isinstance(play_by_play_lines, EventLog):
+            if play_by_play_lines is not self.event_log:
+                play_by_play_lines.begin_race(self)
+            self.event_log = play_by_play_lines
+        else:
+            self.event_log = None
 
-    def run(self, play_by_play_lines):
-        turns = 0
-        
-        for player in self.players:
-            player.ability_activations = 0
-        
-        for player in self.players:
-            if player.piece == "Mastermind":
-                player.make_prediction(self, play_by_play_lines)
-            elif player.piece == "Nemesis":
-                player.pick_nemesis(self, play_by_play_lines)
+        if not self._race_started:
+            self._race_started = True
+            for player in self.players:
+                player.ability_activations = 0
 
-        while not self.should_game_end(play_by_play_lines) and turns < MAX_TURNS:
+            for player in self.players:
+                if player.piece == "Mastermind":
+                    player.make_prediction(self, play_by_play_lines)
+                elif player.piece == "Nemesis":
+                    player.pick_nemesis(self, play_by_play_lines)
+
+        turns = self._current_turn
+        while ((stop_after_turn is None or turns < stop_after_turn)
+               and not self.should_game_end(play_by_play_lines) and turns < MAX_TURNS):
             turns += 1
             self._current_turn = turns  # for watchdog diagnostics
 
@@ -205,11 +329,14 @@ class Game:
                 play_by_play_lines.append(f"\n>>> {msg}")
                 self._watchdog_diagnostics.append(msg)
 
-            play_by_play_lines.append(f"\nTurn {turns}:")
+            if self.event_log is not None:
+                self.event_log.record(turns, EventKind.TURN, value=turns)
+            elif self.log_enabled:
+                play_by_play_lines.append(f"\nTurn {turns}:")
 
             for _ in range(len(self.players)):
                 player = self.current_player
-                if not player.finished and player not in self.eliminated_players:
+                if not player.finished and not player.eliminated:
                     self._take_turn_or_stun(player, play_by_play_lines)
                     if self.should_game_end(play_by_play_lines):
                         break
@@ -226,7 +353,7 @@ class Game:
                         self.queued_turns = []
 
                         for queued_player in queued_players:
-                            if not queued_player.finished and queued_player not in self.eliminated_players:
+                            if not queued_player.finished and not queued_player.eliminated:
                                 self._take_turn_or_stun(queued_player, play_by_play_lines)
                                 # Set current player to queued player so next_player() advances from here
                                 self.current_player_index = self.players.index(queued_player)
@@ -245,6 +372,10 @@ class Game:
                     break
                 self.next_player()
 
+        if (stop_after_turn is not None and turns >= stop_after_turn
+                and not self.should_game_end(play_by_play_lines)):
+            return None
+
         # Detect a true timeout: the loop exited because it hit MAX_TURNS while
         # the race still hadn't ended. With the abilities-off endgame at
         # ABILITIES_OFF_TURN this should essentially never happen — it's the
@@ -266,10 +397,7 @@ class Game:
         # Spoilsport cancellation (race_cancelled) and MAX_TURNS timeout —
         # those endings aren't "I won the remaining slot," they're a wash.
         if not getattr(self, 'race_cancelled', False) and turns < MAX_TURNS:
-            survivors = [
-                p for p in self.players
-                if not p.finished and p not in self.eliminated_players
-            ]
+            survivors = self.active_players
             if len(survivors) == 1:
                 survivor = survivors[0]
                 play_by_play_lines.append(
@@ -284,27 +412,101 @@ class Game:
             if not self.is_power_suppressed_for(player):
                 player.on_race_end(self, play_by_play_lines)
 
-        play_by_play_lines.append("The race has ended!")
-        play_by_play_lines.append(f"Total Turns: {turns:02d}")
-
-        play_by_play_lines.append("\nAbility Activation Summary:")
-        for player in self.players:
-            play_by_play_lines.append(f"{player.name} ({player.piece}): {player.ability_activations} ability uses")
-            
-        play_by_play_lines.append("\nChip Summary:")
-        for player in self.players:
-            points = (player.gold_chips * 5) + (player.silver_chips * 3) + (player.bronze_chips * 1)
-            play_by_play_lines.append(f"{player.name} ({player.piece}): {points} points (Gold: {player.gold_chips}, Silver: {player.silver_chips}, Bronze: {player.bronze_chips})")
-        play_by_play_lines.append(
-            f"Bronze chips earned this race (excluding starting chips): "
-            f"{self.bronze_chips_earned_this_race()}"
-        )
-        
         final_placements = self.assign_final_placements()
-        for place, placed_player in final_placements:
-            play_by_play_lines.append(f"{place}: {placed_player.name} ({placed_player.piece})")
+        if self.log_enabled:
+            play_by_play_lines.append("The race has ended!")
+            play_by_play_lines.append(f"Total Turns: {turns:02d}")
+
+            play_by_play_lines.append("\nAbility Activation Summary:")
+            for player in self.players:
+                play_by_play_lines.append(f"{player.name} ({player.piece}): {player.ability_activations} ability uses")
+
+            play_by_play_lines.append("\nChip Summary:")
+            for player in self.players:
+                points = (player.gold_chips * 5) + (player.silver_chips * 3) + (player.bronze_chips * 1)
+                play_by_play_lines.append(f"{player.name} ({player.piece}): {points} points (Gold: {player.gold_chips}, Silver: {player.silver_chips}, Bronze: {player.bronze_chips})")
+            play_by_play_lines.append(
+                f"Bronze chips earned this race (excluding starting chips): "
+                f"{self.bronze_chips_earned_this_race()}"
+            )
+
+            for place, placed_player in final_placements:
+                play_by_play_lines.append(f"{place}: {placed_player.name} ({placed_player.piece})")
         return turns, final_placements
 
+    # Game attributes fork() rebuilds for the clone instead of copying.
+    _FORK_REBUILT = frozenset({
+        'rng', 'board', 'players', 'event_log', 'position_index', 'state_hash', 'null_floor',
+        'hook_subscribers', 'phase_participants', 'reroll_participants',
+        '_active_players', '_active_counts', '_nulls', '_stunners', '_move_followers',
+        '_chip_baseline', 'twist_state',
+    })
+
+    def fork(self, seed=None):
+        """Return an independent copy of this game, mid-race or not.
+
+        Racers (including a class-swapped Doppelgangster and per-class state
+        such as Nemesis's pick), the board's current spaces (consumed Pinata
+        spaces stay consumed), twist_state, queued_turns, turn order and the
+        RNG state are all copied; references between racers are remapped to
+        the clone's racers. The play-by-play sink is not: the clone narrates
+        into whatever its next run() call is given.
+
+        With seed=None the clone continues this game's random stream, so it
+        plays out identically. Pass a seed to branch it onto a fresh stream
+        (that's what run_continuations does for each continuation)."""
+        clone = Game.__new__(Game)
+        players = [object.__new__(type(p)) for p in self.players]
+        memo = {id(self): clone}
+        for old, new in zip(self.players, players):
+            memo[id(old)] = new
+
+        board = copy.copy(self.board)
+        board.spaces = list(self.board.spaces)  # Space objects are replaced, never mutated
+        memo[id(self.board)] = board
+        # Racers' links to the old game's indexes are rebuilt below.
+        memo[id(self.position_index)] = None
+        memo[id(self.state_hash)] = None
+        memo[id(self.null_floor)] = None
+
+        for old, new in zip(self.players, players):
+            # Straight into the instance dict: the tracking descriptors have
+            # no index to update yet.
+            new.__dict__.update(copy.deepcopy(old.__dict__, memo))
+
+        state = clone.__dict__
+        for name, value in self.__dict__.items():
+            if name not in self._FORK_REBUILT:
+                state[name] = copy.deepcopy(value, memo)
+
+        if seed is None:
+            clone.rng = random.Random()
+            clone.rng.setstate(self.rng.getstate())
+        else:
+            clone.seed = seed
+            clone.rng = random.Random(seed)
+        clone.board = board
+        clone.players = players
+        clone.event_log = None
+        # id()-keyed tables follow their racers.
+        new_id = {id(old): id(new) for old, new in zip(self.players, players)}
+        clone._chip_baseline = {new_id[k]: v for k, v in self._chip_baseline.items()}
+        clone.twist_state = copy.deepcopy(self.twist_state, memo)
+        if 'fixed_rolls' in clone.twist_state:
+            clone.twist_state['fixed_rolls'] = {new_id[k]: v for k, v in self.twist_state['fixed_rolls'].items()}
+
+        clone.position_index = PositionIndex(players)
+        clone.state_hash = StateHash(players)
+        clone._active_players = []
+        clone._active_counts = None
+        clone._nulls = [p for p in players if p.piece == "Null"]
+        clone._stunners = [p for p in players if p.piece == "Stunner"]
+        clone.null_floor = NullFloor(clone._nulls)
+        clone._move_followers = [p for p in players if p.piece in ("Suckerfish", "Stickler")]
+        clone._build_hook_subscribers()
+        clone._build_phase_participants()
+        return clone
+
     def is_power_suppressed_for(self, character):
         """True if any active Null is in the game and the given
         character is strictly ahead of them. Null's spec:
@@ -317,14 +519,10 @@ class Game:
         so flipping it turns the whole field into plain d6 rollers."""
         if self.abilities_disabled:
             return True
-        for p in self.players:
-            if (p.piece == "Null"
-                    and p is not character
-                    and not p.finished
-                    and p not in self.eliminated_players
-                    and character.position > p.position):
-                return True
-        return False
+        # Strictly ahead of the lowest active Null is ahead of some active
+        # Null other than the character itself; the floor is infinite when
+        # no Null is active.
+        return character.position > self.null_floor.value
 
     def get_null_main_move_penalty(self, character):
         """Magnitude (>=0) to subtract from the given character's main-move
@@ -356,6 +554,9 @@ class Game:
         # re-trip the watchdog before we get to the try-block.
         self._turn_event_count = 0
 
+        if self.abilities_disabled and self._is_plain_endgame_turn(player):
+            self._take_plain_turn(player, play_by_play_lines)
+            return
         try:
             player.take_turn(game=self, play_by_play_lines=play_by_play_lines)
         except TurnEventCapExceeded as exc:
@@ -374,6 +575,120 @@ class Game:
             # Reset count so subsequent turns start fresh.
             self._turn_event_count = 0
 
+    def _is_plain_endgame_turn(self, player):
+        """True if `player`'s abilities-off turn can go through
+        _take_plain_turn: fast_endgame is on, nothing is being narrated, the
+        player's class plays plain once abilities are off, no twist can still
+        trigger, and no Stickler (whose overshoot rule ignores the switch) is
+        racing."""
+        if not self.fast_endgame or self.log_enabled or self.event_log is not None:
+            return False
+        if not player._plain_when_disabled:
+            return False
+        if not self.twist_triggered and getattr(self.board, "board_type", None) == "Twists":
+            return False
+        for p in self.players:
+            if p.piece == "Stickler" and not p.finished:
+                return False
+        return True
+
+    def _take_plain_turn(self, player, play_by_play_lines):
+        """Character.take_turn with every power off, minus the machinery.
+
+        With abilities disabled every phase action, reroll, reaction hook,
+        roll override and modifier is suppressed, so a turn comes down to:
+        trip check, one d6 from self.rng, a move with board-space effects,
+        and the end-of-turn resets. This replays exactly that, drawing the
+        same random numbers in the same order as the full turn. Board spaces
+        still run their real on_enter (which may call player.move), and
+        finishing still goes through finish_player, Doppelgangster intercept
+        included. Hook dispatch counters (hook_stats) are not updated.
+
+        Rolls are drawn one turn at a time rather than as a NumPy block:
+        they must come from self.rng in the same order as take_turn for
+        seeded races to stay identical, and each landing (trip spaces,
+        finishes) decides who rolls next."""
+        player.turn_start_position = player.position
+        player.last_roll = -1
+        player.main_move_multiplier = 1
+        if player.tripped:
+            player.tripped = False
+            player.skip_main_move = True
+
+        if not player.skip_main_move:
+            roll = self.rng.randint(1, 6)
+            player.last_roll = roll
+            self._plain_move(player, roll, play_by_play_lines)
+
+        if player.skip_main_move:
+            player.skip_main_move = False
+        self.clear_state_history()
+
+    def _plain_move(self, player, spaces, play_by_play_lines):
+        """Character.move for a main move with every power off: no pass
+        reactions, Suckerfish or twist trigger (ruled out by
+        _is_plain_endgame_turn), just the move, finish and board space."""
+        # Records the pre-move state for loop detection in any nested
+        # board-space move; the history was just cleared, so never a loop.
+        self.check_for_state_loop(player.name, play_by_play_lines)
+        self._turn_event_count += 1
+        self._recursion_depths['movement'] += 1
+        try:
+            player.previous_position = player.position
+            player.position = max(0, min(player.position + spaces, self.board.length))
+            if player.position >= self.board.length:
+                self.finish_player(player, play_by_play_lines)
+            else:
+                self.board.spaces[player.position].on_enter(player, self, play_by_play_lines)
+        finally:
+            self._recursion_depths['movement'] -= 1
+
+    def _takes_compiled_move(self, mover):
+        """True if a move by `mover` can be applied from the board's compiled
+        landing (Board.landing) instead of recursive move/jump calls: it's a
+        top-level move (no enclosing move or space effect), nothing is being
+        narrated, the mover keeps the base move/jump, no twist can trigger,
+        no Suckerfish or Stickler is racing, and no other active racer
+        reacts to moves, jumps or being passed."""
+        if self.log_enabled or self.event_log is not None or not mover._base_movement or mover.finished:
+            return False
+        depths = self._recursion_depths
+        if depths['movement'] or depths['space_check']:
+            return False
+        if not self.twist_triggered and getattr(self.board, "board_type", None) == "Twists":
+            return False
+        for p in self._move_followers:
+            # Stickler's rule holds until Stickler finishes (Stickler.is_in_game).
+            if not p.finished and (p.piece == "Stickler" or not p.eliminated):
+                return False
+        if not self.abilities_disabled:
+            for racers in self.hook_subscribers.values():
+                for p in racers:
+                    if p is not mover and not p.finished and not p.eliminated:
+                        return False
+        return True
+
+    def _apply_compiled_move(self, mover, spaces, play_by_play_lines):
+        """Character.move for a move _takes_compiled_move cleared: walk the
+        compiled steps with the same loop-detection pushes, watchdog counts
+        and position writes the nested calls would make, finish the mover if
+        a step reaches the line, else apply the final space's own effect."""
+        board = self.board
+        for kind, destination in board.landing(mover.position, spaces):
+            if self.check_for_state_loop(mover.name, play_by_play_lines) or destination is None:
+                return
+            self._turn_event_count += 1
+            if self._turn_event_count > self._turn_event_cap:
+                raise TurnEventCapExceeded(f"{kind} event count {self._turn_event_count}")
+            mover.previous_position = mover.position
+            mover.position = destination
+            if destination >= board.length:
+                self.finish_player(mover, play_by_play_lines)
+                return
+        space = board.spaces[mover.position]
+        if space.space_type != "move" and space.space_type != "portal":
+            space.on_enter(mover, self, play_by_play_lines)
+
     def _post_turn_twist_hooks(self, current_player, play_by_play_lines):
         """Twists board: ongoing per-turn effects. Called after every
         player's turn (and any queued bonus turns)."""
@@ -391,34 +706,43 @@ class Game:
         # take turns of its own and doesn't earn placement chips.
         ghost = self.twist_state.get('ghost_mouth')
         if ghost is not None and ghost['position'] < self.board.length:
-            roll = random.randint(1, 6)
+            roll = self.rng.randint(1, 6)
             start = ghost['position']
             end = min(start + roll, self.board.length)
-            play_by_play_lines.append(
-                f"  Ghost W.E.R.E.M.O.U.T.H. rolls {roll} and moves from "
-                f"{start} to {end}."
-            )
+            if self.event_log is not None:
+                self.event_log.record(self._current_turn, EventKind.GHOST_MOVE, 0, start, end, roll)
+            elif self.log_enabled:
+                play_by_play_lines.append(
+                    f"  Ghost W.E.R.E.M.O.U.T.H. rolls {roll} and moves from "
+                    f"{start} to {end}."
+                )
             for p in self.players:
-                if p.finished or p in self.eliminated_players:
+                if p.finished or p.eliminated:
                     continue
                 # Pass detection: ghost crossed past this racer's space.
                 # If the ghost lands ON the racer, also eat them (sharing
                 # a space with a transformed WEREMOUTH = consumed).
                 if start <= p.position <= end:
-                    play_by_play_lines.append(
-                        f"    Ghost W.E.R.E.M.O.U.T.H. devours {p.name} ({p.piece})!"
-                    )
+                    if self.event_log is not None:
+                        self.event_log.record(self._current_turn, EventKind.GHOST_DEVOUR, p.player_number)
+                    elif self.log_enabled:
+                        play_by_play_lines.append(
+                            f"    Ghost W.E.R.E.M.O.U.T.H. devours {p.name} ({p.piece})!"
+                        )
                     self.eliminate_player(p, play_by_play_lines)
             ghost['position'] = end
 
         # Curse Wands: the player who just finished their turn rolls, and
         # the turn pointer advances by that many slots (skipping racers).
         if self.twist_state.get('curse_wands_active'):
-            roll = random.randint(1, 6)
-            play_by_play_lines.append(
-                f"  Curse Wands: {current_player.name} ({current_player.piece}) "
-                f"rolls {roll} — skipping {roll} racer(s) in turn order."
-            )
+            roll = self.rng.randint(1, 6)
+            if self.event_log is not None:
+                self.event_log.record(self._current_turn, EventKind.CURSE_WAND, current_player.player_number, value=roll)
+            elif self.log_enabled:
+                play_by_play_lines.append(
+                    f"  Curse Wands: {current_player.name} ({current_player.piece}) "
+                    f"rolls {roll} — skipping {roll} racer(s) in turn order."
+                )
             for _ in range(roll):
                 self.next_player()
 
@@ -434,12 +758,7 @@ class Game:
         # Check ALL active racers — the trigger fires for whoever first
         # crosses the threshold, which may not be `mover` (e.g., a HugeBaby
         # push could send someone else past 13).
-        crossed = [
-            p for p in self.players
-            if not p.finished
-            and p not in self.eliminated_players
-            and p.position >= 14
-        ]
+        crossed = [p for p in self.active_players if p.position >= 14]
         if not crossed:
             return
         # Prefer `mover` as the triggerer if they're among the crossed set
@@ -450,10 +769,13 @@ class Game:
         else:
             triggerer = max(crossed, key=lambda p: p.position)
         self.twist_triggered = True
-        play_by_play_lines.append(
-            f"\n>>> {triggerer.name} ({triggerer.piece}) passed space 13 — "
-            f"a twist is drawn!"
-        )
+        if self.event_log is not None:
+            self.event_log.record(self._current_turn, EventKind.TWIST_TRIGGER, triggerer.player_number)
+        elif self.log_enabled:
+            play_by_play_lines.append(
+                f"\n>>> {triggerer.name} ({triggerer.piece}) passed space 13 — "
+                f"a twist is drawn!"
+            )
         if self.forced_twist:
             from twists import apply_named_twist
             apply_named_twist(self, triggerer, play_by_play_lines, self.forced_twist)
@@ -508,6 +830,8 @@ class Game:
 
         for k, v in preserved.items():
             setattr(doppelgangster, k, v)
+        self._build_hook_subscribers()
+        self._build_phase_participants()
 
         play_by_play_lines.append(
             f"  Doppelgangster now wields the power of {target_class.__name__}."
@@ -526,13 +850,15 @@ class Game:
         """Return the list of active (non-suppressed) Stunners within 1 space
         of `player`. Empty list if none. Used by roll_die for the override
         and to credit each adjacent Stunner with an ability activation."""
+        if not self._stunners:
+            return []
+        position = player.position
         return [
-            p for p in self.players
-            if p.piece == "Stunner"
+            p for p in self._stunners
+            if -1 <= p.position - position <= 1
             and p is not player
             and not p.finished
-            and p not in self.eliminated_players
-            and abs(p.position - player.position) <= 1
+            and not p.eliminated
             and not self.is_power_suppressed_for(p)
         ]
 
@@ -547,14 +873,14 @@ class Game:
         """Roll a die for `player`. Returns 1 (regardless of `low`/`high`)
         when Stunner's proximity rule applies — per Stunner's spec, that's
         'roll a 1 for all rolls', interpreted literally even if a caller
-        passes an unusual range. Otherwise returns random.randint(low, high).
+        passes an unusual range. Otherwise returns self.rng.randint(low, high).
 
-        Use this instead of bare random.randint anywhere a CHARACTER ROLLS
+        Use this instead of bare game.rng.randint anywhere a CHARACTER ROLLS
         a die that the game treats as a roll (main move, Duelist duel,
         TheHose, Soulmate, MrDiceGuy, ShowOff). Internal randoms that
         the spec doesn't call rolls — Genius's lucky number, Cheatah's
         chosen value/guess, Mole's leader tiebreak, MagicalAthlete spell
-        target picks — stay on random.randint.
+        target picks — stay on game.rng.randint.
 
         Each override is an ability use: every adjacent Stunner is credited
         via register_ability_use, which also triggers Scoocher (Scoocher's
@@ -563,7 +889,7 @@ class Game:
         ShowOff's chain) — that's intentional."""
         nearby = self._active_stunners_near(player)
         if nearby:
-            if play_by_play_lines is not None:
+            if play_by_play_lines is not None and self.log_enabled:
                 play_by_play_lines.append(
                     f"  Stunner forces {player.name} ({player.piece}) to roll 1."
                 )
@@ -580,7 +906,7 @@ class Game:
             fixed = self.twist_state.get('fixed_rolls', {}).get(id(player))
             if fixed is not None:
                 return max(low, min(fixed, high))
-        return random.randint(low, high)
+        return self.rng.randint(low, high)
 
     def next_player(self):
         self.current_player_index = (self.current_player_index + 1) % len(self.turn_order)
@@ -590,6 +916,20 @@ class Game:
     def current_player(self):
         return self.players[self.turn_order[self.current_player_index]]
 
+    @property
+    def active_players(self):
+        """Racers still in the race (not finished, not eliminated), in player
+        order. Cached: finished_players and eliminated_players only ever
+        grow, so their lengths say when the list is stale (this also covers
+        Mastermind, which appends to finished_players itself). A new list is
+        built on each change, so callers may keep iterating an old one while
+        racers finish or get eliminated — but must not mutate it."""
+        counts = (len(self.finished_players), len(self.eliminated_players))
+        if counts != self._active_counts:
+            self._active_players = [p for p in self.players if not p.finished and not p.eliminated]
+            self._active_counts = counts
+        return self._active_players
+
     def should_game_end(self, play_by_play_lines):
         if getattr(self, 'race_cancelled', False):
             return True
@@ -617,7 +957,7 @@ class Game:
                     (p for p in self.players
                      if isinstance(p, _Dop)
                      and not p.finished
-                     and p not in self.eliminated_players),
+                     and not p.eliminated),
                     None,
                 )
                 if dop is not None:
@@ -656,24 +996,36 @@ class Game:
             if len(self.finished_players) == 1:
                 # First place gets a gold chip (5 points)
                 player.gold_chips += 1
-                play_by_play_lines.append(f"{player.name} ({player.piece}) finished the race in 1st place and received a gold chip!")
             elif len(self.finished_players) == 2:
                 # Second place gets a silver chip (3 points)
                 player.silver_chips += 1
-                play_by_play_lines.append(f"{player.name} ({player.piece}) finished the race in 2nd place and received a silver chip!")
-            else:
-                play_by_play_lines.append(f"{player.name} ({player.piece}) finished the race!")
+            if self.event_log is not None:
+                self.event_log.record(self._current_turn, EventKind.FINISH, player.player_number,
+                                      value=len(self.finished_players))
+            elif self.log_enabled:
+                if len(self.finished_players) == 1:
+                    play_by_play_lines.append(f"{player.name} ({player.piece}) finished the race in 1st place and received a gold chip!")
+                elif len(self.finished_players) == 2:
+                    play_by_play_lines.append(f"{player.name} ({player.piece}) finished the race in 2nd place and received a silver chip!")
+                else:
+                    play_by_play_lines.append(f"{player.name} ({player.piece}) finished the race!")
 
     def eliminate_player(self, player, play_by_play_lines):
-        if player not in self.eliminated_players:
+        if not player.eliminated:
+            player.eliminated = True
             self.eliminated_players.append(player)
-            play_by_play_lines.append(f"{player.name} ({player.piece}) was eliminated!")
+            if self.event_log is not None:
+                self.event_log.record(self._current_turn, EventKind.ELIMINATE, player.player_number)
+            elif self.log_enabled:
+                play_by_play_lines.append(f"{player.name} ({player.piece}) was eliminated!")
 
     def assign_final_placements(self):
         placements = []
         for i, player in enumerate(self.finished_players):
             placements.append((f"{i+1}st", player))
-        remaining_players = sorted([p for p in self.players if not p.finished and p not in self.eliminated_players], key=lambda x: (-x.position, x.player_number))
+        # position_index.order is already leader-first with ties in player
+        # order, i.e. sorted by (-position, player_number).
+        remaining_players = [p for p in self.position_index.order if not p.finished and not p.eliminated]
         for i, player in enumerate(remaining_players):
             placements.append((f"{len(self.finished_players) + i + 1}st", player))
         for i, player in enumerate(reversed(self.eliminated_players)):
@@ -697,9 +1049,10 @@ class Game:
                     if self._recursion_depths['movement'] <= 2:
                         player.move(self, play_by_play_lines, 1)
                         player.ability_activations += 1
-                        play_by_play_lines.append(f"{player.name} ({player.piece}) used ability: Scoocher")
-                        play_by_play_lines.append(f"{player.name} (Scoocher) moved 1 space because another player used their ability.")
-                    else:
+                        if self.log_enabled:
+                            play_by_play_lines.append(f"{player.name} ({player.piece}) used ability: Scoocher")
+                            play_by_play_lines.append(f"{player.name} (Scoocher) moved 1 space because another player used their ability.")
+                    elif self.log_enabled:
                         play_by_play_lines.append(f"WARNING: Movement limit reached for {player.name} (Scoocher). Skipping to prevent recursion.")
         finally:
             # Decrement recursion counter
@@ -711,7 +1064,9 @@ class Game:
             self.turn_order.remove(skipper_index)
             insert_pos = (self.current_player_index + 1) % len(self.turn_order)
             self.turn_order.insert(insert_pos, skipper_index)
-            play_by_play_lines.append(f"Player {skipper.player_number} (Skipper) has changed the turn order to go next!")
+            self._build_phase_participants()
+            if self.log_enabled:
+                play_by_play_lines.append(f"Player {skipper.player_number} (Skipper) has changed the turn order to go next!")
             self.current_player_index = (insert_pos - 1) % len(self.turn_order)
 
     def resolve_phase(self, phase, current_player, play_by_play_lines, context=None):
@@ -733,6 +1088,11 @@ class Game:
         """
         context = context or {}
 
+        # POST_MOVEMENT / OTHER_REACTIONS have no phase action for anyone
+        # (their effects run from inside move()), so there is nothing to do.
+        if phase in _NO_OP_PHASES:
+            return context
+
         # STEP 1: Board effects (Racetrack spaces) - only for POST_MOVEMENT phase
         # Note: Most board effects happen via on_enter() in move() method during MOVEMENT phase
         # This is here for any board effects that need to use the phase system
@@ -755,12 +1115,15 @@ class Game:
                 elif isinstance(result, dict):
                     context.update(result)
 
-        # STEP 3: Other players in turn order (clockwise)
-        for player_index in self.turn_order:
-            other_player = self.players[player_index]
+        # STEP 3: Other players in turn order (clockwise). PRE_ROLL and
+        # MOVEMENT only ever act for the current player.
+        if phase in _CURRENT_PLAYER_ONLY_PHASES:
+            return context
+        table = self.phase_participants
+        for slot, other_player in table[phase]:
             # Other players participate if they have this phase declared
             # (e.g., Gunk modifying rolls, Inchworm reacting to die rolls)
-            if other_player != current_player and phase in other_player.POWER_PHASES:
+            if other_player is not current_player:
                 result = self._execute_phase_action(other_player, phase, current_player,
                                                     play_by_play_lines, context)
                 if result is not None:
@@ -768,9 +1131,67 @@ class Game:
                         context['roll'] = result
                     elif isinstance(result, dict):
                         context.update(result)
+                if self.phase_participants is not table:
+                    # That action changed turn order or someone's class
+                    # (Skipper, a Doppelgangster steal). Finish the phase
+                    # with a live walk of turn_order from the next slot,
+                    # so the change is seen exactly when it used to be.
+                    self._resolve_phase_live(phase, current_player, play_by_play_lines, context, slot + 1)
+                    break
 
         return context
 
+    def _resolve_phase_live(self, phase, current_player, play_by_play_lines, context, start):
+        """STEP 3 of resolve_phase without the dispatch table: walk
+        turn_order from index `start`, re-reading it (and each racer's
+        POWER_PHASES) as actions change them."""
+        i = start
+        while i < len(self.turn_order):
+            other_player = self.players[self.turn_order[i]]
+            i += 1
+            if other_player is not current_player and phase in other_player.POWER_PHASES:
+                result = self._execute_phase_action(other_player, phase, current_player,
+                                                    play_by_play_lines, context)
+                if result is not None:
+                    if isinstance(result, int):
+                        context['roll'] = result
+                    elif isinstance(result, dict):
+                        context.update(result)
+
+    def notify_reaction(self, hook, mover, play_by_play_lines, active_only=True):
+        """Call `hook` (on_another_player_move / on_another_player_jump) on
+        every other racer whose class overrides it, in player order.
+
+        active_only skips finished, eliminated and suppressed racers (the
+        Character.move/jump rule; Leaptoad's own move never filtered). If a
+        reaction rebuilds hook_subscribers (a Doppelgangster steal), the rest
+        of the players are walked live, re-reading each racer's class.
+        """
+        subscribers = self.hook_subscribers[hook]
+        hook_stats = self.hook_stats
+        hook_stats[hook + '_skipped'] += (
+            len(self.players) - len(subscribers) - (hook not in mover._reacts_to)
+        )
+        for other_player in subscribers:
+            if other_player is mover or (active_only and not self._reacts_now(other_player)):
+                continue
+            hook_stats[hook + '_called'] += 1
+            getattr(other_player, hook)(mover, self, play_by_play_lines)
+            if self.hook_subscribers[hook] is not subscribers:
+                i = self.players.index(other_player) + 1
+                while i < len(self.players):
+                    other_player = self.players[i]
+                    i += 1
+                    if (other_player is not mover and hook in other_player._reacts_to
+                            and (not active_only or self._reacts_now(other_player))):
+                        hook_stats[hook + '_called'] += 1
+                        getattr(other_player, hook)(mover, self, play_by_play_lines)
+                return
+
+    def _reacts_now(self, racer):
+        return (not racer.finished and not racer.eliminated
+                and not self.is_power_suppressed_for(racer))
+
     def _execute_phase_action(self, power_owner, phase, current_player,
                              play_by_play_lines, context):
         """Execute the appropriate method for a character in this phase.
@@ -906,6 +1327,8 @@ class _CappedLogList(list):
     appends become no-ops. Used inside run_simulations to keep per-race log
     memory bounded when reactive characters create cascade fan-out."""
 
+    enabled = True
+
     def __init__(self, cap=5000):
         super().__init__()
         self._cap = cap
@@ -923,6 +1346,26 @@ class _CappedLogList(list):
             self.append(item)
 
 
+class NullLog(list):
+    """Play-by-play sink that records nothing.
+
+    `enabled` is False, so Game.run turns off Game.log_enabled and the hot
+    paths skip formatting their lines altogether. Anything that still calls
+    append/extend/insert (rare character-specific lines) is dropped.
+    """
+
+    enabled = False
+
+    def append(self, item):
+        pass
+
+    def extend(self, items):
+        pass
+
+    def insert(self, index, item):
+        pass
+
+
 def _run_single_simulation(character_names, board_type=DEFAULT_BOARD_TYPE, random_turn_order=False):
     play_by_play_lines = []
     game = Game(character_names, board_type=board_type, random_turn_order=random_turn_order)
@@ -931,185 +1374,296 @@ def _run_single_simulation(character_names, board_type=DEFAULT_BOARD_TYPE, rando
     play_by_play_lines.insert(0, f"Board: {game.board.get_display_name()}")
     return turns, final_placements, play_by_play_lines, game.board.board_type
 
-def run_simulations(num_simulations, num_players, board_type=DEFAULT_BOARD_TYPE, fixed_characters=None, random_turn_order=False, collect_detailed_logs=False, allowed_characters=None, speeddemon_threshold=4, speeddemon_starting_points=3, speeddemon_check_timing="start", showoff_threshold=5, random_starting_bronze=True, null_main_move_penalty=1, spoilsport_threshold=5, nemesis_warp_range=5, random_board_pool=None, cheatah_alt_mode=True, forced_twist=None):
-    """Run multiple simulations and return statistics with proper ability tracking.
+# Races are dealt out in fixed-size shards. The shard layout depends only on
+# num_simulations (never on the worker count), so a serial run and a parallel
+# run merge the same per-shard tallies in the same order.
+SHARD_SIZE = 250
 
-    Args:
-        collect_detailed_logs: If True, collects detailed play-by-play logs (memory intensive).
-                               Set to False for production/Streamlit to save memory.
+# Length of run_simulations' default results tuple (average_turns ...
+# watchdog_tally); detailed=True appends standard errors, placement counts
+# and races_run after it.
+RESULTS_TUPLE_LENGTH = 12
+
+# Normal quantile of the 95% confidence intervals used by sequential sampling.
+Z_95 = 1.959964
+
+_MASK64 = (1 << 64) - 1
+
+
+def derive_race_seed(master_seed, race_index):
+    """Derive the seed of race `race_index` in a batch seeded with `master_seed`.
+
+    Uses the SplitMix64 finalizer so neighbouring race indices get unrelated
+    seeds, and any single race can be reproduced without replaying the races
+    before it.
     """
-    # Redirect print output to capture debug statements
-    import io
-    import sys
-    original_stdout = sys.stdout
-    sys.stdout = io.StringIO()
-    
-    try:
-        all_turns = []
-        turns_by_board = {"Mild": [], "Wild": [], "Sportals": [], "Twists": []}
-        finish_positions = {char: [] for char in character_abilities.keys()}
-        ability_activations = {char: [] for char in character_abilities.keys()}
-        appearance_count = {char: 0 for char in character_abilities.keys()}  # Track appearances
-        chip_statistics = {char: [] for char in character_abilities.keys()}  # Track chip statistics
-        bronze_earned_per_race = []  # Total bronze chips earned (race-wide) per race; excludes starting chips
-        win_counts = {char: 0 for char in character_abilities.keys()}  # Track 1st-place finishes
+    z = (master_seed + (race_index + 1) * 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class RaceOutcome:
+    """What _BatchTally keeps from one finished race: everything its
+    aggregates need, without the Game. Small and picklable, so finished
+    races can be stored and re-aggregated later (see race_store).
+
+    chip_stats maps each piece to (gold, silver, bronze, points) deltas;
+    watchdog is (turn_aborts, abilities_off, max_turns_hit); placements are
+    (finish position, piece) pairs. If reading the race's statistics
+    failed, `error` says why and the fields not read yet are None.
+    """
+
+    __slots__ = ('index', 'seed', 'characters', 'board_type', 'turns', 'ability_activations',
+                 'chip_stats', 'bronze_earned', 'watchdog', 'placements', 'error')
+
+    def __init__(self, index, seed, characters, board_type, turns, placements):
+        self.index = index
+        self.seed = seed
+        self.characters = tuple(characters)
+        self.board_type = board_type
+        self.turns = turns
+        self.placements = placements
+        self.ability_activations = None
+        self.chip_stats = None
+        self.bronze_earned = None
+        self.watchdog = None
+        self.error = None
+
+    @classmethod
+    def from_race(cls, race_index, selected_characters, game, turns, final_placements):
+        placements = tuple((int(place[:-2]), player.piece) for place, player in final_placements)
+        outcome = cls(race_index, game.seed, selected_characters, game.board.board_type, turns, placements)
+        try:
+            outcome.ability_activations = game.get_ability_statistics()
+            outcome.chip_stats = {
+                char: tuple(stats[kind] for kind in _BatchTally.CHIP_KINDS)
+                for char, stats in game.get_chip_statistics().items()
+            }
+            outcome.bronze_earned = game.bronze_chips_earned_this_race()
+            wd = game.get_watchdog_summary()
+            outcome.watchdog = (wd['turn_aborts'], wd['abilities_off'], wd['max_turns_hit'])
+        except Exception as e:
+            outcome.error = str(e)
+        return outcome
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+class _BatchTally:
+    """Streaming per-metric aggregates for a slice of a run_simulations batch.
+
+    Each metric is a RunningStat (count, exact total, Welford variance,
+    min/max) rather than a list of samples, so memory stays constant in the
+    number of races. Tallies merge pairwise in shard order, so a serial and
+    a parallel run of the same batch produce identical results.
+    """
+
+    CHIP_KINDS = ('gold', 'silver', 'bronze', 'points')
+
+    def __init__(self, collect_detailed_logs=False):
+        self.collect_detailed_logs = collect_detailed_logs
+        self.turns = RunningStat()
+        self.turns_by_board = {"Mild": RunningStat(), "Wild": RunningStat(), "Sportals": RunningStat(), "Twists": RunningStat()}
+        self.finish_positions = {char: RunningStat() for char in character_abilities.keys()}
+        # Finish position -> count, per character.
+        self.placement_counts = {char: {} for char in character_abilities.keys()}
+        self.ability_activations = {char: RunningStat() for char in character_abilities.keys()}
+        self.appearance_count = {char: 0 for char in character_abilities.keys()}  # Track appearances
+        self.chip_statistics = {}  # char -> {chip kind: RunningStat}; see _chip_stats_for
+        self.bronze_earned = RunningStat()  # Total bronze chips earned (race-wide) per race; excludes starting chips
+        self.win_counts = {char: 0 for char in character_abilities.keys()}  # Track 1st-place finishes
         # Watchdog event tallies across the whole batch (see Game.get_watchdog_summary).
-        watchdog_tally = {
+        self.watchdog_tally = {
             'turn_abort_events': 0,    # total turns aborted (sum across races)
             'races_with_turn_abort': 0,
             'races_abilities_off': 0,  # races that hit ABILITIES_OFF_TURN
             'races_max_turns_hit': 0,  # races that hit the MAX_TURNS hard cap
+            'flagged_race_seeds': [],  # seeds of races with any event above, for replay_race
         }
-
+        # Track board type usage
+        self.board_type_counts = {"Mild": 0, "Wild": 0, "Sportals": 0, "Twists": 0}
         # Only collect detailed logs if requested (saves memory for Streamlit)
-        all_play_by_play = [] if collect_detailed_logs else None
-        complete_logs = [] if collect_detailed_logs else None
+        self.play_by_play = [] if collect_detailed_logs else None
+
+    def _chip_stats_for(self, char):
+        stats = self.chip_statistics.get(char)
+        if stats is None:
+            stats = self.chip_statistics[char] = {kind: RunningStat() for kind in self.CHIP_KINDS}
+        return stats
+
+    def record_race(self, race_index, selected_characters, game, turns, final_placements, play_by_play_lines):
+        """Fold one finished race into the tally."""
+        outcome = RaceOutcome.from_race(race_index, selected_characters, game, turns, final_placements)
+
+        # Debug output - include ability activation counts (only if collecting detailed logs)
+        if self.collect_detailed_logs:
+            debug_info = [f"--- Simulation {race_index+1} ---"]
+            debug_info.append(f"Race seed: {game.seed}")
+            debug_info.append(f"Selected characters: {selected_characters}")
+            debug_info.append("Ability activations:")
+            if outcome.ability_activations is not None:
+                debug_info.append("Ability activations:")
+                for char, count in outcome.ability_activations.items():
+                    debug_info.append(f"  {char}: {count}")
+            if outcome.chip_stats is not None:
+                debug_info.append("Chip statistics:")
+                for char, (gold, silver, bronze, points) in outcome.chip_stats.items():
+                    debug_info.append(f"  {char}: {points} points (G:{gold}, S:{silver}, B:{bronze})")
+            if outcome.error is not None:
+                debug_info.append(f"Error getting statistics: {outcome.error}")
+            self.play_by_play.extend(debug_info)
+            self.play_by_play.extend(play_by_play_lines)
+
+        self.record_outcome(outcome)
+
+    def record_outcome(self, outcome):
+        """Fold one race's RaceOutcome into the tally (record_race for a
+        race played earlier, e.g. one kept by race_store)."""
+        # Track which board type was used
+        if outcome.board_type in self.board_type_counts:
+            self.board_type_counts[outcome.board_type] += 1
+        if outcome.board_type in self.turns_by_board:
+            self.turns_by_board[outcome.board_type].add(outcome.turns)
+
+        # Count appearances for each character in this race
+        for char in outcome.characters:
+            self.appearance_count[char] += 1
+
+        # Fold into the running averages
+        if outcome.ability_activations is not None:
+            for char, count in outcome.ability_activations.items():
+                if char in self.ability_activations:
+                    self.ability_activations[char].add(count)
+
+        # Track chip statistics
+        if outcome.chip_stats is not None:
+            for char, values in outcome.chip_stats.items():
+                running = self._chip_stats_for(char)
+                for kind, value in zip(self.CHIP_KINDS, values):
+                    running[kind].add(value)
+
+        # Race-wide bronze-chips-earned (excludes starting chips,
+        # ignores transfers — see Game.bronze_chips_earned_this_race).
+        if outcome.bronze_earned is not None:
+            self.bronze_earned.add(outcome.bronze_earned)
+
+        # Watchdog tally for this race.
+        if outcome.watchdog is not None:
+            turn_aborts, abilities_off, max_turns_hit = outcome.watchdog
+            if turn_aborts:
+                self.watchdog_tally['turn_abort_events'] += turn_aborts
+                self.watchdog_tally['races_with_turn_abort'] += 1
+            if abilities_off:
+                self.watchdog_tally['races_abilities_off'] += 1
+            if max_turns_hit:
+                self.watchdog_tally['races_max_turns_hit'] += 1
+            if turn_aborts or abilities_off or max_turns_hit:
+                self.watchdog_tally['flagged_race_seeds'].append(outcome.seed)
+
+        self.turns.add(outcome.turns)
+
+        for pos, piece in outcome.placements:
+            self.finish_positions[piece].add(pos)
+            counts = self.placement_counts[piece]
+            counts[pos] = counts.get(pos, 0) + 1
+            if pos == 1:
+                self.win_counts[piece] += 1
+
+    def merge(self, other):
+        """Fold another tally's races in after this one's."""
+        self.turns.merge(other.turns)
+        self.bronze_earned.merge(other.bronze_earned)
+        for bt, stat in other.turns_by_board.items():
+            self.turns_by_board.setdefault(bt, RunningStat()).merge(stat)
+        for bt, count in other.board_type_counts.items():
+            self.board_type_counts[bt] = self.board_type_counts.get(bt, 0) + count
+        for char, stat in other.finish_positions.items():
+            self.finish_positions.setdefault(char, RunningStat()).merge(stat)
+        for char, counts in other.placement_counts.items():
+            mine = self.placement_counts.setdefault(char, {})
+            for pos, count in counts.items():
+                mine[pos] = mine.get(pos, 0) + count
+        for char, stat in other.ability_activations.items():
+            self.ability_activations.setdefault(char, RunningStat()).merge(stat)
+        for char, stats in other.chip_statistics.items():
+            running = self._chip_stats_for(char)
+            for kind in self.CHIP_KINDS:
+                running[kind].merge(stats[kind])
+        for char, count in other.appearance_count.items():
+            self.appearance_count[char] = self.appearance_count.get(char, 0) + count
+        for char, count in other.win_counts.items():
+            self.win_counts[char] = self.win_counts.get(char, 0) + count
+        for key, count in other.watchdog_tally.items():
+            self.watchdog_tally[key] += count
+        if self.collect_detailed_logs and other.play_by_play:
+            self.play_by_play.extend(other.play_by_play)
+
+    def standard_errors(self):
+        """Standard errors of the metrics summarize() averages, keyed the
+        same way (None where there are no samples)."""
+        chip_errors = {}
+        for char in [*character_abilities.keys(), *(c for c in self.chip_statistics if c not in character_abilities)]:
+            stats = self.chip_statistics.get(char)
+            chip_errors[char] = {f'{kind}_se': (stats[kind].std_error if stats else None) for kind in self.CHIP_KINDS}
+        return {
+            'turns': self.turns.std_error,
+            'turns_by_board': {bt: stat.std_error for bt, stat in self.turns_by_board.items()},
+            'finish_positions': {char: stat.std_error for char, stat in self.finish_positions.items()},
+            'win_rates': {
+                char: proportion_std_error(self.win_counts.get(char, 0), count)
+                for char, count in self.appearance_count.items()
+            },
+            'ability_activations': {char: stat.std_error for char, stat in self.ability_activations.items()},
+            'chip_stats': chip_errors,
+            'bronze_earned': self.bronze_earned.std_error,
+        }
 
-        # Track board type usage
-        board_type_counts = {"Mild": 0, "Wild": 0, "Sportals": 0, "Twists": 0}
-        
-        sampling_pool = allowed_characters if allowed_characters else list(character_abilities.keys())
+    def summarize(self, num_simulations, final=True):
+        """Reduce the tally to the run_simulations result tuple. Only a
+        final summary appends the closing lines to the play-by-play."""
+        collect_detailed_logs = self.collect_detailed_logs
+        narrate = collect_detailed_logs and final
+        all_play_by_play = self.play_by_play
+        appearance_count = self.appearance_count
+        board_type_counts = self.board_type_counts
+
+        average_turns = self.turns.total / num_simulations if self.turns.count else 0
+        average_finish_positions = {char: stat.mean for char, stat in self.finish_positions.items()}
 
-        for i in range(num_simulations):
-            selected_characters = fixed_characters if fixed_characters else random.sample(sampling_pool, num_players)
-            
-            # Run the simulation with the specified board type.
-            # Per-race log lines are capped to keep memory bounded with V1+V2
-            # reactive cascades (Mole+Romantic fan-out + bonus turns).
-            game = Game(selected_characters, board_type=board_type, random_turn_order=random_turn_order, speeddemon_threshold=speeddemon_threshold, speeddemon_starting_points=speeddemon_starting_points, speeddemon_check_timing=speeddemon_check_timing, showoff_threshold=showoff_threshold, random_starting_bronze=random_starting_bronze, null_main_move_penalty=null_main_move_penalty, spoilsport_threshold=spoilsport_threshold, nemesis_warp_range=nemesis_warp_range, random_board_pool=random_board_pool, cheatah_alt_mode=cheatah_alt_mode, forced_twist=forced_twist)
-            play_by_play_lines = _CappedLogList(cap=5000) if collect_detailed_logs else _CappedLogList(cap=500)
-            turns, final_placements = game.run(play_by_play_lines)
-            
-            # Add board info to play-by-play
-            play_by_play_lines.insert(0, f"Board: {game.board.get_display_name()}")
-            used_board_type = game.board.board_type
-            
-            # Track which board type was used
-            if used_board_type in board_type_counts:
-                board_type_counts[used_board_type] += 1
-            if used_board_type in turns_by_board:
-                turns_by_board[used_board_type].append(turns)
-                
-            # Count appearances for each character in this race
-            for char in selected_characters:
-                appearance_count[char] += 1
-            
-            # Store the complete logs (only if collecting detailed logs)
-            if collect_detailed_logs:
-                complete_logs.append("\n".join(play_by_play_lines))
-
-            # Debug output - include ability activation counts (only if collecting detailed logs)
-            if collect_detailed_logs:
-                debug_info = [f"--- Simulation {i+1} ---"]
-                debug_info.append(f"Selected characters: {selected_characters}")
-                debug_info.append("Ability activations:")
-            
-            try:
-                # Get the game object from the most recent simulation
-                current_game = game  # This was the issue - 'game' variable wasn't defined in this scope
-
-                # Get ability statistics
-                char_ability_stats = current_game.get_ability_statistics()
-
-                # Debug output (only if collecting detailed logs)
-                if collect_detailed_logs:
-                    debug_info.append("Ability activations:")
-                    for char, count in char_ability_stats.items():
-                        debug_info.append(f"  {char}: {count}")
-
-                # Store for averaging
-                for char, count in char_ability_stats.items():
-                    if char in ability_activations:
-                        ability_activations[char].append(count)
-
-                # Get chip statistics
-                chip_stats = current_game.get_chip_statistics()
-
-                # Debug output (only if collecting detailed logs)
-                if collect_detailed_logs:
-                    debug_info.append("Chip statistics:")
-                    for char, stats in chip_stats.items():
-                        debug_info.append(f"  {char}: {stats['points']} points (G:{stats['gold']}, S:{stats['silver']}, B:{stats['bronze']})")
-
-                # Track chip statistics (we'll add it to the return values)
-                for char, stats in chip_stats.items():
-                    if char not in chip_statistics:
-                        chip_statistics[char] = []
-                    chip_statistics[char].append(stats)
-
-                # Race-wide bronze-chips-earned (excludes starting chips,
-                # ignores transfers — see Game.bronze_chips_earned_this_race).
-                bronze_earned_per_race.append(current_game.bronze_chips_earned_this_race())
-
-                # Watchdog tally for this race.
-                wd = current_game.get_watchdog_summary()
-                if wd['turn_aborts']:
-                    watchdog_tally['turn_abort_events'] += wd['turn_aborts']
-                    watchdog_tally['races_with_turn_abort'] += 1
-                if wd['abilities_off']:
-                    watchdog_tally['races_abilities_off'] += 1
-                if wd['max_turns_hit']:
-                    watchdog_tally['races_max_turns_hit'] += 1
-            except Exception as e:
-                if collect_detailed_logs:
-                    debug_info.append(f"Error getting statistics: {str(e)}")
-
-            # Add debug info to play-by-play (only if collecting detailed logs)
-            if collect_detailed_logs:
-                all_play_by_play.extend(debug_info)
-                all_play_by_play.extend(play_by_play_lines)
-            
-            all_turns.append(turns)
-            
-            for place, player in final_placements:
-                pos = int(place[:-2])
-                finish_positions[player.piece].append(pos)
-                if pos == 1:
-                    win_counts[player.piece] += 1
-        
-        average_turns = sum(all_turns) / num_simulations if all_turns else 0
-        average_finish_positions = {char: (sum(positions) / len(positions)) if positions else None for char, positions in finish_positions.items()}
-        
         # Calculate average ability activations with debug output
         average_ability_activations = {}
-        for char, counts in ability_activations.items():
-            if counts:
-                avg = sum(counts) / len(counts)
+        for char, stat in self.ability_activations.items():
+            if stat.count:
+                avg = stat.mean
                 average_ability_activations[char] = avg
-                if collect_detailed_logs:
+                if narrate:
                     all_play_by_play.append(f"Average ability uses for {char}: {avg:.2f}")
             else:
                 average_ability_activations[char] = 0
-                if collect_detailed_logs:
+                if narrate:
                     all_play_by_play.append(f"No data for {char} ability uses")
-        
+
         # Calculate average chip statistics
         average_chip_stats = {}
-        for char, stats_list in chip_statistics.items():
-            if stats_list:
-                # Calculate averages for each chip type and points
-                total_gold = sum(s['gold'] for s in stats_list)
-                total_silver = sum(s['silver'] for s in stats_list)
-                total_bronze = sum(s['bronze'] for s in stats_list)
-                total_points = sum(s['points'] for s in stats_list)
-                num_appearances = len(stats_list)
-                
-                average_chip_stats[char] = {
-                    'gold_avg': total_gold / num_appearances,
-                    'silver_avg': total_silver / num_appearances,
-                    'bronze_avg': total_bronze / num_appearances,
-                    'points_avg': total_points / num_appearances
-                }
-
-                if collect_detailed_logs:
-                    all_play_by_play.append(f"Average points for {char}: {total_points / num_appearances:.2f}")
+        for char in [*character_abilities.keys(), *(c for c in self.chip_statistics if c not in character_abilities)]:
+            stats = self.chip_statistics.get(char)
+            if stats:
+                average_chip_stats[char] = {f'{kind}_avg': stats[kind].mean for kind in self.CHIP_KINDS}
+                if narrate:
+                    all_play_by_play.append(f"Average points for {char}: {stats['points'].mean:.2f}")
             else:
                 average_chip_stats[char] = {
                     'gold_avg': 0, 'silver_avg': 0, 'bronze_avg': 0, 'points_avg': 0
                 }
 
         # Add character appearance counts to the debug output (only if collecting detailed logs)
-        if collect_detailed_logs:
+        if narrate:
             all_play_by_play.append("\nCharacter appearance counts:")
             for char, count in appearance_count.items():
                 if count > 0:
@@ -1121,22 +1675,294 @@ def run_simulations(num_simulations, num_players, board_type=DEFAULT_BOARD_TYPE,
                 if count > 0:
                     percentage = (count / num_simulations) * 100
                     all_play_by_play.append(f"{board_type} Board: {count} races ({percentage:.1f}%)")
-        
+
         # Return empty list for play-by-play if detailed logs weren't collected
         play_by_play_result = all_play_by_play if collect_detailed_logs else []
-        average_turns_by_board = {
-            bt: (sum(t) / len(t)) if t else None for bt, t in turns_by_board.items()
+        average_turns_by_board = {bt: stat.mean for bt, stat in self.turns_by_board.items()}
+        average_bronze_earned = self.bronze_earned.mean if self.bronze_earned.count else 0
+        max_bronze_earned = self.bronze_earned.max if self.bronze_earned.count else 0
+        return average_turns, average_finish_positions, play_by_play_result, average_ability_activations, appearance_count, average_chip_stats, board_type_counts, self.win_counts, average_turns_by_board, average_bronze_earned, max_bronze_earned, self.watchdog_tally, self.standard_errors(), self.placement_counts
+
+
+
+
+def _play_race(race_seed, num_players, sampling_pool, fixed_characters, game_kwargs, play_by_play_lines):
+    """Draw a lineup and run one race, all from a generator seeded with `race_seed`."""
+    rng = random.Random(race_seed)
+    selected_characters = fixed_characters if fixed_characters else rng.sample(sampling_pool, num_players)
+    game = Game(selected_characters, seed=race_seed, rng=rng, **game_kwargs)
+    turns, final_placements = game.run(play_by_play_lines)
+
+    # Add board info to play-by-play
+    play_by_play_lines.insert(0, f"Board: {game.board.get_display_name()}")
+    return selected_characters, game, turns, final_placements
+
+
+def replay_race(race_seed, num_players=None, fixed_characters=None, allowed_characters=None, play_by_play_lines=None, **game_kwargs):
+    """Re-run a single race from a run_simulations batch.
+
+    Pass the race's seed (see derive_race_seed, the 'Race seed' line in the
+    play-by-play, or watchdog_tally['flagged_race_seeds']) together with the
+    same lineup options and Game settings the batch used. `play_by_play_lines`
+    may be any sink Game.run accepts (e.g. an events.EventLog); defaults to a
+    fresh list.
+
+    Returns:
+        (game, turns, final_placements, play_by_play_lines)
+    """
+    sampling_pool = allowed_characters if allowed_characters else list(character_abilities.keys())
+    if play_by_play_lines is None:
+        play_by_play_lines = []
+    _, game, turns, final_placements = _play_race(race_seed, num_players, sampling_pool, fixed_characters, game_kwargs, play_by_play_lines)
+    return game, turns, final_placements, play_by_play_lines
+
+
+def run_continuations(game, num_continuations, seed=None):
+    """Play `num_continuations` independent continuations of `game` from its
+    current state and return per-racer outcome rates.
+
+    `game` is typically paused mid-race with Game.run(..., stop_after_turn=N)
+    ("who wins from turn 12?") and is left untouched: each continuation is a
+    fork() branched onto its own stream, seeded with derive_race_seed(seed, i),
+    so the result is reproducible for a given seed.
+
+    Returns:
+        {player_number: {'piece', 'wins', 'win_probability',
+                         'mean_placement', 'mean_points'}}
+        where placements are 1-based and points are chips earned this race
+        (as in Game.get_chip_statistics).
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    outcomes = {
+        p.player_number: {'piece': p.piece, 'wins': 0, 'placement_sum': 0, 'points_sum': 0}
+        for p in game.players
+    }
+    with _quiet_stdout():
+        for i in range(num_continuations):
+            branch = game.fork(seed=derive_race_seed(seed, i))
+            _, final_placements = branch.run(NullLog())
+            chip_stats = branch.get_chip_statistics()
+            for place, (_, player) in enumerate(final_placements, start=1):
+                outcome = outcomes[player.player_number]
+                outcome['placement_sum'] += place
+                outcome['points_sum'] += chip_stats[player.piece]['points']
+                if place == 1:
+                    outcome['wins'] += 1
+
+    n = max(num_continuations, 1)
+    return {
+        number: {
+            'piece': outcome['piece'],
+            'wins': outcome['wins'],
+            'win_probability': outcome['wins'] / n,
+            'mean_placement': outcome['placement_sum'] / n,
+            'mean_points': outcome['points_sum'] / n,
         }
-        average_bronze_earned = (
-            sum(bronze_earned_per_race) / len(bronze_earned_per_race)
-            if bronze_earned_per_race else 0
-        )
-        max_bronze_earned = max(bronze_earned_per_race) if bronze_earned_per_race else 0
-        return average_turns, average_finish_positions, play_by_play_result, average_ability_activations, appearance_count, average_chip_stats, board_type_counts, win_counts, average_turns_by_board, average_bronze_earned, max_bronze_earned, watchdog_tally
+        for number, outcome in outcomes.items()
+    }
+
+
+@contextmanager
+def _quiet_stdout():
+    """Discard stdout for the duration. Character code still prints debug
+    lines; batch runners wrap their race loops in this."""
+    original_stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        yield
     finally:
-        # Restore stdout
         sys.stdout = original_stdout
 
+
+def _run_shard(start, stop, master_seed, num_players, sampling_pool, fixed_characters, collect_detailed_logs, game_kwargs):
+    """Run races [start, stop) of a batch and return their _BatchTally.
+
+    Race i runs on its own generator seeded with derive_race_seed(master_seed,
+    i), so the result depends only on the race indices and the master seed,
+    not on which process ran the shard.
+    """
+    with _quiet_stdout():
+        tally = _BatchTally(collect_detailed_logs)
+        for i in range(start, stop):
+            # Per-race log lines are capped to keep memory bounded with V1+V2
+            # reactive cascades (Mole+Romantic fan-out + bonus turns).
+            # Without detailed logs nobody reads the narration, so races
+            # write to a NullLog and skip building it.
+            play_by_play_lines = _CappedLogList(cap=5000) if collect_detailed_logs else NullLog()
+            selected_characters, game, turns, final_placements = _play_race(
+                derive_race_seed(master_seed, i), num_players, sampling_pool, fixed_characters, game_kwargs, play_by_play_lines
+            )
+            tally.record_race(i, selected_characters, game, turns, final_placements, play_by_play_lines)
+        return tally
+
+
+def _run_shard_args(args):
+    return _run_shard(*args)
+
+
+def _win_rates_converged(tally, characters, half_width):
+    """True once every character in `characters` has appeared and the 95%
+    confidence interval on its win rate is within +/- `half_width`.
+
+    Uses the Agresti-Coull adjusted rate (two extra wins and two extra
+    losses), so a character that has not won yet isn't judged perfectly
+    precise after a handful of races."""
+    for char in characters:
+        n = tally.appearance_count.get(char, 0) + 4
+        if n == 4:
+            return False
+        p = (tally.win_counts.get(char, 0) + 2) / n
+        if Z_95 * (p * (1 - p) / n) ** 0.5 > half_width:
+            return False
+    return True
+
+
+def races_for_win_rate_ci(half_width, num_racers, pool_size):
+    """Roughly how many races sequential sampling needs before every win
+    rate is within +/- `half_width`, for `num_racers`-racer lineups drawn
+    from `pool_size` characters (pool_size == num_racers for a fixed lineup).
+
+    Assumes a typical win rate of 1/num_racers; each character then needs
+    p(1-p)(z/half_width)^2 appearances and appears in num_racers/pool_size
+    of the races. Halving the target quadruples the races."""
+    p = 1 / num_racers
+    appearances = p * (1 - p) * (Z_95 / half_width) ** 2
+    return int(appearances * max(pool_size, num_racers) / num_racers + 0.5)
+
+
+def _call(job):
+    function, args = job
+    return function(*args)
+
+
+def _map_shards(function, shard_args, workers, wave=None):
+    """Yield (args, function(*args)) for each shard, in shard order.
+
+    `function` must be module-level so it can be shipped to worker
+    processes. With workers > 1 the shards run on a process pool, submitted
+    `wave` at a time (all at once if None) so a consumer that stops early
+    doesn't leave a long queue behind; closing the generator early cancels
+    every shard that hasn't started and terminates the workers, so shards in
+    flight don't keep burning CPU after a cancel.
+    """
+    if workers and workers > 1 and len(shard_args) > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(min(workers, len(shard_args)))
+        try:
+            step = wave or len(shard_args)
+            for wave_start in range(0, len(shard_args), step):
+                batch = shard_args[wave_start:wave_start + step]
+                # imap() yields in submission order, keeping the merge deterministic.
+                yield from zip(batch, pool.imap(_call, [(function, args) for args in batch]))
+            pool.close()
+            pool.join()
+        finally:
+            # Stopped early (or a shard raised): drop the queued shards and
+            # kill the workers. A no-op once the pool has been joined.
+            pool.terminate()
+    else:
+        for args in shard_args:
+            yield args, function(*args)
+
+
+def iter_simulations(num_simulations, num_players, board_type=DEFAULT_BOARD_TYPE, fixed_characters=None, random_turn_order=False, collect_detailed_logs=False, allowed_characters=None, speeddemon_threshold=4, speeddemon_starting_points=3, speeddemon_check_timing="start", showoff_threshold=5, random_starting_bronze=True, null_main_move_penalty=1, spoilsport_threshold=5, nemesis_warp_range=5, random_board_pool=None, cheatah_alt_mode=True, forced_twist=None, workers=1, seed=None, target_win_rate_ci=None, report_every=SHARD_SIZE):
+    """Generator form of run_simulations: yields the results tuple for the
+    races merged so far, every `report_every` races (rounded up to whole
+    SHARD_SIZE shards; None for the end only), and finally for the whole
+    batch. Items are in run_simulations' detailed form, the last one exactly
+    what run_simulations(..., detailed=True) returns; the races_run element
+    (the last one) says how many races each item covers.
+
+    Partial results are summarized without the closing play-by-play lines,
+    and share the batch's growing play-by-play list. Closing the generator
+    early (e.g. to cancel) stops the batch; with workers > 1 shards that
+    haven't started are dropped. See run_simulations for the arguments.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+
+    game_kwargs = dict(board_type=board_type, random_turn_order=random_turn_order, speeddemon_threshold=speeddemon_threshold, speeddemon_starting_points=speeddemon_starting_points, speeddemon_check_timing=speeddemon_check_timing, showoff_threshold=showoff_threshold, random_starting_bronze=random_starting_bronze, null_main_move_penalty=null_main_move_penalty, spoilsport_threshold=spoilsport_threshold, nemesis_warp_range=nemesis_warp_range, random_board_pool=random_board_pool, cheatah_alt_mode=cheatah_alt_mode, forced_twist=forced_twist)
+    sampling_pool = allowed_characters if allowed_characters else list(character_abilities.keys())
+
+    shard_args = [
+        (start, min(start + SHARD_SIZE, num_simulations), seed, num_players, sampling_pool, fixed_characters, collect_detailed_logs, game_kwargs)
+        for start in range(0, num_simulations, SHARD_SIZE)
+    ]
+    if target_win_rate_ci is not None:
+        characters = sorted(set(fixed_characters)) if fixed_characters else sampling_pool
+        # Convergence is checked after every shard, in shard order, whatever
+        # the worker count; a parallel run computes a wave of shards at a
+        # time and drops any past the stopping point, so it stops on the
+        # same race as a serial run.
+        wave = workers
+    else:
+        wave = None
+
+    tally = _BatchTally(collect_detailed_logs)
+    races_run = 0
+    reported = 0
+    shards = _map_shards(_run_shard, shard_args, workers, wave)
+    try:
+        for args, shard_tally in shards:
+            tally.merge(shard_tally)
+            races_run = args[1]
+            if target_win_rate_ci is not None and _win_rates_converged(tally, characters, target_win_rate_ci):
+                break
+            if report_every and races_run < num_simulations and races_run - reported >= report_every:
+                reported = races_run
+                yield tally.summarize(races_run, final=False) + (races_run,)
+    finally:
+        shards.close()
+    yield tally.summarize(races_run) + (races_run,)
+
+
+def run_simulations(num_simulations, num_players, board_type=DEFAULT_BOARD_TYPE, fixed_characters=None, random_turn_order=False, collect_detailed_logs=False, allowed_characters=None, speeddemon_threshold=4, speeddemon_starting_points=3, speeddemon_check_timing="start", showoff_threshold=5, random_starting_bronze=True, null_main_move_penalty=1, spoilsport_threshold=5, nemesis_warp_range=5, random_board_pool=None, cheatah_alt_mode=True, forced_twist=None, workers=1, seed=None, target_win_rate_ci=None, detailed=False):
+    """Run multiple simulations and return statistics with proper ability tracking.
+
+    Args:
+        collect_detailed_logs: If True, collects detailed play-by-play logs (memory intensive).
+                               Set to False for production/Streamlit to save memory.
+        workers: Number of worker processes. 1 runs everything in-process; more
+                 spreads the SHARD_SIZE-race shards over a process pool.
+        seed: Master seed for the batch. Race i is seeded with
+              derive_race_seed(seed, i), so the same seed gives the same
+              results for any worker count, and any single race can be
+              re-run with replay_race. If None, one is drawn from the
+              global random module.
+        target_win_rate_ci: If set, run sequentially until the 95% confidence
+              interval on every character's win rate is within +/- this
+              fraction (0.005 = 0.5 percentage points), checking after each
+              SHARD_SIZE-race shard; num_simulations becomes the cap. The
+              characters checked are fixed_characters, else the whole
+              sampling pool.
+
+        detailed: If True, the averages tuple is followed by standard_errors
+              (the standard error of each average, keyed like the averages;
+              see _BatchTally.standard_errors), placement_counts, a
+              {character: {finish position: races}} histogram, and
+              races_run, the number of races actually played (fewer than
+              num_simulations when target_win_rate_ci is met early).
+
+    Returns the averages tuple (average_turns ... watchdog_tally). Aggregates stream
+    (online_stats.RunningStat), so memory doesn't grow with num_simulations
+    unless collect_detailed_logs is on.
+    """
+    results = None
+    for results in iter_simulations(
+        num_simulations, num_players, board_type=board_type, fixed_characters=fixed_characters,
+        random_turn_order=random_turn_order, collect_detailed_logs=collect_detailed_logs,
+        allowed_characters=allowed_characters, speeddemon_threshold=speeddemon_threshold,
+        speeddemon_starting_points=speeddemon_starting_points, speeddemon_check_timing=speeddemon_check_timing,
+        showoff_threshold=showoff_threshold, random_starting_bronze=random_starting_bronze,
+        null_main_move_penalty=null_main_move_penalty, spoilsport_threshold=spoilsport_threshold,
+        nemesis_warp_range=nemesis_warp_range, random_board_pool=random_board_pool,
+        cheatah_alt_mode=cheatah_alt_mode, forced_twist=forced_twist, workers=workers, seed=seed,
+        target_win_rate_ci=target_win_rate_ci, report_every=None,
+    ):
+        pass
+    return results if detailed else results[:RESULTS_TUPLE_LENGTH]
+
 def write_summary_to_file(filename, num_simulations, num_players, selected_characters, average_turns, average_finish_positions):
     with open(filename, 'w') as file:
         file.write(f"Number of simulations: {num_simulations}\nNumber of players: {num_players}\n")
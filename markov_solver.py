@@ -0,0 +1,165 @@
+# markov_solver.py
+#
+# Exact pacing baselines for racers with no power.
+#
+# A plain racer's progress depends only on its own dice and the board: the
+# Wild board's move and trip spaces, the Sportals warps, and the finish line
+# (bronze chip spaces and the corner don't move anyone). Turn by turn that is
+# a small Markov chain over (position, tripped) states, so the distribution of
+# turns-to-finish can be computed exactly instead of sampled. And since plain
+# racers never interact, the win and silver probabilities of N of them follow
+# from those distributions plus the turn order.
+#
+# Landings are resolved with the engine's rules for a lone plain racer:
+# positions clamp to [0, board.length], a move space starts a nested move, a
+# portal warps to its partner (without warping back), a trip space makes the
+# racer skip their next main move, and nested moves stop at the engine's
+# movement recursion cap. Twists are not modelled — on a Twists board this is
+# the chain before (or without) a twist.
+#
+# Everything is cached per board layout, so the same layout is only solved
+# once per process.
+
+from board import MAX_MOVE_DEPTH
+from config import MAX_TURNS
+
+DIE_FACES = (1, 2, 3, 4, 5, 6)
+_TAIL_TOLERANCE = 1e-15  # stop once this much probability is left unfinished
+
+_solutions = {}  # layout key -> _Solution
+
+
+def layout_key(board):
+    """Hashable description of everything on `board` that affects a plain
+    racer's movement."""
+    spaces = []
+    for space in board.spaces:
+        if space.space_type == "move":
+            spaces.append(("move", space.value))
+        elif space.space_type == "portal":
+            spaces.append(("portal", space.partner))
+        elif space.space_type == "trip":
+            spaces.append(("trip",))
+        else:
+            spaces.append(None)
+    return (board.length, tuple(spaces))
+
+
+def resolve_landing(board, position, spaces, depth=0):
+    """Where a lone plain racer on `position` ends up after moving `spaces`,
+    following board spaces. Returns (final_position, tripped); a
+    final_position of board.length means they finished."""
+    if spaces == 0 or depth >= MAX_MOVE_DEPTH:
+        return position, False
+    length = board.length
+    position = max(0, min(position + spaces, length))
+    if position >= length:
+        return length, False
+    space = board.spaces[position]
+    if space.space_type == "trip":
+        return position, True
+    if space.space_type == "move":
+        return resolve_landing(board, position, space.value, depth + 1)
+    if space.space_type == "portal":
+        # The warp is a jump; the partner portal doesn't send them back.
+        return space.partner, False
+    return position, False
+
+
+class _Solution:
+    """Turn-by-turn finishing probabilities for one board layout."""
+
+    def __init__(self, board):
+        self.length = board.length
+        # transitions[position] -> [(probability, next_position, tripped)]
+        self.transitions = []
+        for position in range(board.length):
+            outcomes = {}
+            for roll in DIE_FACES:
+                landing = resolve_landing(board, position, roll)
+                outcomes[landing] = outcomes.get(landing, 0.0) + 1 / len(DIE_FACES)
+            self.transitions.append([(p, pos, tripped) for (pos, tripped), p in outcomes.items()])
+        self.finish_pmf = self._finish_pmf()
+
+    def _finish_pmf(self):
+        """[P(finish on own turn t)] for t = 1, 2, ... (index 0 is turn 1)."""
+        current = {(0, False): 1.0}
+        pmf = []
+        remaining = 1.0
+        while remaining > _TAIL_TOLERANCE and len(pmf) < 10 * MAX_TURNS:
+            following = {}
+            finished = 0.0
+            for (position, tripped), mass in current.items():
+                if tripped:
+                    # Tripped: skip this main move, the trip is used up.
+                    following[(position, False)] = following.get((position, False), 0.0) + mass
+                    continue
+                for p, landing, trips in self.transitions[position]:
+                    if landing >= self.length:
+                        finished += mass * p
+                    else:
+                        state = (landing, trips)
+                        following[state] = following.get(state, 0.0) + mass * p
+            pmf.append(finished)
+            remaining -= finished
+            current = following
+        return pmf
+
+
+def _solve(board):
+    key = layout_key(board)
+    solution = _solutions.get(key)
+    if solution is None:
+        solution = _solutions[key] = _Solution(board)
+    return solution
+
+
+def turns_to_finish(board):
+    """Exact distribution of a plain racer's turns to finish on `board`.
+
+    Returns a list where entry t-1 is P(finishing on their t-th turn). The
+    tail is truncated once less than 1e-15 probability remains."""
+    return list(_solve(board).finish_pmf)
+
+
+def expected_turns_to_finish(board):
+    """Mean of turns_to_finish(board)."""
+    return sum(t * p for t, p in enumerate(_solve(board).finish_pmf, start=1))
+
+
+def placement_probabilities(board, num_racers):
+    """Exact gold/silver odds for `num_racers` plain racers on `board`, by
+    seat in turn order (seat 0 moves first each round).
+
+    The first two racers to finish take gold and silver, and within a round
+    an earlier seat finishes first. Returns
+    [{'1st': p, '2nd': p, 'unplaced': p}, ...] indexed by seat; 'unplaced'
+    is the chance of neither chip."""
+    pmf = _solve(board).finish_pmf
+    # P(T <= t) and P(T < t) for t = 1..len(pmf); T counts own turns.
+    at_most = []
+    total = 0.0
+    for p in pmf:
+        total += p
+        at_most.append(total)
+    before = [0.0] + at_most[:-1]
+
+    results = []
+    for seat in range(num_racers):
+        first = 0.0
+        second = 0.0
+        for t, p in enumerate(pmf):
+            if p == 0.0:
+                continue
+            # Others that finish ahead of this seat if it finishes on turn t:
+            # earlier seats finishing by turn t, later seats by turn t - 1.
+            ahead = [at_most[t] if other < seat else before[t]
+                     for other in range(num_racers) if other != seat]
+            # Distribution of how many finish ahead, capped at 2.
+            none, one = 1.0, 0.0
+            for q in ahead:
+                none, one = none * (1 - q), one * (1 - q) + none * q
+            first += p * none
+            second += p * one
+        results.append({'1st': first, '2nd': second, 'unplaced': max(0.0, 1 - first - second)})
+    return results
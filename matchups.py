@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Head-to-head matchup matrix between characters, per board type.
+
+Each cell is a pair of characters and the races they shared: how often
+each finished ahead of the other. With --lineup 2 every race is a straight
+duel; with a larger lineup each race adds random other racers from the
+pool (the field), and the cell counts only the pair's relative finish.
+Win rates split ties (neither finished ahead, e.g. both eliminated) evenly.
+
+A pair's races are seeded from the matrix seed, the board and the two
+names, so a cell comes out the same whenever and wherever it is computed.
+That makes the matrix incremental: it is stored on disk with the source
+fingerprint of every character (see results_cache), and updating it only
+recomputes the cells of characters whose source changed (their row and
+column) or that are new. An engine change recomputes everything. With a
+larger lineup, changes to the field's characters don't invalidate a cell.
+
+Matrices are JSON files in MATCHUP_DIR, one per board, lineup size, races
+per pair and seed, which app.py loads directly for its heatmap.
+
+Usage:
+  python matchups.py --board Mild [--races 200] [--lineup 2] [--workers 4]
+                     [--seed 0] [--characters Banana,HugeBaby,...]
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import tempfile
+from config import character_abilities, DEFAULT_BOARD_TYPE
+from game_simulation import NullLog, _map_shards, _play_race, _quiet_stdout, derive_race_seed
+from results_cache import CACHE_DIR, character_fingerprint, engine_fingerprint
+
+MATCHUP_DIR = os.path.join(CACHE_DIR, "matchups")
+
+# Pairs computed between saves of the matrix file, so an interrupted
+# update keeps most of its work.
+SAVE_EVERY = 50
+
+
+class MatchupMatrix:
+    """Pairwise finish counts for one board, lineup size, races per pair
+    and seed. cells maps (a, b), a < b, to [a ahead, b ahead, races]."""
+
+    def __init__(self, board_type, lineup_size, races_per_pair, seed):
+        self.board_type = board_type
+        self.lineup_size = lineup_size
+        self.races_per_pair = races_per_pair
+        self.seed = seed
+        self.engine = None
+        self.field = None        # pool hash; the field matters above 2 racers
+        self.characters = {}     # name -> source fingerprint the cells used
+        self.cells = {}
+
+    def counts(self, a, b):
+        """(a ahead, b ahead, races) for the pair, or None if not computed."""
+        if a < b:
+            return self.cells.get((a, b))
+        cell = self.cells.get((b, a))
+        return (cell[1], cell[0], cell[2]) if cell else None
+
+    def win_rate(self, a, b):
+        """Share of their shared races `a` finished ahead of `b` (ties count
+        half), or None if the pair hasn't been computed."""
+        cell = self.counts(a, b)
+        if not cell or not cell[2]:
+            return None
+        a_ahead, b_ahead, races = cell
+        return (a_ahead + (races - a_ahead - b_ahead) / 2) / races
+
+    def names(self):
+        return sorted({name for pair in self.cells for name in pair})
+
+    def rows(self):
+        """Every computed cell in both orientations, as dicts."""
+        for a, b in self.cells:
+            for character, opponent in ((a, b), (b, a)):
+                ahead, behind, races = self.counts(character, opponent)
+                yield {
+                    'character': character,
+                    'opponent': opponent,
+                    'win_rate': self.win_rate(character, opponent),
+                    'ahead': ahead,
+                    'behind': behind,
+                    'races': races,
+                }
+
+    def to_dict(self):
+        return {
+            'board_type': self.board_type,
+            'lineup_size': self.lineup_size,
+            'races_per_pair': self.races_per_pair,
+            'seed': self.seed,
+            'engine': self.engine,
+            'field': self.field,
+            'characters': self.characters,
+            'cells': [[a, b, *cell] for (a, b), cell in sorted(self.cells.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        matrix = cls(data['board_type'], data['lineup_size'], data['races_per_pair'], data['seed'])
+        matrix.engine = data.get('engine')
+        matrix.field = data.get('field')
+        matrix.characters = dict(data.get('characters', {}))
+        matrix.cells = {(a, b): [a_ahead, b_ahead, races] for a, b, a_ahead, b_ahead, races in data.get('cells', [])}
+        return matrix
+
+    def save(self, path):
+        """Write the matrix to `path` (atomically)."""
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(self.to_dict(), file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """The matrix stored at `path`, or None if there is none."""
+        try:
+            with open(path) as file:
+                return cls.from_dict(json.load(file))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+
+def matchup_path(board_type, lineup_size=2, races_per_pair=200, seed=0, directory=None):
+    """Where the matrix for these settings is stored."""
+    name = f"{board_type}-{lineup_size}racers-{races_per_pair}races-seed{seed}.json"
+    return os.path.join(directory or MATCHUP_DIR, name)
+
+
+def stored_matrices(directory=None):
+    """Paths of every stored matrix, newest first."""
+    directory = directory or MATCHUP_DIR
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(".json")]
+    except OSError:
+        return []
+    paths = [os.path.join(directory, name) for name in names]
+    return sorted(paths, key=os.path.getmtime, reverse=True)
+
+
+def _pair_seed(seed, board_type, a, b):
+    text = json.dumps([seed, board_type, a, b])
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+
+
+def _run_pair(a, b, pair_seed, races, lineup_size, field, game_kwargs):
+    """Play one pair's races and return (a, b, a ahead, b ahead, races)."""
+    with _quiet_stdout():
+        others = [name for name in field if name != a and name != b]
+        a_ahead = b_ahead = 0
+        for i in range(races):
+            race_seed = derive_race_seed(pair_seed, i)
+            lineup = [a, b]
+            if lineup_size > 2:
+                lineup += random.Random(derive_race_seed(race_seed, 0)).sample(others, lineup_size - 2)
+            _, _, _, final_placements = _play_race(race_seed, len(lineup), None, lineup, game_kwargs, NullLog())
+            order = [player.piece for _, player in final_placements]
+            a_index, b_index = order.index(a), order.index(b)
+            if a_index < b_index:
+                a_ahead += 1
+            elif b_index < a_index:
+                b_ahead += 1
+        return a, b, a_ahead, b_ahead, races
+
+
+def update_matchups(board_type=DEFAULT_BOARD_TYPE, races_per_pair=200, lineup_size=2, characters=None,
+                    workers=1, seed=0, directory=None, progress=None):
+    """Bring the stored matrix for these settings up to date with the
+    current sources and return (matrix, pairs computed).
+
+    Args:
+        characters: Names to cover (default: every registered character).
+                    With lineup_size > 2 they are also the field.
+        progress: Optional callable(done_pairs, total_pairs).
+    """
+    characters = sorted(characters or character_abilities)
+    if lineup_size < 2 or lineup_size > len(characters):
+        raise ValueError(f"lineup_size must be between 2 and {len(characters)}")
+    path = matchup_path(board_type, lineup_size, races_per_pair, seed, directory)
+    matrix = MatchupMatrix.load(path) or MatchupMatrix(board_type, lineup_size, races_per_pair, seed)
+
+    engine = engine_fingerprint()
+    field = hashlib.sha256(json.dumps(characters).encode()).hexdigest() if lineup_size > 2 else None
+    if matrix.engine != engine or matrix.field != field:
+        matrix.cells.clear()
+        matrix.characters.clear()
+    matrix.engine, matrix.field = engine, field
+
+    # Drop the row and column of every character whose source changed
+    # (or that is no longer registered).
+    fingerprints = {name: character_fingerprint(name) for name in set(characters) | set(matrix.characters)}
+    stale = {name for name, fingerprint in matrix.characters.items() if fingerprints[name] != fingerprint}
+    matrix.cells = {pair: cell for pair, cell in matrix.cells.items() if not stale.intersection(pair)}
+    for name in stale:
+        del matrix.characters[name]
+
+    pending = [pair for pair in itertools.combinations(characters, 2) if pair not in matrix.cells]
+    game_kwargs = dict(board_type=board_type, random_turn_order=True)
+    jobs = [(a, b, _pair_seed(seed, board_type, a, b), races_per_pair, lineup_size, characters, game_kwargs)
+            for a, b in pending]
+
+    done = 0
+
+    def finish(result):
+        nonlocal done
+        a, b, a_ahead, b_ahead, races = result
+        matrix.cells[(a, b)] = [a_ahead, b_ahead, races]
+        matrix.characters[a], matrix.characters[b] = fingerprints[a], fingerprints[b]
+        done += 1
+        if done % SAVE_EVERY == 0:
+            matrix.save(path)
+        if progress:
+            progress(done, len(jobs))
+
+    for _, result in _map_shards(_run_pair, jobs, workers):
+        finish(result)
+    for name in characters:
+        matrix.characters.setdefault(name, fingerprints[name])
+    matrix.save(path)
+    return matrix, len(jobs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute or update the head-to-head matchup matrix for a board.")
+    parser.add_argument('--board', default=DEFAULT_BOARD_TYPE)
+    parser.add_argument('--races', type=int, default=200, help="races per pair")
+    parser.add_argument('--lineup', type=int, default=2, help="racers per race (the pair plus random others)")
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--characters', help="comma-separated names (default: all)")
+    args = parser.parse_args(argv)
+
+    characters = [name.strip() for name in args.characters.split(',')] if args.characters else None
+    unknown = [name for name in characters or () if name not in character_abilities]
+    if unknown:
+        parser.error(f"unknown characters: {', '.join(unknown)}")
+
+    def report(done, total):
+        if done % 100 == 0 or done == total:
+            print(f"  {done}/{total} pairs", flush=True)
+
+    matrix, computed = update_matchups(args.board, args.races, args.lineup, characters, workers=args.workers,
+                                       seed=args.seed, progress=report)
+    path = matchup_path(args.board, args.lineup, args.races, args.seed)
+    print(f"Computed {computed} pairs ({len(matrix.cells) - computed} up to date) -> {path}")
+    field = {}
+    for row in matrix.rows():
+        field.setdefault(row['character'], []).append(row['win_rate'])
+    print(f"{'Character':<16} {'mean head-to-head win %':>24}")
+    for name, rates in sorted(field.items(), key=lambda item: -sum(item[1]) / len(item[1])):
+        print(f"{name:<16} {sum(rates) / len(rates) * 100:>24.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
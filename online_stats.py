@@ -0,0 +1,88 @@
+# online_stats.py
+#
+# Constant-memory accumulators for run_simulations. A batch used to keep
+# every sample (a list of turn counts, finish positions, ability counts and
+# a chip-stats dict per racer appearance) and only average them at the end;
+# RunningStat folds each sample in as it arrives, so a million-race run
+# needs a few counters per metric instead of millions of list entries.
+#
+# Variance uses Welford's update, and merge() combines two accumulators
+# with Chan et al.'s pairwise formula, so shard tallies still merge in any
+# worker layout. The mean is kept as an exact running total over count
+# rather than Welford's running mean: every engine metric is an integer,
+# so averages come out bit-for-bit identical to the old sum(list) / len(list).
+
+
+class RunningStat:
+    """Count, mean, variance, min and max of a stream of numbers."""
+
+    __slots__ = ('count', 'total', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.m2 = 0.0  # sum of squared deviations from the mean
+        self.min = None
+        self.max = None
+
+    def add(self, x):
+        count = self.count
+        if count:
+            delta = x - self.total / count
+            self.count = count + 1
+            self.total += x
+            self.m2 += delta * (x - self.total / self.count)
+            if x < self.min:
+                self.min = x
+            elif x > self.max:
+                self.max = x
+        else:
+            self.count = 1
+            self.total = x
+            self.min = self.max = x
+
+    def merge(self, other):
+        """Fold another accumulator's samples into this one."""
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.total, self.m2 = other.count, other.total, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        delta = other.total / other.count - self.total / self.count
+        count = self.count + other.count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self):
+        """Mean of the samples, or None if there are none."""
+        return self.total / self.count if self.count else None
+
+    @property
+    def variance(self):
+        """Sample variance (n - 1 denominator); 0.0 below two samples."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self):
+        return self.variance ** 0.5
+
+    @property
+    def std_error(self):
+        """Standard error of the mean, or None if there are no samples."""
+        return (self.variance / self.count) ** 0.5 if self.count else None
+
+    def __repr__(self):
+        return f"RunningStat(count={self.count}, mean={self.mean}, std={self.std:.4g}, min={self.min}, max={self.max})"
+
+
+def proportion_std_error(successes, trials):
+    """Standard error of a rate estimated as successes / trials."""
+    if not trials:
+        return None
+    p = successes / trials
+    return (p * (1 - p) / trials) ** 0.5
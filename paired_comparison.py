@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Paired A/B comparison of Game rule settings.
+
+Comparing two tuning settings (showoff_threshold, null_main_move_penalty,
+cheatah_alt_mode, ...) with two independent run_simulations batches buries
+the difference in race-to-race noise. Here every race is played twice from
+the same race seed — once with variant A, once with variant B — so both
+see the same lineup, seats, board and dice stream (until the rule change
+itself makes the races diverge). Per-character deltas are then averaged
+over those pairs, and their confidence intervals only carry the noise the
+rule change adds, not the noise of the races themselves.
+
+For each metric the result also reports variance_ratio: the variance two
+independent batches would have on the difference over the paired variance.
+That's how many times more races the unpaired comparison would need for
+the same confidence interval.
+
+Usage: python paired_comparison.py num_races num_racers "A settings" "B settings"
+  e.g. python paired_comparison.py 2000 5 "showoff_threshold=5" "showoff_threshold=4"
+Settings are comma-separated Game keyword arguments (Python literals).
+"""
+
+import ast
+import sys
+from config import character_abilities, DEFAULT_BOARD_TYPE
+from game_simulation import NullLog, SHARD_SIZE, Z_95, _map_shards, _play_race, _quiet_stdout, derive_race_seed
+from online_stats import RunningStat
+
+# Per-appearance metrics: won (0/1), finish position, chip points this race.
+METRICS = ('win_rate', 'position', 'points')
+
+
+class _PairedTally:
+    """Per-character RunningStats of variant A, variant B and their paired
+    difference, for a slice of races."""
+
+    def __init__(self):
+        self.stats = {}  # char -> {metric: {'a', 'b', 'delta': RunningStat}}
+
+    def _stats_for(self, char):
+        stats = self.stats.get(char)
+        if stats is None:
+            stats = self.stats[char] = {
+                metric: {'a': RunningStat(), 'b': RunningStat(), 'delta': RunningStat()} for metric in METRICS
+            }
+        return stats
+
+    def record(self, outcome_a, outcome_b):
+        """Fold one pair of races (see _race_outcome) into the tally."""
+        for char, values_a in outcome_a.items():
+            values_b = outcome_b.get(char)
+            if values_b is None:
+                continue
+            stats = self._stats_for(char)
+            for metric, a, b in zip(METRICS, values_a, values_b):
+                running = stats[metric]
+                running['a'].add(a)
+                running['b'].add(b)
+                running['delta'].add(b - a)
+
+    def merge(self, other):
+        for char, stats in other.stats.items():
+            mine = self._stats_for(char)
+            for metric in METRICS:
+                for side in ('a', 'b', 'delta'):
+                    mine[metric][side].merge(stats[metric][side])
+
+
+def _race_outcome(race_seed, num_players, sampling_pool, fixed_characters, game_kwargs):
+    """{piece: (won, finish position, points)} for one race."""
+    _, game, _, final_placements = _play_race(
+        race_seed, num_players, sampling_pool, fixed_characters, game_kwargs, NullLog()
+    )
+    chip_stats = game.get_chip_statistics()
+    outcome = {}
+    for place, player in final_placements:
+        pos = int(place[:-2])
+        outcome[player.piece] = (1 if pos == 1 else 0, pos, chip_stats[player.piece]['points'])
+    return outcome
+
+
+def _run_paired_shard(start, stop, master_seed, num_players, sampling_pool, fixed_characters, kwargs_a, kwargs_b):
+    """Play races [start, stop) under both variants and return their
+    _PairedTally."""
+    with _quiet_stdout():
+        tally = _PairedTally()
+        for i in range(start, stop):
+            race_seed = derive_race_seed(master_seed, i)
+            tally.record(
+                _race_outcome(race_seed, num_players, sampling_pool, fixed_characters, kwargs_a),
+                _race_outcome(race_seed, num_players, sampling_pool, fixed_characters, kwargs_b),
+            )
+        return tally
+
+
+def run_paired_comparison(num_simulations, num_players, variant_a, variant_b, board_type=DEFAULT_BOARD_TYPE,
+                          fixed_characters=None, allowed_characters=None, random_turn_order=True,
+                          random_board_pool=None, workers=1, seed=None, **shared_settings):
+    """Play `num_simulations` races under both rule variants, pairing race i
+    of A with race i of B on the same seed, and compare per character.
+
+    Args:
+        variant_a, variant_b: Game keyword arguments that differ between the
+            variants, e.g. {'showoff_threshold': 5} vs {'showoff_threshold': 4}.
+        shared_settings: Other Game keyword arguments, applied to both.
+        workers, seed: As in run_simulations (same shards, same race seeds).
+
+    Returns:
+        {character: {'races': n, 'win_rate' | 'position' | 'points': {
+            'a', 'b': variant means,
+            'delta': mean of B - A over the paired appearances,
+            'ci': 95% confidence half-width of delta,
+            'variance_ratio': unpaired / paired variance of the difference
+                              (None if the paired variance is 0)}}}
+        for every character that raced. win_rate is a fraction, position
+        is the 1-based finish position, points are chips earned this race.
+    """
+    import random
+    if seed is None:
+        seed = random.getrandbits(64)
+    base_kwargs = dict(board_type=board_type, random_turn_order=random_turn_order,
+                       random_board_pool=random_board_pool, **shared_settings)
+    kwargs_a = {**base_kwargs, **variant_a}
+    kwargs_b = {**base_kwargs, **variant_b}
+    sampling_pool = allowed_characters if allowed_characters else list(character_abilities.keys())
+
+    shard_args = [
+        (start, min(start + SHARD_SIZE, num_simulations), seed, num_players, sampling_pool, fixed_characters, kwargs_a, kwargs_b)
+        for start in range(0, num_simulations, SHARD_SIZE)
+    ]
+    tally = _PairedTally()
+    for _, shard_tally in _map_shards(_run_paired_shard, shard_args, workers):
+        tally.merge(shard_tally)
+
+    results = {}
+    for char, stats in tally.stats.items():
+        summary = {'races': stats['win_rate']['delta'].count}
+        for metric in METRICS:
+            a, b, delta = stats[metric]['a'], stats[metric]['b'], stats[metric]['delta']
+            unpaired = a.variance + b.variance
+            summary[metric] = {
+                'a': a.mean,
+                'b': b.mean,
+                'delta': delta.mean,
+                'ci': Z_95 * delta.std_error,
+                'variance_ratio': unpaired / delta.variance if delta.variance else None,
+            }
+        results[char] = summary
+    return results
+
+
+def _parse_settings(text):
+    """'showoff_threshold=4, cheatah_alt_mode=False' -> Game kwargs."""
+    settings = {}
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        key, _, value = item.partition('=')
+        try:
+            settings[key.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            settings[key.strip()] = value.strip()
+    return settings
+
+
+def main(argv):
+    if len(argv) != 4:
+        print(__doc__)
+        return 2
+    num_races, num_racers = int(argv[0]), int(argv[1])
+    variant_a, variant_b = _parse_settings(argv[2]), _parse_settings(argv[3])
+    results = run_paired_comparison(num_races, num_racers, variant_a, variant_b, seed=0)
+
+    print("="*78)
+    print("MAGICAL ATHLETE - PAIRED RULE COMPARISON")
+    print("="*78)
+    print(f"A: {variant_a}")
+    print(f"B: {variant_b}")
+    print(f"{num_races} paired races x {num_racers} racers")
+    print()
+    print(f"{'Character':<16} {'races':>6} {'win A%':>7} {'win B%':>7} {'Δwin pp':>14} {'Δpoints':>14} {'× races':>8}")
+    print("-"*78)
+    for char, summary in sorted(results.items(), key=lambda item: item[1]['win_rate']['delta']):
+        win, points = summary['win_rate'], summary['points']
+        ratio = win['variance_ratio']
+        print(f"{char:<16} {summary['races']:>6} {win['a'] * 100:>7.2f} {win['b'] * 100:>7.2f} "
+              f"{win['delta'] * 100:>+7.2f}±{win['ci'] * 100:<5.2f} "
+              f"{points['delta']:>+7.2f}±{points['ci']:<5.2f} "
+              f"{(f'{ratio:.1f}' if ratio is not None else '—'):>8}")
+    print()
+    print("± is the 95% paired confidence half-width; × races is how many times")
+    print("more races two independent batches would need for the same interval.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,153 @@
+# position_index.py
+#
+# Incrementally maintained spatial index over a race's racers, so rank,
+# pass and shared-space queries don't each rescan game.players.
+#
+# Every write to a racer's `position` goes through the TrackedPosition
+# descriptor on Character, which forwards (old, new) to the owning game's
+# PositionIndex. That covers move/jump/swap_positions as well as the direct
+# writes in Leaptoad, Suckerfish, NepoBaby, the Mirror World / Season Finale
+# twists and the position setups in verify_abilities.py.
+#
+# The index holds every racer, finished and eliminated ones included, so
+# callers still apply their own activity filters. Results that come back as
+# lists are in player order (game.players order) wherever the original scan
+# would have produced that order, so RNG tie-breaks and reaction order are
+# unchanged.
+
+from state_hash import POSITION, zobrist_key
+
+
+class TrackedPosition:
+    """Data descriptor for Character.position.
+
+    Defines __set__ but no __get__, so reads are plain instance-dict lookups
+    (no call overhead on the hottest attribute in the engine) while writes
+    also update the racer's PositionIndex and StateHash, if it has them."""
+
+    def __set__(self, racer, value):
+        state = racer.__dict__
+        old = state.get('position')
+        state['position'] = value
+        if old == value:
+            return
+        tracker = racer._state_hash
+        if tracker is not None:
+            slot = racer._index_slot
+            tracker.value ^= zobrist_key(slot, POSITION, old) ^ zobrist_key(slot, POSITION, value)
+        index = racer._position_index
+        if index is None:
+            return
+        # PositionIndex.moved, inlined: this runs on every position write.
+        at = index.at
+        at[old].remove(racer)
+        here = at.get(value)
+        if here:
+            _insert_by_slot(here, racer)
+        else:
+            at[value] = [racer]
+        index._order = None
+
+
+def _slot(racer):
+    return racer._index_slot
+
+
+def _insert_by_slot(racers, racer):
+    """Insert `racer` into `racers`, kept in player order. The lists are a
+    handful of racers on one space, so a backwards scan beats bisect (whose
+    key= argument would also need Python 3.10)."""
+    slot = racer._index_slot
+    i = len(racers)
+    while i and racers[i - 1]._index_slot > slot:
+        i -= 1
+    racers.insert(i, racer)
+
+
+class PositionIndex:
+    """Position -> racers map plus a lazily re-sorted standings order.
+
+    `at` maps each occupied position to its racers in player order and is
+    updated on every position write. The standings order (leader first,
+    ties in player order — the key assign_final_placements uses) is only
+    needed by rank queries, which are rare next to position writes, so it
+    is re-sorted on demand after the positions change."""
+
+    def __init__(self, players):
+        self.players = players
+        self.at = {}
+        for slot, racer in enumerate(players):
+            racer._index_slot = slot
+            _insert_by_slot(self.at.setdefault(racer.position, []), racer)
+            racer._position_index = self
+        self._order = None
+
+    def moved(self, racer, old, new):
+        self.at[old].remove(racer)
+        here = self.at.get(new)
+        if here:
+            _insert_by_slot(here, racer)
+        else:
+            self.at[new] = [racer]
+        self._order = None
+
+    # -- queries -------------------------------------------------------------
+    def racers_at(self, position):
+        """Racers on `position`, in player order. Do not mutate."""
+        return self.at.get(position, ())
+
+    def racers_between(self, low, high):
+        """Racers strictly between `low` and `high`, in player order."""
+        return self._collect(low + 1, high)
+
+    def racers_within(self, position, distance):
+        """Racers within `distance` spaces of `position` (inclusive), in
+        player order."""
+        return self._collect(position - distance, position + distance + 1)
+
+    def _collect(self, start, stop):
+        at = self.at
+        if stop - start > len(at):
+            # Wide range: walk the occupied positions instead.
+            groups = [racers for position, racers in at.items() if start <= position < stop and racers]
+        else:
+            groups = [at[position] for position in range(start, stop) if at.get(position)]
+        if not groups:
+            return []
+        if len(groups) == 1:
+            return list(groups[0])
+        found = [racer for racers in groups for racer in racers]
+        found.sort(key=_slot)
+        return found
+
+    @property
+    def order(self):
+        """Every racer, leader first, ties in player order."""
+        if self._order is None:
+            self._order = sorted(self.players, key=lambda racer: (-racer.position, racer._index_slot))
+        return self._order
+
+    def leaders(self, is_candidate):
+        """Candidates tied for the furthest position, in player order."""
+        best = None
+        found = []
+        for racer in self.order:
+            if best is not None and racer.position != best:
+                break
+            if is_candidate(racer):
+                best = racer.position
+                found.append(racer)
+        return found
+
+    def trailers(self, is_candidate):
+        """Candidates tied for the rearmost position, in player order."""
+        worst = None
+        found = []
+        for racer in reversed(self.order):
+            if worst is not None and racer.position != worst:
+                break
+            if is_candidate(racer):
+                worst = racer.position
+                found.append(racer)
+        found.reverse()
+        return found
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Stored run_simulations batches that re-simulate incrementally.
+
+results_cache keys a whole batch on every source file it could touch, so
+editing one character throws the whole batch away. A stored batch instead
+keeps every race's RaceOutcome (the per-race facts run_simulations
+aggregates) together with that race's dependencies: which characters took
+part, the class each resolved to, and a hash over the engine sources and
+those characters' sources (results_cache.engine_fingerprint and
+character_fingerprint). After an edit, `resim` reruns only the races whose
+dependency hash no longer matches — the races the edited character was
+in, or every race if the engine changed — replaces their outcomes and
+rebuilds the aggregates from the stored outcomes.
+
+Race i is always played from derive_race_seed(seed, i) with the same
+lineup, so an incrementally updated batch is exactly the batch a full
+rerun would produce, and aggregates are rebuilt shard by shard so they
+match run_simulations bit for bit.
+
+The batch settings are fixed when the batch is first run (a seed is
+drawn then if none is given). Changing them, or the character pool the
+lineups are drawn from, starts a new batch.
+
+Usage:
+  python race_store.py run PATH --races 20000 --racers 5 [--board Mild] [--seed 0] [--workers 4]
+  python race_store.py status PATH
+  python race_store.py resim PATH [--workers 4]
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import random
+import tempfile
+import zlib
+from config import character_abilities, DEFAULT_BOARD_TYPE
+from game_simulation import RESULTS_TUPLE_LENGTH, SHARD_SIZE, NullLog, RaceOutcome, _BatchTally, _map_shards, _play_race, _quiet_stdout, derive_race_seed
+from results_cache import character_fingerprint, engine_fingerprint
+
+FORMAT_VERSION = 1
+
+# run_simulations arguments a stored batch can't honour: stored races keep
+# no narration, and every race of the batch is kept, so there is no early stop.
+_UNSUPPORTED_ARGUMENTS = ("collect_detailed_logs", "target_win_rate_ci")
+
+
+class StoredBatch:
+    """A batch's settings, its races' outcomes and their dependencies.
+
+    outcomes[i] is race i's RaceOutcome; sources[i] is the dependency hash
+    it was played under. characters maps every character that took part to
+    (class name, source fingerprint) as of its latest race."""
+
+    def __init__(self, run_kwargs, sampling_pool):
+        self.version = FORMAT_VERSION
+        self.run_kwargs = run_kwargs
+        self.sampling_pool = sampling_pool
+        self.engine = None
+        self.characters = {}
+        self.outcomes = []
+        self.sources = []
+
+    def save(self, path):
+        """Write the batch to `path` (atomically)."""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        data = zlib.compress(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL), 6)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """The batch stored at `path`, or None if there is none."""
+        try:
+            with open(path, "rb") as file:
+                batch = pickle.loads(zlib.decompress(file.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        return batch if getattr(batch, "version", None) == FORMAT_VERSION else None
+
+    def results(self, detailed=False):
+        """The run_simulations result tuple for the stored races (see its
+        `detailed` argument)."""
+        tally = _BatchTally()
+        for start in range(0, len(self.outcomes), SHARD_SIZE):
+            # One tally per shard, merged in order, as run_simulations does.
+            shard = _BatchTally()
+            for outcome in self.outcomes[start:start + SHARD_SIZE]:
+                shard.record_outcome(outcome)
+            tally.merge(shard)
+        results = tally.summarize(len(self.outcomes)) + (len(self.outcomes),)
+        return results if detailed else results[:RESULTS_TUPLE_LENGTH]
+
+
+class _Dependencies:
+    """Current source fingerprints, and each lineup's dependency hash,
+    computed once per character and per lineup."""
+
+    def __init__(self):
+        self.engine = engine_fingerprint()
+        self._characters = {}
+        self._lineups = {}
+
+    def character(self, name):
+        """(class name, source fingerprint) of character `name`."""
+        entry = self._characters.get(name)
+        if entry is None:
+            cls = character_abilities.get(name)
+            entry = self._characters[name] = (cls.__qualname__ if cls else None, character_fingerprint(name))
+        return entry
+
+    def lineup(self, characters):
+        """Hash over the engine sources and the sources of `characters`."""
+        key = tuple(sorted(set(characters)))
+        digest = self._lineups.get(key)
+        if digest is None:
+            text = "\n".join([self.engine, *(f"{name}:{self.character(name)[1]}" for name in key)])
+            digest = self._lineups[key] = hashlib.sha256(text.encode()).hexdigest()
+        return digest
+
+
+def _run_races(indices, master_seed, num_players, sampling_pool, fixed_characters, game_kwargs):
+    """Play races `indices` of a batch and return their RaceOutcomes."""
+    with _quiet_stdout():
+        outcomes = []
+        for i in indices:
+            selected_characters, game, turns, final_placements = _play_race(
+                derive_race_seed(master_seed, i), num_players, sampling_pool, fixed_characters, game_kwargs, NullLog()
+            )
+            outcomes.append(RaceOutcome.from_race(i, selected_characters, game, turns, final_placements))
+        return outcomes
+
+
+def _batch_settings(run_kwargs):
+    """(settings, sampling pool) of a run_simulations call, with every
+    default filled in so equal batches compare equal."""
+    import inspect
+    from game_simulation import run_simulations
+    for name in _UNSUPPORTED_ARGUMENTS:
+        if run_kwargs.get(name):
+            raise ValueError(f"stored batches don't support {name}")
+    bound = inspect.signature(run_simulations).bind(**run_kwargs)
+    bound.apply_defaults()
+    settings = {name: value for name, value in bound.arguments.items()
+                if name not in _UNSUPPORTED_ARGUMENTS and name not in ("workers", "detailed")}
+    if settings["seed"] is None:
+        settings["seed"] = random.getrandbits(64)
+    allowed = settings["allowed_characters"]
+    sampling_pool = list(allowed) if allowed else list(character_abilities.keys())
+    return settings, sampling_pool
+
+
+def _play(batch, indices, workers):
+    """Play races `indices` of `batch`, yielding their RaceOutcomes a
+    shard-sized chunk at a time."""
+    settings = batch.run_kwargs
+    game_keys = ("num_simulations", "num_players", "fixed_characters", "allowed_characters", "seed")
+    game_kwargs = {name: value for name, value in settings.items() if name not in game_keys}
+    chunks = [indices[start:start + SHARD_SIZE] for start in range(0, len(indices), SHARD_SIZE)]
+    args = [(chunk, settings["seed"], settings["num_players"], batch.sampling_pool, settings["fixed_characters"], game_kwargs)
+            for chunk in chunks]
+    for _, outcomes in _map_shards(_run_races, args, workers):
+        yield outcomes
+
+
+def stale_races(batch, dependencies=None):
+    """Indices of the races in `batch` whose dependency hash changed."""
+    dependencies = dependencies or _Dependencies()
+    return [outcome.index for outcome, sources in zip(batch.outcomes, batch.sources)
+            if dependencies.lineup(outcome.characters) != sources]
+
+
+def changed_characters(batch, dependencies=None):
+    """Characters in `batch` whose class or source changed since their
+    latest stored race, and whether the engine changed."""
+    dependencies = dependencies or _Dependencies()
+    changed = sorted(name for name, entry in batch.characters.items() if dependencies.character(name) != tuple(entry))
+    return changed, batch.engine != dependencies.engine
+
+
+def _update(batch, indices, workers, dependencies, progress):
+    """Replay races `indices` and record their outcomes and dependencies."""
+    done = 0
+    for outcomes in _play(batch, indices, workers):
+        for outcome in outcomes:
+            batch.outcomes[outcome.index] = outcome
+            batch.sources[outcome.index] = dependencies.lineup(outcome.characters)
+            for name in outcome.characters:
+                batch.characters[name] = dependencies.character(name)
+        done += len(outcomes)
+        if progress:
+            progress(done, len(indices))
+    batch.engine = dependencies.engine
+
+
+def run_stored_batch(path, workers=1, progress=None, detailed=False, **run_kwargs):
+    """run_simulations(detailed=detailed, **run_kwargs), kept at `path` and
+    brought up to date incrementally. Returns (results, races played).
+
+    If `path` holds a batch with the same settings, only its stale races
+    are replayed (none if no source changed); otherwise every race is
+    played and the batch replaces whatever was there. `progress` is an
+    optional callable(done_races, total_races).
+    """
+    settings, sampling_pool = _batch_settings(run_kwargs)
+    batch = StoredBatch.load(path)
+    if batch is not None and run_kwargs.get("seed") is None:
+        settings["seed"] = batch.run_kwargs["seed"]  # an unseeded call continues the stored batch
+    dependencies = _Dependencies()
+    if batch is None or settings != batch.run_kwargs or sampling_pool != batch.sampling_pool:
+        batch = StoredBatch(settings, sampling_pool)
+        batch.outcomes = [None] * settings["num_simulations"]
+        batch.sources = [None] * settings["num_simulations"]
+        indices = list(range(settings["num_simulations"]))
+    else:
+        indices = stale_races(batch, dependencies)
+    if indices:
+        _update(batch, indices, workers, dependencies, progress)
+        batch.save(path)
+    return batch.results(detailed), len(indices)
+
+
+def resim(path, workers=1, progress=None, detailed=False):
+    """Replay the stale races of the batch at `path` and return (results,
+    races played). Raises FileNotFoundError if there is no batch there."""
+    batch = StoredBatch.load(path)
+    if batch is None:
+        raise FileNotFoundError(f"no stored batch at {path}")
+    dependencies = _Dependencies()
+    indices = stale_races(batch, dependencies)
+    if indices:
+        _update(batch, indices, workers, dependencies, progress)
+        batch.save(path)
+    return batch.results(detailed), len(indices)
+
+
+def _print_summary(results):
+    average_turns, average_positions = results[0], results[1]
+    appearances, win_counts, races = results[4], results[7], results[-1]
+    print(f"{races} races, {average_turns:.2f} turns on average")
+    print(f"{'Character':<16} {'races':>7} {'win %':>7} {'avg pos':>8}")
+    rows = [(char, count) for char, count in appearances.items() if count]
+    for char, count in sorted(rows, key=lambda row: -win_counts.get(row[0], 0) / row[1]):
+        print(f"{char:<16} {count:>7} {win_counts.get(char, 0) / count * 100:>7.2f} {average_positions[char]:>8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a stored batch, or replay only the races whose code changed.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run a batch (or bring a stored one up to date)")
+    run_parser.add_argument("path")
+    run_parser.add_argument("--races", type=int, required=True)
+    run_parser.add_argument("--racers", type=int, default=5)
+    run_parser.add_argument("--board", default=DEFAULT_BOARD_TYPE)
+    run_parser.add_argument("--seed", type=int)
+    run_parser.add_argument("--workers", type=int, default=1)
+    status_parser = commands.add_parser("status", help="show which characters changed and how many races are stale")
+    status_parser.add_argument("path")
+    resim_parser = commands.add_parser("resim", help="replay the stale races of a stored batch")
+    resim_parser.add_argument("path")
+    resim_parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    def report(done, total):
+        print(f"  {done}/{total} races", flush=True)
+
+    if args.command == "status":
+        batch = StoredBatch.load(args.path)
+        if batch is None:
+            print(f"No stored batch at {args.path}")
+            return 1
+        dependencies = _Dependencies()
+        changed, engine_changed = changed_characters(batch, dependencies)
+        stale = stale_races(batch, dependencies)
+        print(f"{len(batch.outcomes)} races, seed {batch.run_kwargs['seed']}")
+        print(f"Engine changed: {'yes' if engine_changed else 'no'}")
+        print(f"Characters changed: {', '.join(changed) if changed else 'none'}")
+        print(f"Stale races: {len(stale)}")
+        return 0
+
+    if args.command == "run":
+        results, played = run_stored_batch(args.path, workers=args.workers, progress=report, detailed=True,
+                                           num_simulations=args.races, num_players=args.racers,
+                                           board_type=args.board, seed=args.seed)
+    else:
+        results, played = resim(args.path, workers=args.workers, progress=report, detailed=True)
+    print(f"Played {played} races ({results[-1] - played} reused) -> {args.path}")
+    _print_summary(results)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
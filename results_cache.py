@@ -0,0 +1,247 @@
+# results_cache.py
+#
+# Persistent, content-addressed cache of run_simulations results, so the
+# "Run Simulations" buttons in app.py and frontend.py return instantly for
+# a configuration that has already been run.
+#
+# An entry's key is a SHA-256 over the full configuration (every
+# run_simulations argument that can change the result — lineup mode and
+# pool, boards, rule settings, forced twist, seed, precision target) plus
+# source fingerprints: one for the engine (the modules every race runs
+# through) and one per character the configuration can draw. Editing a
+# character file changes only the keys of configurations that can field
+# that character; editing the engine changes them all. Stale entries are
+# never read again and age out through eviction.
+#
+# Entries are zlib-compressed pickles, one file per key, in CACHE_DIR.
+# Reading an entry bumps its mtime; once the directory grows past
+# max_bytes, the least recently used entries are deleted.
+#
+# Only seeded runs are cached: without a seed every run is a fresh sample
+# and there is nothing to reuse.
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import re
+import tempfile
+import zlib
+
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.environ.get("MAGICAL_ATHLETE_CACHE_DIR", os.path.join(_ROOT, ".sim_cache"))
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Modules every race runs through, relative to the repo root. Characters
+# these import (Stickler from base_character, ...) are added by
+# engine_fingerprint.
+ENGINE_SOURCES = (
+    "game_simulation.py", "board.py", "twists.py", "power_system.py", "config.py",
+    "events.py", "debug_utils.py", "position_index.py", "state_hash.py", "online_stats.py",
+    os.path.join("characters", "base_character.py"),
+)
+
+# Arguments that don't affect run_simulations results.
+_IGNORED_ARGUMENTS = ("workers",)
+
+_CHARACTER_IMPORT = re.compile(r"^\s*(?:from|import)\s+characters\.(\w+)", re.MULTILINE)
+
+_file_hashes = {}  # path -> ((mtime_ns, size), sha256 hex)
+
+
+def _file_hash(path):
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_hashes.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "rb") as file:
+            cached = _file_hashes[path] = (stamp, hashlib.sha256(file.read()).hexdigest())
+    return cached[1]
+
+
+def _character_imports(path):
+    """Paths of the character modules `path` imports (not base_character)."""
+    with open(path, encoding="utf-8") as file:
+        names = _CHARACTER_IMPORT.findall(file.read())
+    return [os.path.join(_ROOT, "characters", f"{name}.py") for name in names if name != "base_character"]
+
+
+def _sources_hash(paths, unscanned=()):
+    """Hash over `paths` and every character module they import,
+    transitively; the imports of `unscanned` paths aren't followed."""
+    seen = set()
+    pending = list(paths)
+    while pending:
+        path = pending.pop()
+        if path in seen or not os.path.exists(path):
+            continue
+        seen.add(path)
+        if path not in unscanned:
+            pending.extend(_character_imports(path))
+    digest = hashlib.sha256()
+    for path in sorted(seen):
+        digest.update(os.path.relpath(path, _ROOT).encode())
+        digest.update(_file_hash(path).encode())
+    return digest.hexdigest()
+
+
+def engine_fingerprint():
+    """Hash of the engine sources (ENGINE_SOURCES and the character modules
+    they import)."""
+    paths = [os.path.join(_ROOT, source) for source in ENGINE_SOURCES]
+    # config.py imports every character for the registry; only the engine
+    # modules' own character imports are engine code.
+    return _sources_hash(paths, unscanned={os.path.join(_ROOT, "config.py")})
+
+
+def character_fingerprint(name):
+    """Hash of the source of character `name` (its class's module and any
+    character modules that imports), or None if it isn't registered."""
+    from config import character_abilities
+    cls = character_abilities.get(name)
+    if cls is None:
+        return None
+    try:
+        path = inspect.getsourcefile(cls)
+    except TypeError:
+        return None
+    return _sources_hash([path]) if path else None
+
+
+def config_key(run_kwargs):
+    """Cache key for a run_simulations call with keyword arguments
+    `run_kwargs`, or None if the call isn't reproducible (no seed)."""
+    if run_kwargs.get("seed") is None:
+        return None
+    from config import character_abilities
+    config = {k: v for k, v in run_kwargs.items() if k not in _IGNORED_ARGUMENTS}
+    pool = config.get("fixed_characters") or config.get("allowed_characters") or list(character_abilities.keys())
+    payload = {
+        "config": config,
+        "engine": engine_fingerprint(),
+        "characters": {name: character_fingerprint(name) for name in sorted(set(pool))},
+    }
+    text = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultsCache:
+    """Size-bounded LRU store of pickled results on local disk."""
+
+    SUFFIX = ".pkl.z"
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def get(self, key):
+        """The stored value for `key`, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.loads(zlib.decompress(file.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError):
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, value):
+        """Store `value` under `key`, then evict down to max_bytes. Values
+        too large to ever fit alongside others (over a quarter of
+        max_bytes) are not stored."""
+        data = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 6)
+        if len(data) > self.max_bytes // 4:
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        # Write then rename, so a reader never sees a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self.evict()
+        return True
+
+    def evict(self):
+        """Delete least recently used entries until the total size is
+        within max_bytes."""
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(self.SUFFIX)]
+        except OSError:
+            return
+        entries = []
+        total = 0
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        for name in os.listdir(self.directory) if os.path.isdir(self.directory) else ():
+            if name.endswith(self.SUFFIX):
+                os.remove(os.path.join(self.directory, name))
+
+
+_default_cache = None
+
+
+def _resolve(cache):
+    global _default_cache
+    if cache is None:
+        if _default_cache is None:
+            _default_cache = ResultsCache()
+        cache = _default_cache
+    return cache
+
+
+def cache_lookup(run_kwargs, cache=None):
+    """(key, results) for a run_simulations call: results is the cached
+    tuple, or None on a miss; key is None for unseeded (uncacheable) runs."""
+    key = config_key(run_kwargs)
+    if key is None:
+        return None, None
+    return key, _resolve(cache).get(key)
+
+
+def cache_store(key, results, cache=None):
+    """Store finished results under a key from cache_lookup."""
+    if key is not None:
+        _resolve(cache).put(key, results)
+
+
+def cached_run_simulations(cache=None, detailed=False, **run_kwargs):
+    """run_simulations(detailed=detailed, **run_kwargs), served from `cache`
+    (the default on-disk cache if None) when the same configuration has been
+    run before with the same sources. Returns (results, from_cache). The
+    cache always holds the detailed tuple, as the UIs store it."""
+    from game_simulation import RESULTS_TUPLE_LENGTH, run_simulations
+    key, results = cache_lookup(run_kwargs, cache)
+    from_cache = results is not None
+    if not from_cache:
+        results = run_simulations(detailed=True, **run_kwargs)
+        cache_store(key, results, cache)
+    return (results if detailed else results[:RESULTS_TUPLE_LENGTH]), from_cache
@@ -6,6 +6,7 @@ Tests all characters, interactions, and edge cases after Phase 1 & 2 refactoring
 
 import sys
 import time
+from contextlib import contextmanager
 from datetime import datetime
 from game_simulation import Game
 from config import character_abilities
@@ -275,6 +276,615 @@ def test_special_mechanics_magician():
     return turns > 0
 
 
+def test_parallel_matches_serial():
+    """A parallel batch merges to exactly the serial result for the same seed."""
+    from game_simulation import run_simulations, SHARD_SIZE
+    num = SHARD_SIZE * 2 + 17
+    serial = run_simulations(num, 4, board_type="Wild", seed=1234, workers=1)
+    parallel = run_simulations(num, 4, board_type="Wild", seed=1234, workers=3)
+    return len(serial) == 12 and serial == parallel
+
+
+def test_replay_race_matches_batch():
+    """A race replayed from its seed reproduces the batch's play-by-play."""
+    from game_simulation import run_simulations, replay_race, derive_race_seed
+    results = run_simulations(3, 5, board_type="Twists", seed=99, collect_detailed_logs=True)
+    batch_lines = results[2]
+    _, _, _, replay_lines = replay_race(derive_race_seed(99, 1), 5, board_type="Twists")
+    start = batch_lines.index("--- Simulation 2 ---")
+    end = batch_lines.index("--- Simulation 3 ---")
+    race_lines = batch_lines[start:end]
+    return race_lines[-len(replay_lines):] == replay_lines
+
+
+def test_event_log_renders_play_by_play():
+    """A narrated EventLog renders back to the exact text-list play-by-play."""
+    from events import EventLog, EventKind, render_race
+    lineup = ['Scoocher', 'Romantic', 'HugeBaby', 'Skipper', 'PartyPooper']
+    text_lines = []
+    Game(lineup, board_type='Wild', seed=7).run(text_lines)
+    event_log = EventLog(capacity=8, narrate=True)
+    Game(lineup, board_type='Wild', seed=7).run(event_log)
+    moves = list(event_log.events(kind=EventKind.MOVE))
+    return render_race(event_log, 0) == text_lines and len(moves) > 0
+
+
+def test_position_index_consistent():
+    """The spatial index tracks every position write, including direct ones."""
+    lineups = [
+        ['Leaptoad', 'Suckerfish', 'HugeBaby', 'MagicalAthlete', 'Mole', 'Stunner', 'Romantic', 'Scoocher', 'NepoBaby'],
+        ['Doppelgangster', 'Banana', 'Centaur', 'BabaYaga', 'Hare', 'Skipper', 'Duelist', 'Legs'],
+    ]
+    for seed in range(6):
+        for lineup in lineups:
+            lineup = [c for c in lineup if c in character_abilities]
+            game = Game(lineup, board_type='Twists' if seed % 2 else 'Sportals', seed=seed)
+            game.run([])
+            for p in game.players:
+                if p not in game.position_index.racers_at(p.position):
+                    return False
+            if sum(len(r) for r in game.position_index.at.values()) != len(game.players):
+                return False
+    return True
+
+
+def test_state_hash_consistent():
+    """The running loop-detection hash matches a from-scratch recompute."""
+    lineup = [c for c in ['Doppelgangster', 'Hare', 'Penguin', 'Cheatah', 'Inchworm', 'FlipFlop', 'Leaptoad', 'Mastermind'] if c in character_abilities]
+    for seed in range(8):
+        game = Game(lineup, board_type='Twists' if seed % 2 else 'Wild', seed=seed)
+        game.run([])
+        if game.state_hash.value != game.state_hash.recompute():
+            return False
+    game.push_game_state()
+    if game.check_for_state_loop("test", []) is not True:
+        return False
+    game.pop_game_state()
+    game.pop_game_state()
+    return game.check_for_state_loop("test", []) is False
+
+
+def test_fork_continues_identically():
+    """A race paused and forked mid-way plays out exactly like the original."""
+    from game_simulation import NullLog
+    lineup = [c for c in ['Doppelgangster', 'Nemesis', 'Mastermind', 'Hare', 'Skipper', 'Stunner', 'Null', 'Romantic'] if c in character_abilities]
+
+    def outcome(game, result):
+        turns, placements = result
+        return turns, [(place, p.player_number) for place, p in placements], game.get_chip_statistics()
+
+    for seed in range(10):
+        board_type = ['Twists', 'Wild', 'Sportals'][seed % 3]
+        whole = Game(lineup, board_type=board_type, seed=seed, random_turn_order=True)
+        expected = outcome(whole, whole.run(NullLog()))
+        # Stopping on the final turn still returns the finished race.
+        ended = Game(lineup, board_type=board_type, seed=seed, random_turn_order=True)
+        if outcome(ended, ended.run(NullLog(), stop_after_turn=expected[0])) != expected:
+            return False
+        paused = Game(lineup, board_type=board_type, seed=seed, random_turn_order=True)
+        if paused.run(NullLog(), stop_after_turn=4) is not None:
+            continue  # finished within 4 turns
+        branch = paused.fork()
+        if outcome(branch, branch.run(NullLog())) != expected:
+            return False
+        if outcome(paused, paused.run(NullLog())) != expected:
+            return False
+    return True
+
+
+def test_fast_endgame_matches_full_turns():
+    """The abilities-off fast path plays the same races as full take_turn."""
+    import random
+    import game_simulation
+    from game_simulation import NullLog
+    names = sorted(character_abilities.keys())
+    original_off_turn = game_simulation.ABILITIES_OFF_TURN
+    game_simulation.ABILITIES_OFF_TURN = 3  # reach the endgame in every race
+    try:
+        for seed in range(60):
+            rng = random.Random(seed)
+            lineup = rng.sample(names, min(len(names), rng.choice([4, 6, 9])))
+            board_type = ['Mild', 'Wild', 'Sportals', 'Twists'][seed % 4]
+            results = []
+            for fast in (True, False):
+                game = Game(lineup, board_type=board_type, seed=seed, random_turn_order=True, fast_endgame=fast)
+                turns, placements = game.run(NullLog())
+                results.append((turns, [(place, p.player_number) for place, p in placements],
+                                game.get_chip_statistics(), [p.position for p in game.players]))
+            if results[0] != results[1]:
+                return False
+    finally:
+        game_simulation.ABILITIES_OFF_TURN = original_off_turn
+    return True
+
+
+def test_markov_solver_matches_engine():
+    """Exact plain-racer odds agree with simulated plain racers."""
+    from board import Board
+    from game_simulation import NullLog
+    from markov_solver import placement_probabilities, turns_to_finish
+    num_races = 1500
+    for board_type in ['Wild', 'Sportals']:
+        board = Board(board_type)
+        if abs(sum(turns_to_finish(board)) - 1) > 1e-9:
+            return False
+        expected = placement_probabilities(board, 3)
+        wins = [0, 0, 0]
+        for seed in range(num_races):
+            # Names outside character_abilities play as the powerless base Character.
+            game = Game(['Plain A', 'Plain B', 'Plain C'], board_type=board_type, seed=seed)
+            _, placements = game.run(NullLog())
+            wins[placements[0][1].player_number - 1] += 1
+        for seat in range(3):
+            p = expected[seat]['1st']
+            std_err = (p * (1 - p) / num_races) ** 0.5
+            if abs(wins[seat] / num_races - p) > 4 * std_err:
+                return False
+    return True
+
+
+def test_compiled_moves_match_recursive_moves():
+    """Moves applied from compiled board landings play the same races as
+    the recursive move/jump path."""
+    import random
+    from board import Board
+    from game_simulation import NullLog
+    wild, sportals = Board('Wild'), Board('Sportals')
+    if wild.landing(4, 3) != (('move', 7), ('move', 10)) or sportals.landing(0, 4) != (('move', 4), ('jump', 6)):
+        return False
+    names = sorted(character_abilities.keys())
+    for seed in range(80):
+        rng = random.Random(seed)
+        lineup = rng.sample(names, min(len(names), rng.choice([3, 5, 7])))
+        board_type = ['Mild', 'Wild', 'Sportals', 'Twists'][seed % 4]
+        results = []
+        for compiled in (True, False):
+            game = Game(lineup, board_type=board_type, seed=seed, random_turn_order=True, compiled_moves=compiled)
+            turns, placements = game.run(NullLog())
+            results.append((turns, [(place, p.player_number) for place, p in placements],
+                            game.get_chip_statistics(), [p.position for p in game.players]))
+        if results[0] != results[1]:
+            return False
+    return True
+
+
+def test_running_stats_match_batch_formulas():
+    """Streaming aggregates agree with list-based mean/variance, and merged
+    halves equal one pass over the whole stream."""
+    import random
+    import statistics
+    from online_stats import RunningStat
+    rng = random.Random(7)
+    samples = [rng.randint(1, 60) for _ in range(1001)]
+    whole, first, second = RunningStat(), RunningStat(), RunningStat()
+    for i, x in enumerate(samples):
+        whole.add(x)
+        (first if i < 400 else second).add(x)
+    first.merge(second)
+    for stat in (whole, first):
+        if stat.mean != sum(samples) / len(samples) or (stat.min, stat.max) != (min(samples), max(samples)):
+            return False
+        if abs(stat.variance - statistics.variance(samples)) > 1e-9:
+            return False
+    from game_simulation import run_simulations
+    results = run_simulations(60, 4, board_type="Mild", seed=3, detailed=True)
+    standard_errors, placement_counts = results[12], results[13]
+    appearances = results[4]
+    return (standard_errors['turns'] > 0
+            and all(sum(placement_counts[c].values()) == n for c, n in appearances.items()))
+
+
+def test_sequential_sampling_stops_at_target():
+    """A target win-rate CI stops the batch early, at the same race for any
+    worker count, with the same results as a fixed-size run of that length."""
+    from game_simulation import run_simulations, SHARD_SIZE
+    lineup = ['Banana', 'HugeBaby', 'Legs', 'Romantic']
+    cap = SHARD_SIZE * 20
+    serial = run_simulations(cap, 4, fixed_characters=lineup, seed=2, target_win_rate_ci=0.05, detailed=True)
+    races_run = serial[-1]
+    if not (0 < races_run < cap and races_run % SHARD_SIZE == 0):
+        return False
+    parallel = run_simulations(cap, 4, fixed_characters=lineup, seed=2, target_win_rate_ci=0.05, workers=2, detailed=True)
+    fixed = run_simulations(races_run, 4, fixed_characters=lineup, seed=2, detailed=True)
+    return serial == parallel == fixed
+
+
+def test_paired_comparison_shares_races():
+    """Paired variants race on the same seeds: identical settings give zero
+    deltas, and the result doesn't depend on the worker count."""
+    from paired_comparison import run_paired_comparison
+    same = run_paired_comparison(60, 4, {'showoff_threshold': 5}, {'showoff_threshold': 5}, seed=8)
+    if not same or any(summary[m]['delta'] != 0 or summary[m]['ci'] != 0
+                       for summary in same.values() for m in ('win_rate', 'position', 'points')):
+        return False
+    serial = run_paired_comparison(300, 4, {'null_main_move_penalty': 1}, {'null_main_move_penalty': 3}, seed=8)
+    parallel = run_paired_comparison(300, 4, {'null_main_move_penalty': 1}, {'null_main_move_penalty': 3}, seed=8, workers=2)
+    return serial == parallel
+
+
+def test_sweep_resumes_and_matches_run_simulations():
+    """A sweep cell's table rows match run_simulations with the same settings,
+    parallel sweeps write the same rows, a rerun skips finished cells but not
+    cells run with other shared settings, and repeated design values don't
+    stall random_design."""
+    import csv
+    import os
+    import tempfile
+    from game_simulation import run_simulations
+    from sweep import grid_design, random_design, run_sweep
+    if random_design({'showoff_threshold': [3, 3]}, 2) != [{'showoff_threshold': 3}]:
+        return False
+    cells = grid_design({'showoff_threshold': [4, 5], 'null_main_move_penalty': [1, 2]})
+    with tempfile.TemporaryDirectory() as tmp:
+        serial_path, parallel_path = os.path.join(tmp, 'serial.csv'), os.path.join(tmp, 'parallel.csv')
+        if run_sweep(cells[:2], 120, 4, serial_path, seed=11) != 2:
+            return False
+        if run_sweep(cells, 120, 4, serial_path, seed=11) != 2:  # resumes: only the last two cells
+            return False
+        run_sweep(cells, 120, 4, parallel_path, seed=11, workers=2)
+        with open(serial_path, newline='') as f:
+            serial_rows = list(csv.DictReader(f))
+        with open(parallel_path, newline='') as f:
+            parallel_rows = list(csv.DictReader(f))
+        # Same cells on another board are new cells, labelled by board.
+        if run_sweep(cells[:1], 120, 4, parallel_path, seed=11, board_type='Wild') != 1:
+            return False
+        with open(parallel_path, newline='') as f:
+            boards = {row['board_type'] for row in csv.DictReader(f)}
+        if boards != {'Mild', 'Wild'}:
+            return False
+    key = lambda row: (row['cell_id'], row['character'])
+    if sorted(serial_rows, key=key) != sorted(parallel_rows, key=key):
+        return False
+    results = run_simulations(120, 4, seed=11, random_turn_order=True, showoff_threshold=4, null_main_move_penalty=1)
+    appearances, wins = results[4], results[7]
+    cell_rows = [row for row in serial_rows if row['showoff_threshold'] == '4' and row['null_main_move_penalty'] == '1']
+    return bool(cell_rows) and all(
+        int(row['appearances']) == appearances[row['character']] and int(row['wins']) == wins[row['character']]
+        for row in cell_rows
+    )
+
+
+@contextmanager
+def _edited_character_source(module_name):
+    """Make results_cache fingerprint characters/<module_name>.py as if its
+    source had been edited, for the duration of the block."""
+    import os
+    import results_cache
+    edited = os.path.join(os.path.dirname(results_cache.__file__), 'characters', f'{module_name}.py')
+    original_hash = results_cache._file_hash
+    results_cache._file_hash = lambda path: 'edited' if path == edited else original_hash(path)
+    try:
+        yield
+    finally:
+        results_cache._file_hash = original_hash
+
+
+def test_results_cache_keys_and_eviction():
+    """Seeded runs are served from the cache; a character's source change
+    only invalidates configurations that can field it; LRU eviction keeps
+    the cache under its size bound."""
+    import os
+    import tempfile
+    from results_cache import ResultsCache, cached_run_simulations, config_key
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultsCache(tmp)
+        run = dict(num_simulations=20, num_players=3, fixed_characters=['Banana', 'HugeBaby', 'Legs'], seed=4)
+        first, hit = cached_run_simulations(cache, **run)
+        second, second_hit = cached_run_simulations(cache, **run)
+        if hit or not second_hit or first != second or len(first) != 12:
+            return False
+        if cached_run_simulations(cache, detailed=True, **run)[0][:12] != first:
+            return False
+        if config_key(dict(run, seed=None)) is not None or config_key(dict(run, workers=3)) != config_key(run):
+            return False
+        # Pretend banana.py changed: only configurations with Banana get new keys.
+        other = dict(run, fixed_characters=['Romantic', 'HugeBaby', 'Legs'])
+        before = (config_key(run), config_key(other))
+        with _edited_character_source('banana'):
+            after = (config_key(run), config_key(other))
+        if after[0] == before[0] or after[1] != before[1]:
+            return False
+        small = ResultsCache(os.path.join(tmp, 'small'), max_bytes=4000)
+        for i in range(10):
+            small.put(f'entry{i}', os.urandom(900))
+        sizes = [os.path.getsize(os.path.join(small.directory, name)) for name in os.listdir(small.directory)]
+        return sum(sizes) <= 4000 and small.get('entry9') is not None and small.get('entry0') is None
+
+
+def test_simulation_job_progress_and_cancel():
+    """iter_simulations reports growing partial results and ends on the
+    run_simulations result; a SimulationJob finishes with that result, and a
+    cancelled job keeps the races it had merged."""
+    from game_simulation import iter_simulations, run_simulations
+    from sim_jobs import SimulationJob
+    run = dict(num_simulations=600, num_players=3, fixed_characters=['Banana', 'HugeBaby', 'Legs'], seed=9)
+    expected = run_simulations(detailed=True, **run)
+    items = list(iter_simulations(report_every=250, **run))
+    if [item[-1] for item in items] != [250, 500, 600] or items[-1] != expected:
+        return False
+    finished = []
+    job = SimulationJob(run, report_every=250, on_finish=finished.append).start()
+    if not job.wait(60) or job.snapshot() != ('done', 600, expected) or finished != [expected]:
+        return False
+    cancelled = SimulationJob(dict(run, num_simulations=50000), report_every=250)
+    cancelled.cancel()  # lands on the first report
+    cancelled.start()
+    if not cancelled.wait(60):
+        return False
+    status, races_done, results = cancelled.snapshot()
+    return status == 'cancelled' and races_done == 250 and results[-1] == 250 and cancelled.progress < 1
+
+
+def test_cancelled_pool_jobs_stop_their_workers():
+    """Cancelling a parallel SimulationJob or a ProcessTask reports through
+    the events queue and leaves no worker processes running."""
+    import multiprocessing
+    import queue
+    import time
+    from sim_jobs import ProcessTask, SimulationJob
+    events = queue.Queue()
+    job = SimulationJob(dict(num_simulations=20000, num_players=4, seed=2, workers=2), events=events).start()
+    if events.get(timeout=60)[0] != 'progress':
+        return False
+    job.cancel()
+    if not job.wait(60):
+        return False
+    while True:
+        event = events.get(timeout=5)
+        if event[0] == 'finished':
+            break
+    if event != ('finished', 'cancelled'):
+        return False
+    task = ProcessTask(time.sleep, 60, events=events).start()
+    task.cancel()
+    if events.get(timeout=5) != ('finished', 'cancelled') or task.status != 'cancelled':
+        return False
+    return job.snapshot()[1] < 20000 and not multiprocessing.active_children()
+
+
+def test_tournament_batch_aggregates():
+    """run_tournament_batch is reproducible across worker counts, splits
+    every cup's win between seats, counts every drafted racer and honours
+    the start-player rule."""
+    from tournament import run_tournament_batch
+    fixed = run_tournament_batch(120, 3, seed=7)
+    if run_tournament_batch(120, 3, seed=7, workers=2) != fixed or fixed['cups'] != 120:
+        return False
+    if abs(sum(seat['win_rate'] for seat in fixed['seats']) - 1) > 1e-9:
+        return False
+    if any(abs(sum(seat['points_distribution'].values()) - 1) > 1e-9 for seat in fixed['seats']):
+        return False
+    if sum(racer['drafted'] for racer in fixed['racers'].values()) != 120 * 3 * 4:
+        return False
+    # Without the rule player 1 starts all four races of every cup.
+    if fixed['races_started'][4]['players'] != 120 or set(fixed['races_started']) != {0, 4}:
+        return False
+    rotated = run_tournament_batch(120, 3, seed=7, start_player_rule=True)
+    return len(rotated['races_started']) > 2 and all(p['races'] == 480 for p in rotated['turn_positions'])
+
+
+def test_matchup_matrix_recomputes_only_changed_rows():
+    """update_matchups stores every pair with its sample count, reuses the
+    stored matrix, and after a character's source changes recomputes only
+    that character's row and column, to the same values."""
+    import tempfile
+    from matchups import MatchupMatrix, matchup_path, update_matchups
+    names = ['Banana', 'HugeBaby', 'Legs', 'Romantic']
+    with tempfile.TemporaryDirectory() as tmp:
+        matrix, computed = update_matchups('Mild', 40, 2, names, directory=tmp)
+        if computed != 6 or any(cell[2] != 40 for cell in matrix.cells.values()):
+            return False
+        if abs(matrix.win_rate('Banana', 'Legs') + matrix.win_rate('Legs', 'Banana') - 1) > 1e-9:
+            return False
+        if update_matchups('Mild', 40, 2, names, directory=tmp, workers=2)[1] != 0:
+            return False
+        with _edited_character_source('banana'):
+            updated, recomputed = update_matchups('Mild', 40, 2, names, directory=tmp, workers=2)
+        stored = MatchupMatrix.load(matchup_path('Mild', 2, 40, 0, tmp))
+        return recomputed == 3 and updated.cells == matrix.cells and stored.cells == matrix.cells
+
+
+def test_race_store_resimulates_only_changed_races():
+    """A stored batch reproduces run_simulations, records each race's
+    characters and source hash, and after a character's source changes
+    replays only the races it was in, ending on the same aggregates."""
+    import os
+    import tempfile
+    import race_store
+    from game_simulation import run_simulations
+    run = dict(num_simulations=600, num_players=4, seed=11, board_type='Random', random_turn_order=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'batch.pkl.z')
+        results, played = race_store.run_stored_batch(path, **run)
+        if played != 600 or results != run_simulations(**run):
+            return False
+        if race_store.run_stored_batch(path, workers=2, **run)[1] != 0:
+            return False
+        with _edited_character_source('banana'):
+            batch = race_store.StoredBatch.load(path)
+            if race_store.changed_characters(batch) != (['Banana'], False):
+                return False
+            stale = race_store.stale_races(batch)
+            if any('Banana' not in batch.outcomes[i].characters for i in stale):
+                return False
+            resimmed, replayed = race_store.resim(path, workers=2)
+        return replayed == results[4]['Banana'] == len(stale) and resimmed == results
+
+
+def test_reaction_hooks_reach_only_overriding_classes():
+    """A class that doesn't override a reaction hook is never dispatched to
+    (even if the base hook is later replaced); one that does is, including
+    from Leaptoad's own move."""
+    from characters.base_character import Character
+
+    class Quiet(Character):
+        pass
+
+    class Loud(Character):
+        def on_another_player_move(self, moved_player, game, play_by_play_lines):
+            heard.append(moved_player.piece)
+
+    if Quiet._reacts_to or Loud._reacts_to != {'on_another_player_move'}:
+        return False
+    heard, base_calls = [], []
+    original = Character.on_another_player_move
+    Character.on_another_player_move = lambda self, *args: base_calls.append(self.piece)
+    try:
+        game = Game(['Banana', 'Hare', 'Legs', 'Leaptoad'], board_type='Mild', seed=3)
+        banana = game.players[0]
+        banana.__class__ = type('LoudBanana', (Loud, type(banana)), {})
+        game._build_hook_subscribers()
+        game.run([])
+    finally:
+        Character.on_another_player_move = original
+    return (not base_calls and 'Leaptoad' in heard
+            and game.hook_stats['on_another_player_move_called'] == len(heard)
+            and game.hook_stats['on_another_player_move_skipped'] > 0)
+
+
+def test_reaction_dispatch_follows_mid_move_steal():
+    """A reaction that finishes into a Doppelgangster steal mid-dispatch
+    still reaches the Doppelgangster's new class later in player order,
+    for both moves and jumps."""
+    for use_jump in (False, True):
+        game = Game(['Hare', 'Romantic', 'Doppelgangster'], board_type='Mild', seed=0)
+        hare, romantic, dop = game.players
+        romantic.position, hare.position, dop.position = 29, 4, 5
+        if use_jump:
+            hare.jump(game, 5, [])
+        else:
+            hare.move(game, [], 1)
+        # Romantic moves 2 and crosses the line; Doppelgangster intercepts,
+        # becomes a Romantic, and reacts to Hare sharing its space.
+        if not romantic.eliminated or type(dop).__name__ != 'Romantic' or dop.position != 7:
+            return False
+    return True
+
+
+def test_phase_tables_match_live_dispatch():
+    """Dispatching phases from the prebuilt participant tables plays the
+    same races as walking turn_order live, with lineups that change
+    mid-race (Skipper reordering, Doppelgangster stealing, eliminations)."""
+    from game_simulation import _CURRENT_PLAYER_ONLY_PHASES, _NO_OP_PHASES
+    from power_system import PowerPhase
+
+    class LiveDispatchGame(Game):
+        # Every phase's "other players" step runs through the live fallback.
+        def resolve_phase(self, phase, current_player, play_by_play_lines, context=None):
+            table, self.phase_participants = self.phase_participants, empty
+            try:
+                context = Game.resolve_phase(self, phase, current_player, play_by_play_lines, context)
+            finally:
+                if self.phase_participants is empty:
+                    self.phase_participants = table
+            if phase not in _CURRENT_PLAYER_ONLY_PHASES and phase not in _NO_OP_PHASES:
+                self._resolve_phase_live(phase, current_player, play_by_play_lines, context, 0)
+            return context
+
+    empty = {phase: [] for phase in PowerPhase}
+    fallbacks = []
+    live = Game._resolve_phase_live
+    lineups = [['Skipper', 'Doppelgangster', 'Gunk', 'Inchworm', 'Kraken', 'Mastermind'],
+               ['Doppelgangster', 'Skipper', 'Inchworm', 'Coach', 'Lackey', 'Cheerleader']]
+    for lineup in lineups:
+        for board in ('Mild', 'Wild', 'Twists'):
+            for seed in range(10):
+                table_lines, live_lines = [], []
+                Game._resolve_phase_live = lambda self, *args: fallbacks.append(1) or live(self, *args)
+                try:
+                    table_game = Game(lineup, board_type=board, seed=seed)
+                    table_turns, table_placements = table_game.run(table_lines)
+                finally:
+                    Game._resolve_phase_live = live
+                live_game = LiveDispatchGame(lineup, board_type=board, seed=seed)
+                live_turns, live_placements = live_game.run(live_lines)
+                if table_lines != live_lines or table_turns != live_turns:
+                    return False
+                if ([(place, p.piece) for place, p in table_placements]
+                        != [(place, p.piece) for place, p in live_placements]):
+                    return False
+                if [p.eliminated for p in table_game.players] != [p.eliminated for p in live_game.players]:
+                    return False
+    # The table walk must actually have handed over to the fallback.
+    return len(fallbacks) > 0
+
+
+def test_active_players_and_null_floor_stay_current():
+    """The active_players cache and the Null floor follow finishes and
+    eliminations made during a turn, checked at every power check of
+    races with Nulls and eliminators, and after direct edits."""
+    mismatches = []
+    eliminations = 0
+
+    class CheckedGame(Game):
+        def is_power_suppressed_for(self, character):
+            active = [p for p in self.players if not p.finished and not p.eliminated]
+            floor = min((p.position for p in active if p.piece == 'Null'), default=float('inf'))
+            if self.active_players != active or self.null_floor.value != floor:
+                mismatches.append(self._current_turn)
+            return Game.is_power_suppressed_for(self, character)
+
+    lineups = [['Null', 'Kraken', 'NormalHarry', 'Banana', 'Doppelgangster', 'Romantic'],
+               ['Null', 'Null', 'Mastermind', 'Stunner', 'Hare', 'Legs']]
+    for lineup in lineups:
+        for board in ('Twists', 'Wild'):
+            for seed in range(10):
+                game = CheckedGame(lineup, board_type=board, seed=seed)
+                game.run([])
+                eliminations += len(game.eliminated_players)
+    if mismatches or not eliminations:
+        return False
+
+    game = Game(['Null', 'Banana', 'Hare', 'Null'], board_type='Mild', seed=1)
+    first, banana, hare, last = game.players
+    first.position, last.position, hare.position = 4, 9, 6
+    before = game.active_players
+    game.eliminate_player(first, [])
+    if game.null_floor.value != 9 or first in game.active_players or first not in before:
+        return False
+    if game.is_power_suppressed_for(last) or game.is_power_suppressed_for(hare):
+        return False
+    game.finished_players.append(banana)  # Mastermind-style finish
+    banana.finished = True
+    last.finished = True
+    game.finished_players.append(last)
+    return (game.active_players == [hare] and game.null_floor.value == float('inf')
+            and not game.is_power_suppressed_for(hare))
+
+
+def test_event_log_renders_twists():
+    """Every twist's draw, warps and rolls are recorded as events, and a
+    narrated EventLog still renders to the text-list play-by-play."""
+    from events import EventLog, EventKind, render_race
+    from twists import get_twist_pool
+    lineup = ['Banana', 'Hare', 'Legs', 'Romantic', 'Null']
+    drawn = set()
+    for twist in get_twist_pool():
+        for seed in range(3):
+            text_lines = []
+            Game(lineup, board_type='Twists', seed=seed, forced_twist=twist).run(text_lines)
+            event_log = EventLog(capacity=8, narrate=True)
+            Game(lineup, board_type='Twists', seed=seed, forced_twist=twist).run(event_log)
+            if render_race(event_log, 0) != text_lines:
+                return False
+            drawn.update(event_log.strings[value] for *_, value in event_log.events(kind=EventKind.TWIST))
+    return drawn == set(get_twist_pool())
+
+
+def test_elimination_status_tracking():
+    """eliminated flags, eliminated_players and active_players stay in step."""
+    lineup = [c for c in ['NormalHarry', 'Kraken', 'Mouth', 'Mastermind', 'Banana', 'Hare', 'Legs'] if c in character_abilities]
+    for seed in range(8):
+        game = Game(lineup, board_type='Twists', seed=seed)
+        game.run([])
+        if [p for p in game.players if p.eliminated] != sorted(game.eliminated_players, key=game.players.index):
+            return False
+        if game.active_players != [p for p in game.players if not p.finished and p not in game.eliminated_players]:
+            return False
+    return True
+
+
 def main():
     print("="*70)
     print("MAGICAL ATHLETE SIMULATOR - COMPREHENSIVE TEST SUITE")
@@ -323,6 +933,35 @@ def main():
     runner.test("Legs special mechanics", test_special_mechanics_legs)
     runner.test("Magician reroll mechanics", test_special_mechanics_magician)
 
+    # Test 7: Batch simulation
+    print("\n7. BATCH SIMULATION TESTS")
+    print("-"*70)
+    runner.test("Parallel batch matches serial", test_parallel_matches_serial)
+    runner.test("Replay race from seed", test_replay_race_matches_batch)
+    runner.test("Event log renders play-by-play", test_event_log_renders_play_by_play)
+    runner.test("Position index stays consistent", test_position_index_consistent)
+    runner.test("Elimination status tracking", test_elimination_status_tracking)
+    runner.test("Loop-detection state hash", test_state_hash_consistent)
+    runner.test("Forked race continues identically", test_fork_continues_identically)
+    runner.test("Fast endgame matches full turns", test_fast_endgame_matches_full_turns)
+    runner.test("Markov solver matches engine", test_markov_solver_matches_engine)
+    runner.test("Compiled moves match recursive moves", test_compiled_moves_match_recursive_moves)
+    runner.test("Streaming aggregates match batch formulas", test_running_stats_match_batch_formulas)
+    runner.test("Sequential sampling stops at target", test_sequential_sampling_stops_at_target)
+    runner.test("Paired comparison shares races", test_paired_comparison_shares_races)
+    runner.test("Sweep resumes and matches run_simulations", test_sweep_resumes_and_matches_run_simulations)
+    runner.test("Results cache keys and eviction", test_results_cache_keys_and_eviction)
+    runner.test("Simulation job progress and cancel", test_simulation_job_progress_and_cancel)
+    runner.test("Cancelled pool jobs stop their workers", test_cancelled_pool_jobs_stop_their_workers)
+    runner.test("Tournament batch aggregates", test_tournament_batch_aggregates)
+    runner.test("Matchup matrix recomputes only changed rows", test_matchup_matrix_recomputes_only_changed_rows)
+    runner.test("Race store resimulates only changed races", test_race_store_resimulates_only_changed_races)
+    runner.test("Reaction hooks reach only overriding classes", test_reaction_hooks_reach_only_overriding_classes)
+    runner.test("Phase tables match live dispatch", test_phase_tables_match_live_dispatch)
+    runner.test("Reaction dispatch follows a mid-move steal", test_reaction_dispatch_follows_mid_move_steal)
+    runner.test("Active players and Null floor stay current", test_active_players_and_null_floor_stay_current)
+    runner.test("Event log renders twists", test_event_log_renders_twists)
+
     # Print summary
     success = runner.summary()
 
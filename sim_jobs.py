@@ -0,0 +1,162 @@
+# sim_jobs.py
+#
+# Background simulation jobs for the UIs. A SimulationJob runs
+# game_simulation.iter_simulations on a daemon thread and keeps the latest
+# merged results, so a page can poll it for a progress bar and a results
+# table that fills in as shards finish, and cancel it while keeping every
+# race already merged.
+#
+# The job object outlives a Streamlit rerun when kept in st.session_state,
+# so rerunning the page (or clicking Cancel) doesn't lose the work. The
+# Tkinter frontend instead passes an `events` queue and drains it from
+# root.after, since Tk widgets may only be touched from the main thread.
+#
+# With workers > 1 the races themselves run on a process pool, so the job
+# thread only merges tallies and the UI stays responsive; cancelling
+# terminates the pool's workers. ProcessTask does the same for a single
+# function call (a tournament) that has no partial results to report.
+
+import threading
+
+from game_simulation import SHARD_SIZE, iter_simulations
+
+
+class SimulationJob:
+    """One iter_simulations batch on a background thread.
+
+    `run_kwargs` are run_simulations keyword arguments (num_simulations
+    and num_players included). `on_finish(results)` runs on the job thread
+    once the whole batch is done (not when cancelled or failed). If given,
+    `events` (a queue.Queue) receives ('progress', races_done, total) as
+    results come in and a final ('finished', status).
+
+    status is 'pending', 'running', 'done', 'cancelled' or 'error'."""
+
+    def __init__(self, run_kwargs, report_every=SHARD_SIZE, on_finish=None, events=None):
+        self.run_kwargs = dict(run_kwargs)
+        self.total = self.run_kwargs["num_simulations"]
+        self.report_every = report_every
+        self.status = "pending"
+        self.results = None     # latest results tuple (partial until done)
+        self.races_done = 0
+        self.error = None
+        self._on_finish = on_finish
+        self._events = events
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.status = "running"
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Stop after the shard in progress; the races merged so far stay
+        in `results`."""
+        self._cancel.set()
+
+    @property
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def snapshot(self):
+        """(status, races_done, results), read consistently."""
+        with self._lock:
+            return self.status, self.races_done, self.results
+
+    @property
+    def progress(self):
+        """Fraction of num_simulations merged so far (a precision target
+        may finish the job below 1)."""
+        return self.races_done / self.total if self.total else 1.0
+
+    def _run(self):
+        stream = iter_simulations(report_every=self.report_every, **self.run_kwargs)
+        status = "done"
+        try:
+            for results in stream:
+                with self._lock:
+                    self.results = results
+                    self.races_done = results[-1]
+                if self._events is not None:
+                    self._events.put(("progress", self.races_done, self.total))
+                if self._cancel.is_set():
+                    status = "cancelled"
+                    break
+        except Exception as exc:
+            status = "error"
+            self.error = exc
+        finally:
+            stream.close()
+        # A cancel that lands on the final item still finished the batch.
+        if status == "cancelled" and self.races_done >= self.total:
+            status = "done"
+        if status == "done" and self._on_finish is not None:
+            try:
+                self._on_finish(self.results)
+            except Exception:
+                pass  # e.g. a full disk: the results themselves are fine
+        with self._lock:
+            self.status = status
+        if self._events is not None:
+            self._events.put(("finished", status))
+
+
+class ProcessTask:
+    """fn(*args, **kwargs) on a worker process of its own.
+
+    cancel() kills the worker outright. `events`, if given, receives one
+    ('finished', status) once the call returns, fails or is cancelled;
+    `result` / `error` then hold its outcome. fn and its arguments must be
+    picklable (module-level)."""
+
+    def __init__(self, fn, *args, events=None, **kwargs):
+        self._call = (fn, args, kwargs)
+        self._events = events
+        self.status = "pending"
+        self.result = None
+        self.error = None
+        self._pool = None
+        self._lock = threading.Lock()
+        self._settled = threading.Event()
+
+    def start(self):
+        import multiprocessing
+        fn, args, kwargs = self._call
+        self.status = "running"
+        self._pool = multiprocessing.Pool(1)
+        self._pool.apply_async(fn, args, kwargs, callback=self._on_result,
+                               error_callback=self._on_error)
+        self._pool.close()  # the worker exits once the call returns
+        return self
+
+    def cancel(self):
+        if self._settle("cancelled"):
+            self._pool.terminate()
+
+    def wait(self, timeout=None):
+        return self._settled.wait(timeout)
+
+    def _on_result(self, result):
+        self.result = result
+        self._settle("done")
+
+    def _on_error(self, error):
+        self._settle("error", error)
+
+    def _settle(self, status, error=None):
+        """Record the outcome once; False if the task already settled."""
+        with self._lock:
+            if self.status != "running":
+                return False
+            self.status = status
+            self.error = error
+        self._settled.set()
+        if self._events is not None:
+            self._events.put(("finished", status))
+        return True
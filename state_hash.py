@@ -0,0 +1,76 @@
+# state_hash.py
+#
+# Incrementally maintained Zobrist hash of the race state that loop
+# detection compares: every racer's position, finished, tripped and
+# skip_main_move. Game.check_for_state_loop used to rebuild four tuples
+# over game.players on every move and jump and search a list of them;
+# now it looks the current hash up in a table.
+#
+# Writes to those four attributes go through data descriptors on Character
+# (TrackedPosition in position_index.py, TrackedFlag here), which XOR the
+# old value's key out of the owning game's StateHash and the new one in.
+# Like TrackedPosition, TrackedFlag defines no __get__, so reads stay plain
+# instance-dict lookups.
+#
+# Keys come from a SplitMix64 mix of (player slot, field, value) rather than
+# a random table (the slot is the racer's index in game.players), so they
+# need no storage, cover any position value, and are the same in every
+# process and in a forked game.
+
+_MASK64 = (1 << 64) - 1
+
+# Field numbers mixed into the keys.
+POSITION = 1
+FINISHED = 2
+TRIPPED = 3
+SKIP_MAIN_MOVE = 4
+
+FLAG_FIELDS = {'finished': FINISHED, 'tripped': TRIPPED, 'skip_main_move': SKIP_MAIN_MOVE}
+
+
+def zobrist_key(slot, field, value):
+    """64-bit key for racer `slot` having `value` in `field`."""
+    z = (slot * 0x9E3779B97F4A7C15 + field * 0xD1B54A32D192ED03 + value * 0x8CB92BA72F3D8DD7) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class TrackedFlag:
+    """Data descriptor for a boolean racer attribute that is part of the
+    loop-detection state. A True flag contributes its key to the hash; a
+    False one contributes nothing."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.field = FLAG_FIELDS[name]
+
+    def __set__(self, racer, value):
+        state = racer.__dict__
+        old = state.get(self.name, False)
+        state[self.name] = value
+        tracker = racer._state_hash
+        if tracker is not None and bool(old) != bool(value):
+            tracker.value ^= zobrist_key(racer._index_slot, self.field, 1)
+
+
+class StateHash:
+    """Running Zobrist hash over a race's racers. `value` is kept current by
+    the Character descriptors once the racers are attached."""
+
+    def __init__(self, players):
+        self.players = players
+        for racer in players:
+            racer._state_hash = self
+        self.value = self.recompute()
+
+    def recompute(self):
+        """The hash of the racers' current state, computed from scratch."""
+        value = 0
+        for racer in self.players:
+            slot = racer._index_slot
+            value ^= zobrist_key(slot, POSITION, racer.position)
+            for name, field in FLAG_FIELDS.items():
+                if getattr(racer, name):
+                    value ^= zobrist_key(slot, field, 1)
+        return value
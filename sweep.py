@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Parameter sweeps over Game rule settings.
+
+A sweep is a list of cells, each a dict of Game keyword arguments (a grid
+over every combination, or a random design that samples each setting
+independently). Every cell is run like run_simulations — the same shards,
+the same master seed, so all cells race the same lineups and dice streams
+up to their rule differences — but the shards of every cell are scheduled
+together on one process pool, so workers stay warm across cells instead of
+a pool being started per run_simulations call.
+
+Results go to one tidy CSV with a row per (cell, character), with the
+board and other shared settings as columns alongside the swept ones. A
+cell's rows are written as soon as its last shard finishes; rerunning the
+same sweep with the same output file skips the cells already in it (a cell
+is identified by all of its Game settings and its lineup pool), so an
+interrupted sweep picks up where it stopped.
+
+Usage:
+  python sweep.py OUTPUT.csv --races 2000 --racers 5 [--workers 4] [--seed 0]
+                  --param speeddemon_threshold=3,4,5
+                  --param speeddemon_check_timing=start,end
+                  [--random 20]
+Values are comma-separated Python literals, or an integer range lo..hi.
+--random N samples N cells instead of taking the full grid.
+"""
+
+import argparse
+import ast
+import csv
+import hashlib
+import io
+import itertools
+import json
+import os
+import random
+from config import character_abilities, DEFAULT_BOARD_TYPE
+from game_simulation import SHARD_SIZE, _BatchTally, _run_shard, _run_shard_args
+
+# Columns after the cell's own parameter columns.
+RESULT_COLUMNS = [
+    'races', 'racers', 'seed', 'character', 'appearances', 'wins',
+    'win_rate', 'win_rate_se', 'avg_position', 'avg_position_se',
+    'avg_points', 'avg_points_se', 'avg_ability_activations', 'cell_avg_turns',
+]
+
+
+def grid_design(params):
+    """Every combination of `params` ({name: [values]}), as a list of cells."""
+    names = sorted(params)
+    return [dict(zip(names, values)) for values in itertools.product(*(params[name] for name in names))]
+
+
+def random_design(params, num_cells, seed=0):
+    """`num_cells` distinct cells, each setting drawn uniformly from its
+    values in `params` (fewer if the grid is smaller than that)."""
+    rng = random.Random(seed)
+    names = sorted(params)
+    # Repeated values would make the grid look bigger than it is (and the
+    # loop below never finish), so draw from the distinct values only.
+    params = {name: _distinct(params[name]) for name in names}
+    grid_size = 1
+    for name in names:
+        grid_size *= len(params[name])
+    cells = []
+    seen = set()
+    while len(cells) < min(num_cells, grid_size):
+        cell = {name: rng.choice(params[name]) for name in names}
+        key = cell_id(cell)
+        if key not in seen:
+            seen.add(key)
+            cells.append(cell)
+    return cells
+
+
+def _distinct(values):
+    """`values` without repeats, in first-seen order."""
+    seen = set()
+    distinct = []
+    for value in values:
+        key = json.dumps(value, sort_keys=True, default=repr)
+        if key not in seen:
+            seen.add(key)
+            distinct.append(value)
+    return distinct
+
+
+def cell_id(cell, num_simulations=None, num_players=None, seed=None, lineups=None):
+    """Stable short id for a cell (and the batch settings it ran with:
+    race count, racers, seed and `lineups`, the fixed lineup or pool the
+    races draw from)."""
+    text = json.dumps([cell, num_simulations, num_players, seed, lineups], sort_keys=True, default=repr)
+    return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+
+def _finished_cells(output_path):
+    """cell_ids already written to `output_path`, and its header."""
+    if not os.path.exists(output_path):
+        return set(), None
+    with open(output_path, newline='') as file:
+        reader = csv.DictReader(file)
+        return {row['cell_id'] for row in reader}, reader.fieldnames
+
+
+def _cell_rows(cell, tally, num_simulations, num_players, seed, cell_key):
+    """Tidy rows for one finished cell."""
+    errors = tally.standard_errors()
+    avg_turns = tally.turns.total / num_simulations if tally.turns.count else 0
+    rows = []
+    for char, appearances in tally.appearance_count.items():
+        if appearances <= 0:
+            continue
+        points = tally.chip_statistics[char]['points'] if char in tally.chip_statistics else None
+        rows.append({
+            'cell_id': cell_key,
+            **cell,
+            'races': num_simulations,
+            'racers': num_players,
+            'seed': seed,
+            'character': char,
+            'appearances': appearances,
+            'wins': tally.win_counts.get(char, 0),
+            'win_rate': tally.win_counts.get(char, 0) / appearances,
+            'win_rate_se': errors['win_rates'][char],
+            'avg_position': tally.finish_positions[char].mean,
+            'avg_position_se': errors['finish_positions'][char],
+            'avg_points': points.mean if points else None,
+            'avg_points_se': points.std_error if points else None,
+            'avg_ability_activations': tally.ability_activations[char].mean or 0,
+            'cell_avg_turns': avg_turns,
+        })
+    return rows
+
+
+def run_sweep(cells, num_simulations, num_players, output_path, workers=1, seed=0,
+              board_type=DEFAULT_BOARD_TYPE, fixed_characters=None, allowed_characters=None,
+              random_turn_order=True, progress=None, **shared_settings):
+    """Run every cell of a sweep and append its rows to `output_path`.
+
+    Args:
+        cells: Game keyword-argument dicts (grid_design / random_design).
+        shared_settings: Game keyword arguments applied to every cell.
+        seed: Master seed shared by every cell (see run_simulations); keep
+              it fixed to resume a sweep.
+        progress: Optional callable(done_cells, total_cells).
+
+    Returns the number of cells run (cells already in the file are skipped).
+    """
+    base_kwargs = dict(board_type=board_type, random_turn_order=random_turn_order, **shared_settings)
+    names = sorted({name for cell in cells for name in cell})
+    # Settings every cell shares get columns too, so rows from sweeps with
+    # different boards or shared settings can't be mistaken for each other.
+    settings = sorted(name for name in base_kwargs if name not in names)
+    fieldnames = ['cell_id', *names, *settings, *RESULT_COLUMNS]
+    done, existing_header = _finished_cells(output_path)
+    if existing_header is not None and existing_header != fieldnames:
+        raise ValueError(f"{output_path} has columns {existing_header}; this sweep writes {fieldnames}")
+
+    sampling_pool = allowed_characters if allowed_characters else list(character_abilities.keys())
+    lineups = {'fixed_characters': fixed_characters, 'sampling_pool': sampling_pool}
+    pending = []
+    for cell in cells:
+        # The resume key covers every Game setting the cell runs with, not
+        # just the swept ones.
+        key = cell_id({**base_kwargs, **cell}, num_simulations, num_players, seed, lineups)
+        if key not in done:
+            pending.append((key, cell))
+
+    shard_ranges = [(start, min(start + SHARD_SIZE, num_simulations)) for start in range(0, num_simulations, SHARD_SIZE)]
+
+    def shard_args(cell):
+        game_kwargs = {**base_kwargs, **cell}
+        return [(start, stop, seed, num_players, sampling_pool, fixed_characters, False, game_kwargs)
+                for start, stop in shard_ranges]
+
+    with open(output_path, 'a', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        if existing_header is None:
+            writer.writeheader()
+            file.flush()
+
+        def finish_cell(key, cell, shard_tallies):
+            tally = _BatchTally()
+            for shard_tally in shard_tallies:
+                tally.merge(shard_tally)
+            # One write per cell, so an interrupted sweep rarely leaves a
+            # cell half-written.
+            buffer = io.StringIO()
+            rows = _cell_rows(cell, tally, num_simulations, num_players, seed, key)
+            for row in rows:
+                row.update((name, base_kwargs[name]) for name in settings)
+            csv.DictWriter(buffer, fieldnames=fieldnames).writerows(rows)
+            file.write(buffer.getvalue())
+            file.flush()
+
+        completed = 0
+        if workers and workers > 1:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {}
+                results = {}
+                for index, (key, cell) in enumerate(pending):
+                    results[index] = [None] * len(shard_ranges)
+                    for shard, args in enumerate(shard_args(cell)):
+                        futures[pool.submit(_run_shard_args, args)] = (index, shard)
+                remaining = {index: len(shard_ranges) for index in results}
+                for future in as_completed(futures):
+                    index, shard = futures[future]
+                    results[index][shard] = future.result()
+                    remaining[index] -= 1
+                    if not remaining[index]:
+                        key, cell = pending[index]
+                        # Shards merge in shard order, as in run_simulations.
+                        finish_cell(key, cell, results.pop(index))
+                        completed += 1
+                        if progress:
+                            progress(completed, len(pending))
+        else:
+            for key, cell in pending:
+                finish_cell(key, cell, [_run_shard(*args) for args in shard_args(cell)])
+                completed += 1
+                if progress:
+                    progress(completed, len(pending))
+    return completed
+
+
+def _parse_values(text):
+    """'3,4,5' -> [3, 4, 5]; '3..6' -> [3, 4, 5, 6]; strings stay strings."""
+    if '..' in text:
+        low, high = text.split('..')
+        return list(range(int(low), int(high) + 1))
+    values = []
+    for part in text.split(','):
+        part = part.strip()
+        try:
+            values.append(ast.literal_eval(part))
+        except (ValueError, SyntaxError):
+            values.append(part)
+    return values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep Game rule settings and write a tidy per-character table.")
+    parser.add_argument('output', help="CSV to write (appended to / resumed if it exists)")
+    parser.add_argument('--races', type=int, default=1000, help="races per cell")
+    parser.add_argument('--racers', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--board', default=DEFAULT_BOARD_TYPE)
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUES',
+                        help="Game keyword argument and its values, e.g. showoff_threshold=3,4,5 or 3..7")
+    parser.add_argument('--random', type=int, metavar='N', help="sample N cells instead of the full grid")
+    args = parser.parse_args(argv)
+
+    params = {}
+    for item in args.param:
+        name, _, values = item.partition('=')
+        params[name.strip()] = _parse_values(values)
+    if not params:
+        parser.error("give at least one --param")
+    cells = random_design(params, args.random, seed=args.seed) if args.random else grid_design(params)
+
+    def report(done, total):
+        print(f"  {done}/{total} cells done", flush=True)
+
+    print(f"Sweeping {len(cells)} cells x {args.races} races -> {args.output}")
+    ran = run_sweep(cells, args.races, args.racers, args.output, workers=args.workers, seed=args.seed,
+                    board_type=args.board, progress=report)
+    print(f"Ran {ran} cells ({len(cells) - ran} already in {args.output}).")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,7 +1,12 @@
 # tournament.py
 import random
+from collections import Counter
 from config import character_abilities, DEFAULT_BOARD_TYPE
-from game_simulation import Game, Board
+from game_simulation import Game, Board, NullLog, _map_shards, _quiet_stdout, derive_race_seed
+from online_stats import RunningStat, proportion_std_error
+
+# Cups per batch shard (each cup is four races).
+CUP_SHARD_SIZE = 100
 
 class Player:
     """Represents a player in the tournament."""
@@ -45,8 +50,15 @@ class Player:
 
 
 class Tournament:
-    """Manages a full 4-race tournament."""
-    def __init__(self, player_names, allowed_characters=None):
+    """Manages a full 4-race tournament.
+
+    `rng` (a random.Random) drives the draft and seeds each race, so a cup
+    is reproducible from it; by default the global random module is used.
+    With log_play_by_play=False the races record no play-by-play.
+    """
+    def __init__(self, player_names, allowed_characters=None, rng=None, log_play_by_play=True):
+        self.rng = rng if rng is not None else random
+        self.log_play_by_play = log_play_by_play
         self.players = [Player(name) for name in player_names]
         self.racer_deck = list(allowed_characters) if allowed_characters else list(character_abilities.keys())
         self.races_completed = 0
@@ -58,7 +70,7 @@ class Tournament:
     def draft_racers(self):
         """Implement the snake draft for racers."""
         # Shuffle the racer deck
-        random.shuffle(self.racer_deck)
+        self.rng.shuffle(self.racer_deck)
         
         # Determine how many racers each player should draft (4 racers each)
         racers_per_player = 4
@@ -78,12 +90,15 @@ class Tournament:
             for player in players_in_order:
                 # In an automated simulation, just pick a random racer
                 if available_racers:
-                    pick = random.choice(available_racers)
+                    pick = self.rng.choice(available_racers)
                     available_racers.remove(pick)
                     player.add_racer(pick)
     
-    def setup_race(self, board_type=DEFAULT_BOARD_TYPE):
-        """Set up the next race in the tournament."""
+    def setup_race(self, board_type=DEFAULT_BOARD_TYPE, start_player=0):
+        """Set up the next race in the tournament.
+
+        `start_player` is the index in self.players of the player whose
+        racer moves first; the others follow in seat order from there."""
         self.current_race_players = []
         
         # Each player selects a racer
@@ -91,13 +106,18 @@ class Tournament:
             racer = player.select_racer()
             if racer:
                 self.current_race_players.append((player, racer))
+
+        # Rotate the turn order to begin with the start player
+        start = next((i for i, (player, _) in enumerate(self.current_race_players)
+                      if player is self.players[start_player]), 0)
+        self.current_race_players = self.current_race_players[start:] + self.current_race_players[:start]
         
         # Create the race with the selected racers and specified board type
         racer_names = [racer for _, racer in self.current_race_players]
-        self.current_race = Game(racer_names, board_type=board_type)
+        self.current_race = Game(racer_names, board_type=board_type, seed=self.rng.getrandbits(64))
         
         # Reset play-by-play for this race
-        self.play_by_play = []
+        self.play_by_play = [] if self.log_play_by_play else NullLog()
     
     def run_race(self):
         """Run the current race and distribute points."""
@@ -105,13 +125,14 @@ class Tournament:
             raise ValueError("No race has been set up yet.")
         
         # Create a new play-by-play list for this race
-        self.play_by_play = []
+        self.play_by_play = [] if self.log_play_by_play else NullLog()
         
         # Run the race and get results
         turns_taken, final_placements = self.current_race.run(self.play_by_play)
         
         # Get the chip statistics from the game
         chip_stats = self.current_race.get_chip_statistics()
+        racer_points = {}
         
         # Award points based on gold/silver/bronze chips
         for game_racer in self.current_race.players:
@@ -133,6 +154,7 @@ class Tournament:
                 
                 # Assign bronze chips (1 point each)
                 owner.points["bronze"] += game_racer.bronze_chips
+                racer_points[racer_piece] = (game_racer.gold_chips * 5) + (game_racer.silver_chips * 3) + game_racer.bronze_chips
                 
                 # Add a report of points earned to the play-by-play
                 if game_racer.gold_chips > 0 or game_racer.silver_chips > 0 or game_racer.bronze_chips > 0:
@@ -148,6 +170,10 @@ class Tournament:
             "play_by_play": self.play_by_play.copy(),
             "turns": turns_taken,
             "board_type": self.current_race.board.board_type,
+            # (player index, racer) in turn order (first = start player),
+            # and the points each racer earned its owner in this race
+            "turn_order": [(self.players.index(player), racer) for player, racer in self.current_race_players],
+            "racer_points": racer_points,
         })
         
         self.races_completed += 1
@@ -171,9 +197,9 @@ class Tournament:
         last_place_racer = racers_by_position[max_position]
         
         # Find which player used that racer
-        for i, (player, racer) in enumerate(self.current_race_players):
+        for player, racer in self.current_race_players:
             if racer == last_place_racer:
-                return i
+                return self.players.index(player)
         
         # If there's a tie, use the player with the fewest points
         min_points = float('inf')
@@ -187,14 +213,19 @@ class Tournament:
         
         return min_points_player
     
-    def run_tournament(self, board_type=DEFAULT_BOARD_TYPE):
-        """Run a full 4-race tournament."""
+    def run_tournament(self, board_type=DEFAULT_BOARD_TYPE, start_player_rule=False):
+        """Run a full 4-race tournament.
+
+        By default the first player starts every race; with
+        start_player_rule, races after the first are started by the player
+        determine_next_start_player picks (whoever came last)."""
         # Draft racers
         self.draft_racers()
         
         # Run 4 races
-        for _ in range(4):
-            self.setup_race(board_type=board_type)
+        for race_number in range(4):
+            start_player = self.determine_next_start_player() if start_player_rule and race_number else 0
+            self.setup_race(board_type=board_type, start_player=start_player)
             if self.current_race_players:  # Make sure we have racers
                 self.run_race()
         
@@ -203,6 +234,166 @@ class Tournament:
         return winner, self.players, self.race_results
 
 
+class _CupTally:
+    """Constant-size aggregate of many cups: per draft seat, per racer and
+    per turn-order position. Cups are folded in one at a time and dropped,
+    so a batch's memory doesn't grow with the number of cups."""
+
+    def __init__(self, num_players):
+        self.cups = 0
+        # Draft seat i is player i: first pick of the first draft round.
+        self.seat_wins = [RunningStat() for _ in range(num_players)]  # win share, ties split
+        self.seat_points = [RunningStat() for _ in range(num_players)]
+        self.seat_points_counts = [Counter() for _ in range(num_players)]
+        self.racer_points = {}      # racer -> RunningStat of points earned in its race
+        self.racer_owner_wins = {}  # racer -> RunningStat of its owner's win share
+        # Per turn-order position in a race (0 = the start player)
+        self.position_points = [RunningStat() for _ in range(num_players)]
+        self.position_race_wins = [RunningStat() for _ in range(num_players)]
+        self.starts_wins = {}  # races a player started -> RunningStat of win share
+
+    def record(self, tournament):
+        """Fold one finished Tournament into the tally."""
+        self.cups += 1
+        totals = [player.total_points() for player in tournament.players]
+        best = max(totals)
+        shares = [1 / totals.count(best) if total == best else 0 for total in totals]
+        for seat, player in enumerate(tournament.players):
+            self.seat_wins[seat].add(shares[seat])
+            self.seat_points[seat].add(totals[seat])
+            self.seat_points_counts[seat][totals[seat]] += 1
+            for racer in player.racers:
+                if racer not in self.racer_points:
+                    self.racer_points[racer] = RunningStat()
+                    self.racer_owner_wins[racer] = RunningStat()
+                self.racer_owner_wins[racer].add(shares[seat])
+
+        starts = [0] * len(totals)
+        for race in tournament.race_results:
+            winner = next(player.piece for place, player in race["placements"] if place == "1st")
+            starts[race["turn_order"][0][0]] += 1
+            for position, (_, racer) in enumerate(race["turn_order"]):
+                points = race["racer_points"].get(racer, 0)
+                self.racer_points[racer].add(points)
+                self.position_points[position].add(points)
+                self.position_race_wins[position].add(1 if racer == winner else 0)
+        for started, share in zip(starts, shares):
+            if started not in self.starts_wins:
+                self.starts_wins[started] = RunningStat()
+            self.starts_wins[started].add(share)
+
+    def merge(self, other):
+        self.cups += other.cups
+        for mine, theirs in ((self.seat_wins, other.seat_wins), (self.seat_points, other.seat_points),
+                             (self.position_points, other.position_points),
+                             (self.position_race_wins, other.position_race_wins)):
+            for stat, other_stat in zip(mine, theirs):
+                stat.merge(other_stat)
+        for counts, other_counts in zip(self.seat_points_counts, other.seat_points_counts):
+            counts.update(other_counts)
+        for mine, theirs in ((self.racer_points, other.racer_points),
+                             (self.racer_owner_wins, other.racer_owner_wins),
+                             (self.starts_wins, other.starts_wins)):
+            for key, stat in theirs.items():
+                mine.setdefault(key, RunningStat()).merge(stat)
+
+
+def _run_cup_shard(start, stop, master_seed, num_players, board_type, allowed_characters, start_player_rule):
+    """Play cups [start, stop) with logs off and return their _CupTally.
+    Cup i draws everything from derive_race_seed(master_seed, i), so a
+    batch's results don't depend on how cups are split into shards."""
+    with _quiet_stdout():
+        player_names = [f"Player {i + 1}" for i in range(num_players)]
+        tally = _CupTally(num_players)
+        for i in range(start, stop):
+            rng = random.Random(derive_race_seed(master_seed, i))
+            tournament = Tournament(player_names, allowed_characters=allowed_characters, rng=rng,
+                                    log_play_by_play=False)
+            tournament.run_tournament(board_type=board_type, start_player_rule=start_player_rule)
+            tally.record(tournament)
+        return tally
+
+
+def run_tournament_batch(num_tournaments, num_players, board_type=DEFAULT_BOARD_TYPE, allowed_characters=None,
+                         start_player_rule=False, workers=1, seed=None):
+    """Play `num_tournaments` cups of `num_players` players without logs,
+    on `workers` processes, and aggregate them.
+
+    Each cup is reproducible from `seed` (a random one if None) and its
+    index, and shards merge in order, so a seeded batch gives the same
+    results for any worker count. Memory stays bounded: cups are tallied
+    as they finish, never kept.
+
+    Returns:
+        {'cups': n, 'seed': seed,
+         'seats': [per draft seat (player index; seat 1 picks first):
+             {'seat', 'win_rate', 'win_rate_se', 'avg_points', 'points_se',
+              'points_std', 'points_min', 'points_max',
+              'points_distribution': {points: fraction of cups}}],
+         'racers': {racer: {'drafted', 'avg_race_points', 'race_points_se',
+                            'owner_win_rate', 'owner_win_rate_se'}},
+         'turn_positions': [per position in a race's turn order (1 = start
+             player): {'position', 'races', 'race_win_rate', 'race_win_rate_se',
+                       'avg_race_points', 'race_points_se'}],
+         'races_started': {races a player started: {'players', 'win_rate',
+                                                    'win_rate_se'}}}
+        win_rate is the share of cups won, with ties split between the
+        tied players.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    shard_args = [
+        (start, min(start + CUP_SHARD_SIZE, num_tournaments), seed, num_players, board_type,
+         allowed_characters, start_player_rule)
+        for start in range(0, num_tournaments, CUP_SHARD_SIZE)
+    ]
+    tally = _CupTally(num_players)
+    for _, shard_tally in _map_shards(_run_cup_shard, shard_args, workers):
+        tally.merge(shard_tally)
+
+    def share(stat):
+        return {'win_rate': stat.mean, 'win_rate_se': stat.std_error}
+
+    seats = []
+    for seat, (wins, points, counts) in enumerate(zip(tally.seat_wins, tally.seat_points, tally.seat_points_counts)):
+        seats.append({
+            'seat': seat + 1,
+            **share(wins),
+            'avg_points': points.mean,
+            'points_se': points.std_error,
+            'points_std': points.std,
+            'points_min': points.min,
+            'points_max': points.max,
+            'points_distribution': {value: count / tally.cups for value, count in sorted(counts.items())},
+        })
+    racers = {}
+    for racer, points in tally.racer_points.items():
+        owner_wins = tally.racer_owner_wins[racer]
+        racers[racer] = {
+            'drafted': owner_wins.count,
+            'avg_race_points': points.mean,
+            'race_points_se': points.std_error,
+            'owner_win_rate': owner_wins.mean,
+            'owner_win_rate_se': owner_wins.std_error,
+        }
+    turn_positions = []
+    for position, (race_wins, points) in enumerate(zip(tally.position_race_wins, tally.position_points)):
+        if not race_wins.count:
+            continue
+        turn_positions.append({
+            'position': position + 1,
+            'races': race_wins.count,
+            'race_win_rate': race_wins.mean,
+            'race_win_rate_se': proportion_std_error(race_wins.total, race_wins.count),
+            'avg_race_points': points.mean,
+            'race_points_se': points.std_error,
+        })
+    races_started = {started: {'players': stat.count, **share(stat)}
+                     for started, stat in sorted(tally.starts_wins.items())}
+    return {'cups': tally.cups, 'seed': seed, 'seats': seats, 'racers': racers,
+            'turn_positions': turn_positions, 'races_started': races_started}
+
+
 def run_tournament_simulation(player_names, board_type=DEFAULT_BOARD_TYPE, allowed_characters=None):
     """Run a simulation of a tournament with the given player names."""
     # Redirect print output to capture debug statements
@@ -250,7 +441,48 @@ def run_tournament_simulation(player_names, board_type=DEFAULT_BOARD_TYPE, allow
         sys.stdout = original_stdout
 
 
-if __name__ == "__main__":
+def _print_batch(results, label):
+    print(f"{label}: {results['cups']} cups, seed {results['seed']}")
+    print(f"  {'Seat':<6} {'win %':>12} {'avg points':>14} {'min':>5} {'max':>5}")
+    for seat in results['seats']:
+        print(f"  {seat['seat']:<6} {seat['win_rate'] * 100:>6.2f}±{seat['win_rate_se'] * 100:<5.2f}"
+              f"{seat['avg_points']:>8.2f}±{seat['points_se']:<5.2f}{seat['points_min']:>5} {seat['points_max']:>5}")
+    print(f"  {'Turn':<6} {'race win %':>12} {'race points':>14}")
+    for position in results['turn_positions']:
+        print(f"  {position['position']:<6} {position['race_win_rate'] * 100:>6.2f}±{position['race_win_rate_se'] * 100:<5.2f}"
+              f"{position['avg_race_points']:>8.2f}±{position['race_points_se']:<5.2f}")
+    print(f"  {'Starts':<6} {'cup win %':>12} {'players':>9}")
+    for started, summary in results['races_started'].items():
+        print(f"  {started:<6} {summary['win_rate'] * 100:>6.2f}±{summary['win_rate_se'] * 100:<5.2f}{summary['players']:>9}")
+    print()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Run one tournament, or aggregate a batch of them (--cups).")
+    parser.add_argument('--cups', type=int, help="play this many tournaments without logs and print aggregates")
+    parser.add_argument('--players', type=int, default=4)
+    parser.add_argument('--board', default=DEFAULT_BOARD_TYPE)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--start-rule', choices=['first', 'last-place', 'both'], default='both',
+                        help="who starts races 2-4: always player 1, the last-place finisher, or compare both")
+    args = parser.parse_args(argv)
+
+    if args.cups:
+        rules = {'first': [False], 'last-place': [True], 'both': [False, True]}[args.start_rule]
+        for rule in rules:
+            results = run_tournament_batch(args.cups, args.players, board_type=args.board,
+                                           start_player_rule=rule, workers=args.workers, seed=args.seed)
+            _print_batch(results, "Last-place player starts" if rule else "Player 1 starts every race")
+        if len(rules) == 1:
+            racers = sorted(results['racers'].items(), key=lambda item: -item[1]['owner_win_rate'])
+            print(f"  {'Racer':<16} {'drafted':>8} {'race points':>12} {'owner win %':>12}")
+            for racer, summary in racers:
+                print(f"  {racer:<16} {summary['drafted']:>8} {summary['avg_race_points']:>12.2f} "
+                      f"{summary['owner_win_rate'] * 100:>12.2f}")
+        return 0
+
     # Example usage
     player_names = ["Player 1", "Player 2", "Player 3", "Player 4"]
     results = run_tournament_simulation(player_names)
@@ -265,4 +497,9 @@ if __name__ == "__main__":
     for i, race in enumerate(results["race_results"]):
         print(f"\nRace {i+1}:")
         for place, player in race["placements"]:
-            print(f"{place}: {player.name} ({player.piece})")
\ No newline at end of file
+            print(f"{place}: {player.name} ({player.piece})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
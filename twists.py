@@ -9,8 +9,26 @@
 # that does the immediate effect AND seeds any persistent state (stored on
 # game.twist_state). Persistent hooks live in game_simulation.py / base_character.py
 # and consult game.twist_state to apply ongoing effects.
+#
+# The draw, per-racer warps and locked rolls are recorded as events when the
+# race is run with an EventLog (see events.py); the descriptive lines around
+# them stay free text.
+
+from events import EventKind
+
+
+def _narrate(game, lines, kind, template, *args, actor=None, src=0, dst=0, value=0):
+    """Record a twist event, or append template.format(*args) to a plain
+    list. The text is only formatted when it is kept."""
+    if game.event_log is not None:
+        game.event_log.record(game._current_turn, kind, actor.player_number if actor else 0, src, dst, value)
+    elif game.log_enabled:
+        lines.append(template.format(*args))
 
-import random
+
+def _intern(game, text):
+    """String-table index of `text` in the race's EventLog (0 without one)."""
+    return game.event_log.intern(text) if game.event_log is not None else 0
 
 
 # ---------------------------------------------------------------------------
@@ -44,8 +62,9 @@ def draw_and_apply_twist(game, triggerer, play_by_play_lines, exclude=None):
     pool = [t for t in get_twist_pool() if exclude is None or t not in exclude]
     if not pool:
         return None
-    name = random.choice(pool)
-    play_by_play_lines.append(f"!! TWIST DRAWN: {name} !!")
+    name = game.rng.choice(pool)
+    _narrate(game, play_by_play_lines, EventKind.TWIST, "!! TWIST DRAWN: {} !!", name,
+             value=_intern(game, name))
     APPLY_FUNCS[name](game, triggerer, play_by_play_lines)
     game.twists_drawn.append(name)
     return name
@@ -60,7 +79,8 @@ def apply_named_twist(game, triggerer, play_by_play_lines, name):
             f"!! TWIST '{name}' unknown — falling back to random draw."
         )
         return draw_and_apply_twist(game, triggerer, play_by_play_lines)
-    play_by_play_lines.append(f"!! TWIST (forced): {name} !!")
+    _narrate(game, play_by_play_lines, EventKind.TWIST, "!! TWIST (forced): {} !!", name,
+             src=1, value=_intern(game, name))
     APPLY_FUNCS[name](game, triggerer, play_by_play_lines)
     game.twists_drawn.append(name)
     return name
@@ -86,16 +106,13 @@ def apply_time_imp(game, triggerer, lines):
 def apply_roast_chicken(game, _triggerer, lines):
     """The last-place racer moves 7. One-shot — the bonus only applies on
     twist trigger, not for the rest of the race."""
-    candidates = [
-        p for p in game.players
-        if not p.finished and p not in game.eliminated_players
-    ]
+    candidates = game.active_players
     if not candidates:
         lines.append("  Roast Chicken: no eligible racers — fizzles.")
         return
     min_pos = min(p.position for p in candidates)
     last_pool = [p for p in candidates if p.position == min_pos]
-    last = random.choice(last_pool)
+    last = game.rng.choice(last_pool)
     lines.append(
         f"  Roast Chicken: {last.name} ({last.piece}) (last place) moves 7."
     )
@@ -121,10 +138,7 @@ def apply_mirror_world(game, _triggerer, lines):
     up at 18 instead of staying at 12 with rolls negated), but the relative
     race outcome is equivalent.
     """
-    active = [
-        p for p in game.players
-        if not p.finished and p not in game.eliminated_players
-    ]
+    active = game.active_players
     if not active:
         lines.append("  Mirror World: no active racers — fizzles.")
         return
@@ -136,9 +150,8 @@ def apply_mirror_world(game, _triggerer, lines):
         old = p.position
         p.position = max(0, min(game.board.length - p.position, game.board.length))
         p.previous_position = p.position
-        lines.append(
-            f"    {p.name} ({p.piece}): {old} -> {p.position}"
-        )
+        _narrate(game, lines, EventKind.TWIST_WARP, "    {} ({}): {} -> {}", p.name, p.piece, old, p.position,
+                 actor=p, src=old, dst=p.position)
 
     # Edge case: any racer who was on the Start space (position 0) at the
     # time of the flip now lands exactly on the finish line (position N
@@ -148,7 +161,7 @@ def apply_mirror_world(game, _triggerer, lines):
     # "finished" with no chip. finish_player handles the chip awarding.
     for player_idx in game.turn_order:
         p = game.players[player_idx]
-        if p.finished or p in game.eliminated_players:
+        if p.finished or p.eliminated:
             continue
         if p.position >= game.board.length:
             lines.append(
@@ -166,10 +179,7 @@ def apply_conveyor_belt(game, _triggerer, lines):
     """Warp every active racer to space 1, then +3 to main move for the
     rest of the race. The +3 is applied in the ROLL_MODIFICATION-equivalent
     hook in base_character.take_turn."""
-    active = [
-        p for p in game.players
-        if not p.finished and p not in game.eliminated_players
-    ]
+    active = game.active_players
     if not active:
         lines.append("  Conveyor Belt: no active racers — fizzles.")
         return
@@ -181,9 +191,8 @@ def apply_conveyor_belt(game, _triggerer, lines):
         old = p.position
         p.jump(game, 1, lines)
         if p.position != old:
-            lines.append(
-                f"    {p.name} ({p.piece}): {old} -> {p.position}"
-            )
+            _narrate(game, lines, EventKind.TWIST_WARP, "    {} ({}): {} -> {}", p.name, p.piece, old, p.position,
+                     actor=p, src=old, dst=p.position)
     game.twist_state["conveyor_bonus"] = 3
 
 
@@ -201,7 +210,7 @@ def apply_bonkbug(game, _triggerer, lines):
     )
     for idx in affected:
         if 0 <= idx < end:
-            game.board.spaces[idx] = Space("move", value=-5)
+            game.board.set_space(idx, Space("move", value=-5))
     game.twist_state["bonkbug_active"] = True
 
 
@@ -219,7 +228,7 @@ def apply_pinata(game, _triggerer, lines):
     for idx in range(FIRST_CORNER_POSITION + 1, game.board.length):
         space = game.board.spaces[idx]
         if space.space_type == "normal":
-            game.board.spaces[idx] = Space("bronze_chip", consumable=True)
+            game.board.set_space(idx, Space("bronze_chip", consumable=True))
             placed.append(idx)
     lines.append(
         f"  Pinata leak: bronze chip placed on {len(placed)} empty space(s) "
@@ -254,19 +263,17 @@ def apply_randomness_ceased(game, _triggerer, lines):
     """Every active racer rolls one die NOW and that value is locked in for
     every future roll they make for the rest of the race. Implemented via
     a per-player override checked in Game.roll_die."""
-    active = [
-        p for p in game.players
-        if not p.finished and p not in game.eliminated_players
-    ]
+    active = game.active_players
     if not active:
         lines.append("  Randomness Ceased: no active racers — fizzles.")
         return
     lines.append("  Randomness has randomly ceased! Each racer rolls once for keeps:")
     fixed = {}
     for p in active:
-        roll = random.randint(1, 6)  # bare random — bypasses Stunner override at trigger time
+        roll = game.rng.randint(1, 6)  # game.rng, not roll_die — bypasses Stunner override at trigger time
         fixed[id(p)] = roll
-        lines.append(f"    {p.name} ({p.piece}): locked at {roll}")
+        _narrate(game, lines, EventKind.TWIST_ROLL, "    {} ({}): locked at {}", p.name, p.piece, roll,
+                 actor=p, value=roll)
     game.twist_state["fixed_rolls"] = fixed
 
 
@@ -306,10 +313,7 @@ def apply_season_finale(game, _triggerer, lines):
     but it captures the spirit (eliminate the pack, two racers sprint to
     the finish, winner takes both placement chips)."""
     from config import CORNER_POSITION
-    active = [
-        p for p in game.players
-        if not p.finished and p not in game.eliminated_players
-    ]
+    active = list(game.active_players)
     if len(active) < 2:
         lines.append("  Season Finale: fewer than 2 active racers — fizzles.")
         return
@@ -327,7 +331,8 @@ def apply_season_finale(game, _triggerer, lines):
         old = f.position
         f.position = CORNER_POSITION
         f.previous_position = CORNER_POSITION
-        lines.append(f"    {f.name} ({f.piece}): warped from {old} to {CORNER_POSITION}.")
+        _narrate(game, lines, EventKind.TWIST_WARP, "    {} ({}): warped from {} to {}.", f.name, f.piece, old,
+                 CORNER_POSITION, actor=f, src=old, dst=CORNER_POSITION, value=1)
     for e in eliminated:
         lines.append(
             f"    {e.name} ({e.piece}): not a finalist — eliminated from the race."